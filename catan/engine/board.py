@@ -10,18 +10,25 @@ from __future__ import annotations
 
 import math
 import random
+import sys
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+# ``slots=True`` n'existe qu'à partir de Python 3.10 (cf. catan.engine.state) :
+# les enregistrements du plateau perdent leur __dict__ quand c'est possible.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CubeCoord:
     x: int
     y: int
     z: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Tile:
     tile_id: int
     resource: str
@@ -32,7 +39,7 @@ class Tile:
     has_robber: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Vertex:
     vertex_id: int
     position: Tuple[float, float]
@@ -40,14 +47,14 @@ class Vertex:
     edges: Tuple[int, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Edge:
     edge_id: int
     vertices: Tuple[int, int]
     tiles: Tuple[int, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Port:
     port_id: int
     kind: str
@@ -55,6 +62,25 @@ class Port:
     vertices: Tuple[int, int]
 
 
+@dataclass(frozen=True)
+class _Geometry:
+    """Géométrie commune à tous les plateaux (indépendante des ressources)."""
+
+    # Identifiants des sommets/arêtes de chaque tuile, dans l'ordre des coins
+    tile_vertex_ids: Dict[int, Tuple[int, ...]]
+    tile_edge_ids: Dict[int, Tuple[int, ...]]
+    vertices: Dict[int, Vertex]
+    edges: Dict[int, Edge]
+    # (edge_id, sommets) de chaque emplacement de port, dans l'ordre de _PORT_COORDS
+    port_slots: Tuple[Tuple[int, Tuple[int, int]], ...]
+    # Une seule instance de CubeCoord par tuile, partagée par tous les plateaux
+    tile_cubes: Dict[int, CubeCoord]
+    # Tables dérivées des sommets/arêtes, partagées par les plateaux standard
+    edge_endpoints: np.ndarray
+    vertex_neighbors: Dict[int, Tuple[int, ...]]
+    edge_neighbors: Dict[int, Tuple[int, ...]]
+
+
 class Board:
     """Représentation immuable du plateau standard."""
 
@@ -121,6 +147,8 @@ class Board:
         (math.cos(math.radians(30 + 60 * k)), math.sin(math.radians(30 + 60 * k)))
         for k in range(6)
     )
+    _GEOMETRY: Optional[_Geometry] = None
+    _STANDARD_TEMPLATE: Optional[Tuple[Dict[int, Tile], Tuple[Port, ...]]] = None
 
     def __init__(
         self,
@@ -133,6 +161,91 @@ class Board:
         self.vertices: Dict[int, Vertex] = vertices
         self.edges: Dict[int, Edge] = edges
         self.ports: Tuple[Port, ...] = tuple(sorted(ports, key=lambda p: p.port_id))
+        # Extrémités des arêtes en tableau contigu (E, 2) indexé par edge_id,
+        # utilisé pour les parcours du graphe de routes.
+        self.edge_endpoints: np.ndarray
+        # Voisins de chaque sommet (règle de distance) et de chaque arête
+        # (connexité des routes), calculés au premier besoin
+        self._vertex_neighbors: Optional[Dict[int, Tuple[int, ...]]]
+        self._edge_neighbors: Optional[Dict[int, Tuple[int, ...]]]
+        geometry = self._geometry()
+        if edges == geometry.edges and vertices == geometry.vertices:
+            # Géométrie standard (tous les plateaux actuels) : tables partagées
+            self.edge_endpoints = geometry.edge_endpoints
+            self._vertex_neighbors = geometry.vertex_neighbors
+            self._edge_neighbors = geometry.edge_neighbors
+        else:
+            self.edge_endpoints = self._build_edge_endpoints(edges)
+            self._vertex_neighbors = None
+            self._edge_neighbors = None
+        # Tuiles productrices par numéro de dé, calculées au premier lancer
+        self._tiles_by_pip: Optional[Dict[int, Tuple[int, ...]]] = None
+        # Index inverse sommet -> type de port, pour les taux de commerce
+        self.port_kind_by_vertex: Dict[int, str] = {
+            vertex_id: port.kind for port in self.ports for vertex_id in port.vertices
+        }
+
+    @staticmethod
+    def _build_edge_endpoints(edges: Dict[int, Edge]) -> np.ndarray:
+        size = max(edges) + 1 if edges else 0
+        endpoints = np.full((size, 2), -1, dtype=np.int16)
+        for edge_id, edge in edges.items():
+            endpoints[edge_id] = edge.vertices
+        endpoints.setflags(write=False)
+        return endpoints
+
+    @staticmethod
+    def _build_vertex_neighbors(
+        vertices: Dict[int, Vertex], edges: Dict[int, Edge]
+    ) -> Dict[int, Tuple[int, ...]]:
+        return {
+            vid: tuple(
+                b if a == vid else a
+                for a, b in (edges[edge_id].vertices for edge_id in vertex.edges)
+            )
+            for vid, vertex in vertices.items()
+        }
+
+    @staticmethod
+    def _build_edge_neighbors(
+        vertices: Dict[int, Vertex], edges: Dict[int, Edge]
+    ) -> Dict[int, Tuple[int, ...]]:
+        return {
+            edge_id: tuple(
+                other_id
+                for vertex_id in edge.vertices
+                for other_id in vertices[vertex_id].edges
+                if other_id != edge_id
+            )
+            for edge_id, edge in edges.items()
+        }
+
+    def vertex_neighbors(self, vertex_id: int) -> Tuple[int, ...]:
+        """Sommets reliés à `vertex_id` par une arête, dans l'ordre de `Vertex.edges`."""
+        table = self._vertex_neighbors
+        if table is None:
+            table = self._build_vertex_neighbors(self.vertices, self.edges)
+            self._vertex_neighbors = table
+        return table[vertex_id]
+
+    def edge_neighbors(self, edge_id: int) -> Tuple[int, ...]:
+        """Arêtes partageant une extrémité avec `edge_id` (au plus quatre)."""
+        table = self._edge_neighbors
+        if table is None:
+            table = self._build_edge_neighbors(self.vertices, self.edges)
+            self._edge_neighbors = table
+        return table[edge_id]
+
+    def tiles_for_pip(self, pip: int) -> Tuple[int, ...]:
+        """Tuiles productrices (hors désert) portant le numéro `pip`, voleur compris."""
+        table = self._tiles_by_pip
+        if table is None:
+            table = {}
+            for tile_id, tile in self.tiles.items():
+                if tile.pip is not None and tile.resource != "DESERT":
+                    table[tile.pip] = table.get(tile.pip, ()) + (tile_id,)
+            self._tiles_by_pip = table
+        return table.get(pip, ())
 
     # -- API comptage --
     def tile_count(self) -> int:
@@ -146,7 +259,18 @@ class Board:
 
     # -- Construction du plateau --
     @classmethod
-    def standard(cls) -> "Board":
+    def _geometry(cls) -> _Geometry:
+        """Géométrie pointy-top (sommets, arêtes, indexation), calculée une seule fois.
+
+        Elle ne dépend que des positions des tuiles, identiques pour le plateau
+        standard et les plateaux aléatoires.
+        """
+        if Board._GEOMETRY is None:
+            Board._GEOMETRY = cls._build_geometry()
+        return Board._GEOMETRY
+
+    @classmethod
+    def _build_geometry(cls) -> _Geometry:
         tile_vertex_coords: Dict[int, Tuple[Tuple[float, float], ...]] = {}
         tile_edge_coords: Dict[int, Tuple[Tuple[Tuple[float, float], Tuple[float, float]], ...]] = {}
         vertex_tiles: Dict[Tuple[float, float], set[int]] = {}
@@ -229,42 +353,79 @@ class Board:
                 tiles=tiles,
             )
 
+        # Emplacements des ports (positions fixes, seul le type varie)
+        port_slots: List[Tuple[int, Tuple[int, int]]] = []
+        for _, (coord_a, coord_b) in cls._PORT_COORDS:
+            a = tuple(coord_a)
+            b = tuple(coord_b)
+            vertex_pair = tuple(
+                sorted((vertex_coord_to_id[a], vertex_coord_to_id[b]))
+            )
+            edge_coord = tuple(sorted((a, b)))
+            port_slots.append((edge_coord_to_id[edge_coord], vertex_pair))
+
+        return _Geometry(
+            tile_vertex_ids={
+                tile_id: tuple(vertex_coord_to_id[c] for c in coords)
+                for tile_id, coords in tile_vertex_coords.items()
+            },
+            tile_edge_ids={
+                tile_id: tuple(edge_coord_to_id[e] for e in coords)
+                for tile_id, coords in tile_edge_coords.items()
+            },
+            vertices=vertices,
+            edges=edges,
+            port_slots=tuple(port_slots),
+            tile_cubes={tile_id: CubeCoord(*cube) for tile_id, _, cube in cls._TILE_LAYOUT},
+            edge_endpoints=cls._build_edge_endpoints(edges),
+            vertex_neighbors=cls._build_vertex_neighbors(vertices, edges),
+            edge_neighbors=cls._build_edge_neighbors(vertices, edges),
+        )
+
+    @classmethod
+    def _ports_for_kinds(cls, kinds: Iterable[str]) -> Tuple[Port, ...]:
+        """Construit les ports aux emplacements standard pour les types fournis."""
+        return tuple(
+            Port(port_id=port_id, kind=kind, edge_id=edge_id, vertices=vertex_pair)
+            for port_id, (kind, (edge_id, vertex_pair)) in enumerate(
+                zip(kinds, cls._geometry().port_slots)
+            )
+        )
+
+    @classmethod
+    def standard(cls) -> "Board":
+        if Board._STANDARD_TEMPLATE is None:
+            Board._STANDARD_TEMPLATE = cls._build_standard_template()
+        tiles, ports = Board._STANDARD_TEMPLATE
+        geometry = cls._geometry()
+        return cls(
+            tiles=dict(tiles),
+            vertices=dict(geometry.vertices),
+            edges=dict(geometry.edges),
+            ports=ports,
+        )
+
+    @classmethod
+    def _build_standard_template(cls) -> Tuple[Dict[int, Tile], Tuple[Port, ...]]:
+        """Tuiles et ports du plateau standard (objets figés, partagés entre plateaux)."""
+        geometry = cls._geometry()
+
         tiles: Dict[int, Tile] = {}
-        for tile_id, resource, cube in cls._TILE_LAYOUT:
-            cube_coord = CubeCoord(*cube)
-            vertex_ids = tuple(vertex_coord_to_id[c] for c in tile_vertex_coords[tile_id])
-            edge_ids = tuple(edge_coord_to_id[e] for e in tile_edge_coords[tile_id])
+        tile_cubes = geometry.tile_cubes
+        for tile_id, resource, _ in cls._TILE_LAYOUT:
             tile = Tile(
                 tile_id=tile_id,
                 resource=resource,
                 pip=cls._PIP_NUMBERS.get(tile_id),
-                cube=cube_coord,
-                vertices=vertex_ids,
-                edges=edge_ids,
+                cube=tile_cubes[tile_id],
+                vertices=geometry.tile_vertex_ids[tile_id],
+                edges=geometry.tile_edge_ids[tile_id],
                 has_robber=(tile_id == 0),
             )
             tiles[tile_id] = tile
 
-        # Ports
-        ports: List[Port] = []
-        for port_id, (kind, (coord_a, coord_b)) in enumerate(cls._PORT_COORDS):
-            a = tuple(coord_a)
-            b = tuple(coord_b)
-            vertex_pair = tuple(
-                sorted((vertex_coord_to_id[a], vertex_coord_to_id[b]))
-            )
-            edge_coord = tuple(sorted((a, b)))
-            edge_id = edge_coord_to_id[edge_coord]
-            ports.append(
-                Port(
-                    port_id=port_id,
-                    kind=kind,
-                    edge_id=edge_id,
-                    vertices=vertex_pair,
-                )
-            )
-
-        return cls(tiles=tiles, vertices=vertices, edges=edges, ports=ports)
+        ports = cls._ports_for_kinds(kind for kind, _ in cls._PORT_COORDS)
+        return tiles, ports
 
     @classmethod
     def random(cls, seed: int | None = None) -> "Board":
@@ -318,125 +479,28 @@ class Board:
         port_kinds = [kind for kind, _ in cls._PORT_COORDS]
         rng.shuffle(port_kinds)
 
-        # Reconstruire le plateau avec la géométrie standard mais les ressources/pips/ports mélangés
-        # Utiliser la même logique que standard() mais avec les données mélangées
-        tile_vertex_coords: Dict[int, Tuple[Tuple[float, float], ...]] = {}
-        tile_edge_coords: Dict[int, Tuple[Tuple[Tuple[float, float], Tuple[float, float]], ...]] = {}
-        vertex_tiles: Dict[Tuple[float, float], set[int]] = {}
-        edge_tiles: Dict[Tuple[Tuple[float, float], Tuple[float, float]], set[int]] = {}
-
-        def cube_to_axial(cube: Tuple[int, int, int]) -> Tuple[int, int]:
-            x, y, z = cube
-            return x, z
-
-        def axial_to_pixel(q: int, r: int) -> Tuple[float, float]:
-            x = cls._SQRT3 * (q + r / 2)
-            y = 1.5 * r
-            return x, y
-
-        def round_coord(value: float) -> float:
-            return round(value, cls._ROUND_PRECISION)
-
-        # Pré-calcul sommets/arêtes pour chaque tuile (même géométrie)
-        for tile_id, resource, cube in randomized_layout:
-            q, r = cube_to_axial(cube)
-            cx, cy = axial_to_pixel(q, r)
-            vertices: List[Tuple[float, float]] = []
-
-            for dx, dy in cls._VERTEX_OFFSETS:
-                coord = (round_coord(cx + dx), round_coord(cy + dy))
-                vertices.append(coord)
-                vertex_tiles.setdefault(coord, set()).add(tile_id)
-
-            tile_vertex_coords[tile_id] = tuple(vertices)
-
-            edges_for_tile: List[Tuple[Tuple[float, float], Tuple[float, float]]] = []
-            for idx in range(6):
-                a = vertices[idx]
-                b = vertices[(idx + 1) % 6]
-                edge = tuple(sorted((a, b)))
-                edges_for_tile.append(edge)
-                edge_tiles.setdefault(edge, set()).add(tile_id)
-            tile_edge_coords[tile_id] = tuple(edges_for_tile)
-
-        # Indexation déterministe (identique à standard())
-        sorted_vertex_coords = sorted(vertex_tiles.keys())
-        vertex_coord_to_id = {
-            coord: idx for idx, coord in enumerate(sorted_vertex_coords)
-        }
-
-        sorted_edge_coords = sorted(edge_tiles.keys())
-        edge_coord_to_id = {coord: idx for idx, coord in enumerate(sorted_edge_coords)}
-
-        # Construire les sommets/arêtes
-        vertex_edges_map: Dict[Tuple[float, float], List[int]] = {
-            coord: [] for coord in sorted_vertex_coords
-        }
-        for edge_coord, edge_id in edge_coord_to_id.items():
-            a, b = edge_coord
-            vertex_edges_map[a].append(edge_id)
-            vertex_edges_map[b].append(edge_id)
-
-        vertices: Dict[int, Vertex] = {}
-        for coord, vid in vertex_coord_to_id.items():
-            x, y = coord
-            tiles = tuple(sorted(vertex_tiles[coord]))
-            edges = tuple(sorted(vertex_edges_map[coord]))
-            vertices[vid] = Vertex(
-                vertex_id=vid,
-                position=(x, y),
-                adjacent_tiles=tiles,
-                edges=edges,
-            )
-
-        edges: Dict[int, Edge] = {}
-        for coord_pair, edge_id in edge_coord_to_id.items():
-            a, b = coord_pair
-            vertex_pair = tuple(
-                sorted((vertex_coord_to_id[a], vertex_coord_to_id[b]))
-            )
-            tiles = tuple(sorted(edge_tiles[coord_pair]))
-            edges[edge_id] = Edge(
-                edge_id=edge_id,
-                vertices=vertex_pair,
-                tiles=tiles,
-            )
+        # Géométrie standard partagée, seuls ressources/pips/ports sont mélangés
+        geometry = cls._geometry()
+        vertices = dict(geometry.vertices)
+        edges = dict(geometry.edges)
 
         # Construire les tuiles avec ressources et pips mélangés
         tiles: Dict[int, Tile] = {}
-        for tile_id, resource, cube in randomized_layout:
-            cube_coord = CubeCoord(*cube)
-            vertex_ids = tuple(vertex_coord_to_id[c] for c in tile_vertex_coords[tile_id])
-            edge_ids = tuple(edge_coord_to_id[e] for e in tile_edge_coords[tile_id])
+        tile_cubes = geometry.tile_cubes
+        for tile_id, resource, _ in randomized_layout:
             tile = Tile(
                 tile_id=tile_id,
                 resource=resource,
                 pip=randomized_pips.get(tile_id),
-                cube=cube_coord,
-                vertices=vertex_ids,
-                edges=edge_ids,
+                cube=tile_cubes[tile_id],
+                vertices=geometry.tile_vertex_ids[tile_id],
+                edges=geometry.tile_edge_ids[tile_id],
                 has_robber=(tile_id == 0),  # Le voleur reste sur le désert (tile_id 0)
             )
             tiles[tile_id] = tile
 
         # Ports avec types mélangés mais positions fixes
-        ports: List[Port] = []
-        for port_id, (_, (coord_a, coord_b)) in enumerate(cls._PORT_COORDS):
-            a = tuple(coord_a)
-            b = tuple(coord_b)
-            vertex_pair = tuple(
-                sorted((vertex_coord_to_id[a], vertex_coord_to_id[b]))
-            )
-            edge_coord = tuple(sorted((a, b)))
-            edge_id = edge_coord_to_id[edge_coord]
-            ports.append(
-                Port(
-                    port_id=port_id,
-                    kind=port_kinds[port_id],  # Type de port mélangé
-                    edge_id=edge_id,
-                    vertices=vertex_pair,
-                )
-            )
+        ports = cls._ports_for_kinds(port_kinds)
 
         return cls(tiles=tiles, vertices=vertices, edges=edges, ports=ports)
 
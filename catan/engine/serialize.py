@@ -10,6 +10,8 @@ from __future__ import annotations
 from dataclasses import replace
 from typing import Any, Dict, Iterable, List, Mapping
 
+import numpy as np
+
 from catan.engine.board import Board
 from catan.engine.rules import DISCARD_THRESHOLD, VP_TO_WIN
 from catan.engine.state import (
@@ -19,6 +21,7 @@ from catan.engine.state import (
     RngState,
     SetupPhase,
     TurnSubPhase,
+    rng_state_of,
 )
 
 SCHEMA_VERSION = "0.1.0"
@@ -190,8 +193,8 @@ def _deserialize_pending_trade(
 
 def _serialize_rng_state(rng_state: RngState | None) -> Dict[str, Any]:
     return {
-        "type": "py_random",
-        "state": _tuple_to_list(rng_state) if rng_state is not None else None,
+        "type": "pcg64",
+        "state": list(rng_state) if rng_state is not None else None,
     }
 
 
@@ -201,19 +204,21 @@ def _deserialize_rng_state(payload: Mapping[str, Any] | None) -> RngState | None
     state = payload.get("state")
     if state is None:
         return None
-    return _list_to_tuple(state)
-
-
-def _tuple_to_list(value: Any) -> Any:
-    if isinstance(value, tuple):
-        return [_tuple_to_list(item) for item in value]
-    return value
-
-
-def _list_to_tuple(value: Any) -> Any:
-    if isinstance(value, list):
-        return tuple(_list_to_tuple(item) for item in value)
-    return value
+    if payload.get("type") == "py_random":
+        # Anciens snapshots (Mersenne Twister) : on réensemence un PCG64 de
+        # manière déterministe à partir de l'état sauvegardé.
+        words = [int(word) for word in _flatten(state)]
+        return rng_state_of(np.random.Generator(np.random.PCG64(words)))
+    state_value, inc, has_uint32, uinteger = (int(value) for value in state)
+    return (state_value, inc, has_uint32, uinteger)
+
+
+def _flatten(value: Any) -> Iterable[Any]:
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield value
 
 
 def _board_with_robber(tile_id: int) -> Board:
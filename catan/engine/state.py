@@ -6,14 +6,33 @@ Conforme aux schémas (docs/schemas.md) et specs (docs/specs.md).
 
 from __future__ import annotations
 
-import copy
-import random
+import sys
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from enum import Enum
 from itertools import combinations
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
-
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+
+import numpy as np
+
+from catan.engine.actions import (
+    AcceptPlayerTrade,
+    Action,
+    BuildCity,
+    BuyDevelopment,
+    DeclinePlayerTrade,
+    DiscardResources,
+    EndTurn,
+    MoveRobber,
+    OfferPlayerTrade,
+    PlaceRoad,
+    PlaceSettlement,
+    PlayKnight,
+    PlayProgress,
+    RollDice,
+    TradeBank,
+)
 from catan.engine.board import Board
 from catan.engine.rules import (
     COSTS,
@@ -31,6 +50,16 @@ DEV_CARD_TYPES: tuple[str, ...] = (
     "MONOPOLY",
     "VICTORY_POINT",
 )
+# Ordres d'itération figés une fois pour toutes (énumération des actions
+# légales) : paires ordonnées pour l'Année d'Abondance, et pour chaque
+# ressource les autres ressources demandables dans une offre joueur↔joueur
+_RESOURCE_PAIRS: tuple[tuple[str, str], ...] = tuple(
+    (res_a, res_b) for res_a in RESOURCE_TYPES for res_b in RESOURCE_TYPES
+)
+_OTHER_RESOURCES: Dict[str, tuple[str, ...]] = {
+    resource: tuple(other for other in RESOURCE_TYPES if other != resource)
+    for resource in RESOURCE_TYPES
+}
 PROGRESS_CARD_TYPES: tuple[str, ...] = (
     "ROAD_BUILDING",
     "YEAR_OF_PLENTY",
@@ -51,10 +80,83 @@ BANK_STARTING_RESOURCES: Dict[str, int] = {
     "ORE": 19,
 }
 
-RngState = Tuple[Any, ...]
+# État compact d'un générateur PCG64 : (state, inc, has_uint32, uinteger)
+RngState = Tuple[int, int, int, int]
+
+# ``slots=True`` n'existe qu'à partir de Python 3.10 : sur 3.9 on garde des
+# dataclasses classiques (même comportement, juste sans le gain mémoire).
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+def rng_from_state(rng_state: RngState | None) -> np.random.Generator:
+    """Reconstruit un générateur PCG64 à partir de son état compact.
+
+    Sans état, le générateur est initialisé depuis l'entropie du système.
+    """
+
+    if rng_state is None:
+        return np.random.Generator(np.random.PCG64())
+    state, inc, has_uint32, uinteger = rng_state
+    bit_generator = np.random.PCG64(0)
+    bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": state, "inc": inc},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+    return np.random.Generator(bit_generator)
+
+
+# Générateur réutilisé pour les lancers de dés : on lui réinjecte l'état de la
+# partie au lieu de construire (et d'amorcer) un PCG64 neuf à chaque lancer.
+# Un générateur par thread : injection, tirages et relecture de l'état ne sont
+# pas atomiques, et les simulations peuvent tourner sous un exécuteur "thread".
+_DICE_GENERATORS = threading.local()
+
+
+def _dice_generator() -> np.random.Generator:
+    """Retourne le générateur de dés propre au thread courant."""
+
+    rng = getattr(_DICE_GENERATORS, "rng", None)
+    if rng is None:
+        rng = np.random.Generator(np.random.PCG64(0))
+        _DICE_GENERATORS.rng = rng
+    return rng
+
+
+def _roll_two_dice(rng_state: RngState | None) -> Tuple[int, int, RngState]:
+    """Tire deux dés depuis l'état compact et renvoie aussi l'état suivant."""
+
+    if rng_state is None:
+        rng = rng_from_state(None)
+    else:
+        state, inc, has_uint32, uinteger = rng_state
+        rng = _dice_generator()
+        rng.bit_generator.state = {
+            "bit_generator": "PCG64",
+            "state": {"state": state, "inc": inc},
+            "has_uint32": has_uint32,
+            "uinteger": uinteger,
+        }
+    # Deux tirages scalaires : même séquence que size=2, sans tableau
+    die1 = int(rng.integers(1, 7))
+    die2 = int(rng.integers(1, 7))
+    return die1, die2, rng_state_of(rng)
+
+
+def rng_state_of(rng: np.random.Generator) -> RngState:
+    """Extrait l'état compact (quatre entiers) d'un générateur PCG64."""
+
+    raw = rng.bit_generator.state
+    return (
+        int(raw["state"]["state"]),
+        int(raw["state"]["inc"]),
+        int(raw["has_uint32"]),
+        int(raw["uinteger"]),
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Player:
     """Représentation d'un joueur."""
 
@@ -78,6 +180,28 @@ class Player:
     victory_points: int = 0
     hidden_victory_points: int = 0
 
+    def total_resources(self) -> int:
+        """Nombre total de cartes ressource en main (somme d'entiers Python)."""
+        return sum(self.resources.values())
+
+    def clone(self) -> "Player":
+        """Copie indépendante du joueur.
+
+        Les conteneurs ne contiennent que des entiers : une copie de chaque
+        liste/dict équivaut à ``copy.deepcopy`` pour une fraction du coût.
+        Les champs scalaires sont repris tels quels par ``replace``.
+        """
+        return replace(
+            self,
+            resources=dict(self.resources),
+            settlements=list(self.settlements),
+            cities=list(self.cities),
+            roads=list(self.roads),
+            dev_cards=dict(self.dev_cards),
+            new_dev_cards=dict(self.new_dev_cards),
+            played_dev_cards=dict(self.played_dev_cards),
+        )
+
 
 @dataclass(frozen=True)
 class PendingPlayerTrade:
@@ -106,7 +230,7 @@ class TurnSubPhase(Enum):
     TRADE_RESPONSE = "TRADE_RESPONSE"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GameState:
     """État immuable du jeu.
 
@@ -174,11 +298,13 @@ class GameState:
             Player(player_id=i, name=name) for i, name in enumerate(player_names)
         ]
 
-        rng = random.Random(seed)
+        rng = np.random.Generator(np.random.PCG64(seed))
 
         if dev_deck is None:
-            shuffled_deck = list(DEFAULT_DEV_DECK)
-            rng.shuffle(shuffled_deck)
+            shuffled_deck = [
+                DEFAULT_DEV_DECK[index]
+                for index in rng.permutation(len(DEFAULT_DEV_DECK)).tolist()
+            ]
         else:
             shuffled_deck = list(dev_deck)
 
@@ -201,15 +327,18 @@ class GameState:
             robber_tile_id=robber_tile_id,
             dev_deck=shuffled_deck,
             bank_resources=bank,
-            rng_state=rng.getstate(),
+            rng_state=rng_state_of(rng),
         )
 
-    def _rng(self) -> random.Random:
-        """Retourne un générateur pseudo-aléatoire initialisé avec l'état courant."""
-        rng = random.Random()
-        if self.rng_state is not None:
-            rng.setstate(self.rng_state)
-        return rng
+    def __repr__(self) -> str:
+        # Résumé compact : le repr dataclass par défaut déroule plateau, joueurs,
+        # deck et état RNG, ce qui coûte cher dès qu'un état part dans les logs.
+        scores = [player.victory_points for player in self.players]
+        return (
+            f"GameState(phase={self.phase.value}, subphase={self.turn_subphase.value}, "
+            f"turn={self.turn_number}, current_player_id={self.current_player_id}, "
+            f"victory_points={scores}, is_game_over={self.is_game_over})"
+        )
 
     def legal_actions(self) -> List["Action"]:  # type: ignore[name-defined]
         """Retourne la liste des actions légales pour l'état courant."""
@@ -243,8 +372,6 @@ class GameState:
         return mask
 
     def _legal_actions_setup_phase(self) -> List["Action"]:  # type: ignore[name-defined]
-        from catan.engine.actions import PlaceRoad, PlaceSettlement
-
         actions: List["Action"] = []
         if self._waiting_for_road:
             current_player = self.players[self.current_player_id]
@@ -262,8 +389,6 @@ class GameState:
         return actions
 
     def _legal_actions_robber_discard_phase(self) -> List["Action"]:  # type: ignore[name-defined]
-        from catan.engine.actions import DiscardResources
-
         required = self.pending_discards.get(self.current_player_id)
         if not required:
             return []
@@ -277,8 +402,6 @@ class GameState:
         return actions
 
     def _legal_actions_robber_move_phase(self) -> List["Action"]:  # type: ignore[name-defined]
-        from catan.engine.actions import MoveRobber
-
         mover_id = (
             self.robber_roller_id
             if self.robber_roller_id is not None
@@ -304,8 +427,6 @@ class GameState:
         return actions
 
     def _legal_actions_trade_response_phase(self) -> List["Action"]:  # type: ignore[name-defined]
-        from catan.engine.actions import AcceptPlayerTrade, DeclinePlayerTrade
-
         pending = self.pending_player_trade
         if pending is None:
             return []
@@ -316,21 +437,6 @@ class GameState:
         return [action for action in candidates if self.is_action_legal(action)]
 
     def _legal_actions_main_phase(self) -> List["Action"]:  # type: ignore[name-defined]
-        from itertools import combinations
-
-        from catan.engine.actions import (
-            BuyDevelopment,
-            BuildCity,
-            EndTurn,
-            OfferPlayerTrade,
-            PlaceRoad,
-            PlaceSettlement,
-            PlayKnight,
-            PlayProgress,
-            RollDice,
-            TradeBank,
-        )
-
         actions: List["Action"] = []
 
         def append_if_legal(candidate: "Action") -> None:  # type: ignore[name-defined]
@@ -344,13 +450,25 @@ class GameState:
 
         current_player = self.players[self.current_player_id]
 
-        # Constructions
-        for edge_id in self.board.edges.keys():
-            append_if_legal(PlaceRoad(edge_id=edge_id))
-        for vertex_id in self.board.vertices.keys():
-            append_if_legal(PlaceSettlement(vertex_id=vertex_id))
-        for vertex_id in current_player.settlements:
-            append_if_legal(BuildCity(vertex_id=vertex_id))
+        # Constructions (inutile d'examiner chaque position si le coût est hors de portée)
+        if self.dice_rolled_this_turn:
+            # Seule la frontière du réseau du joueur peut accueillir route ou colonie
+            road_vertices = self._road_network_vertices(current_player)
+            if self._player_can_afford(current_player, COSTS["road"]):
+                network_vertices = self._player_network_vertices(current_player, road_vertices)
+                candidate_edges = {
+                    edge_id
+                    for vertex_id in network_vertices
+                    for edge_id in self.board.vertices[vertex_id].edges
+                }
+                for edge_id in sorted(candidate_edges):
+                    append_if_legal(PlaceRoad(edge_id=edge_id))
+            if self._player_can_afford(current_player, COSTS["settlement"]):
+                for vertex_id in sorted(road_vertices):
+                    append_if_legal(PlaceSettlement(vertex_id=vertex_id))
+            if self._player_can_afford(current_player, COSTS["city"]):
+                for vertex_id in current_player.settlements:
+                    append_if_legal(BuildCity(vertex_id=vertex_id))
 
         # Commerce banque/ports
         for give_resource in RESOURCE_TYPES:
@@ -375,26 +493,40 @@ class GameState:
         # Cartes chevalier + progrès
         append_if_legal(PlayKnight())
 
-        if current_player.dev_cards.get("ROAD_BUILDING", 0) > 0:
+        if self._dev_card_playable(current_player, "ROAD_BUILDING"):
+            occupied_edges = self._occupied_edges()
             free_edges = [
-                edge_id
-                for edge_id in self.board.edges.keys()
-                if edge_id not in self._occupied_edges()
+                edge_id for edge_id in self.board.edges.keys() if edge_id not in occupied_edges
             ]
+            # Filtre nécessaire avant la validation complète : la première route
+            # touche le réseau, la seconde touche le réseau ou la première.
+            # Une arête libre est connectée si l'une de ses extrémités est un
+            # sommet du réseau : on part des sommets plutôt que des 72 arêtes.
+            connected_edges = {
+                edge_id
+                for vertex_id in self._player_network_vertices(current_player)
+                for edge_id in self.board.vertices[vertex_id].edges
+                if edge_id not in occupied_edges
+            }
             for edge_a, edge_b in combinations(free_edges, 2):
+                if edge_a not in connected_edges:
+                    continue
+                if edge_b not in connected_edges and edge_b not in self.board.edge_neighbors(
+                    edge_a
+                ):
+                    continue
                 action = PlayProgress(card="ROAD_BUILDING", edges=[edge_a, edge_b])
                 append_if_legal(action)
 
-        if current_player.dev_cards.get("YEAR_OF_PLENTY", 0) > 0:
-            for res_a in RESOURCE_TYPES:
-                for res_b in RESOURCE_TYPES:
-                    resources: Dict[str, int] = {}
-                    resources[res_a] = resources.get(res_a, 0) + 1
-                    resources[res_b] = resources.get(res_b, 0) + 1
-                    action = PlayProgress(card="YEAR_OF_PLENTY", resources=resources)
-                    append_if_legal(action)
+        if self._dev_card_playable(current_player, "YEAR_OF_PLENTY"):
+            for res_a, res_b in _RESOURCE_PAIRS:
+                resources: Dict[str, int] = (
+                    {res_a: 2} if res_a == res_b else {res_a: 1, res_b: 1}
+                )
+                action = PlayProgress(card="YEAR_OF_PLENTY", resources=resources)
+                append_if_legal(action)
 
-        if current_player.dev_cards.get("MONOPOLY", 0) > 0:
+        if self._dev_card_playable(current_player, "MONOPOLY"):
             for resource in RESOURCE_TYPES:
                 action = PlayProgress(card="MONOPOLY", resource=resource)
                 append_if_legal(action)
@@ -405,9 +537,7 @@ class GameState:
             for give_resource in RESOURCE_TYPES:
                 if current_player.resources.get(give_resource, 0) <= 0:
                     continue
-                for receive_resource in RESOURCE_TYPES:
-                    if receive_resource == give_resource:
-                        continue
+                for receive_resource in _OTHER_RESOURCES[give_resource]:
                     offer = OfferPlayerTrade(
                         give={give_resource: 1},
                         receive={receive_resource: 1},
@@ -458,23 +588,6 @@ class GameState:
         Returns:
             True si l'action est légale
         """
-        from catan.engine.actions import (
-            AcceptPlayerTrade,
-            BuyDevelopment,
-            BuildCity,
-            EndTurn,
-            DeclinePlayerTrade,
-            DiscardResources,
-            MoveRobber,
-            OfferPlayerTrade,
-            PlaceRoad,
-            PlaceSettlement,
-            PlayKnight,
-            PlayProgress,
-            RollDice,
-            TradeBank,
-        )
-
         if self.is_game_over:
             return False
 
@@ -623,9 +736,7 @@ class GameState:
         if isinstance(action, PlayKnight):
             if self.turn_subphase != TurnSubPhase.MAIN:
                 return False
-            if current_player.new_dev_cards.get("KNIGHT", 0) > 0:
-                return False
-            return current_player.dev_cards.get("KNIGHT", 0) > 0
+            return self._dev_card_playable(current_player, "KNIGHT")
 
         if isinstance(action, PlayProgress):
             if self.turn_subphase != TurnSubPhase.MAIN:
@@ -633,9 +744,7 @@ class GameState:
             card_type = action.card
             if card_type not in PROGRESS_CARD_TYPES:
                 return False
-            if current_player.new_dev_cards.get(card_type, 0) > 0:
-                return False
-            if current_player.dev_cards.get(card_type, 0) <= 0:
+            if not self._dev_card_playable(current_player, card_type):
                 return False
 
             if card_type == "ROAD_BUILDING":
@@ -771,32 +880,16 @@ class GameState:
         Raises:
             ValueError: Si l'action n'est pas légale
         """
-        from catan.engine.actions import (
-            AcceptPlayerTrade,
-            BuyDevelopment,
-            BuildCity,
-            EndTurn,
-            DeclinePlayerTrade,
-            DiscardResources,
-            MoveRobber,
-            OfferPlayerTrade,
-            PlaceRoad,
-            PlaceSettlement,
-            PlayKnight,
-            PlayProgress,
-            RollDice,
-            TradeBank,
-        )
-
         if not self.is_action_legal(action):
             raise ValueError(f"Action illégale: {action}")
 
         # Copier les joueurs pour modification immuable
-        new_players = [copy.deepcopy(p) for p in self.players]
+        new_players = [p.clone() for p in self.players]
         current_player = new_players[self.current_player_id]
 
         recompute_longest_road = False
         recompute_largest_army = False
+        new_settlement_vertex: int | None = None
 
         new_state_fields = {
             "board": self.board,
@@ -810,13 +903,13 @@ class GameState:
             "last_dice_roll": self.last_dice_roll,
             "dice_rolled_this_turn": self.dice_rolled_this_turn,
             "turn_subphase": self.turn_subphase,
-            "pending_discards": copy.deepcopy(self.pending_discards),
+            "pending_discards": dict(self.pending_discards),
             "pending_discard_queue": list(self.pending_discard_queue),
             "pending_player_trade": self.pending_player_trade,
             "robber_tile_id": self.robber_tile_id,
             "robber_roller_id": self.robber_roller_id,
             "dev_deck": list(self.dev_deck),
-            "bank_resources": copy.deepcopy(self.bank_resources),
+            "bank_resources": dict(self.bank_resources),
             "rng_state": self.rng_state,
             "longest_road_owner": self.longest_road_owner,
             "longest_road_length": self.longest_road_length,
@@ -849,6 +942,7 @@ class GameState:
             else:
                 new_state_fields["_waiting_for_road"] = False
             recompute_longest_road = True
+            new_settlement_vertex = action.vertex_id
 
         elif isinstance(action, PlaceRoad):
             # Placer la route
@@ -998,10 +1092,7 @@ class GameState:
             if action.forced_value is not None:
                 die1, die2 = action.forced_value
             else:
-                rng = self._rng()
-                die1 = rng.randint(1, 6)
-                die2 = rng.randint(1, 6)
-                new_state_fields["rng_state"] = rng.getstate()
+                die1, die2, new_state_fields["rng_state"] = _roll_two_dice(self.rng_state)
 
             dice_total = die1 + die2
             new_state_fields["last_dice_roll"] = dice_total
@@ -1101,7 +1192,9 @@ class GameState:
             new_state_fields["pending_discard_queue"] = []
             new_state_fields["robber_roller_id"] = None
 
-        if recompute_longest_road:
+        if recompute_longest_road and not self._longest_road_update_is_noop(
+            new_players, new_settlement_vertex
+        ):
             self._apply_longest_road_update(new_state_fields, new_players)
         if recompute_largest_army:
             self._apply_largest_army_update(new_state_fields, new_players)
@@ -1112,7 +1205,11 @@ class GameState:
 
     def _player_can_afford(self, player: Player, cost: Dict[str, int]) -> bool:
         """Vérifie que le joueur possède les ressources nécessaires."""
-        return all(player.resources.get(resource, 0) >= amount for resource, amount in cost.items())
+        resources = player.resources
+        for resource, amount in cost.items():
+            if resources.get(resource, 0) < amount:
+                return False
+        return True
 
     def _deduct_resources(self, player: Player, cost: Dict[str, int]) -> None:
         """Soustrait les ressources correspondant au coût fourni."""
@@ -1159,14 +1256,12 @@ class GameState:
 
     def _player_port_kinds(self, player: Player) -> Set[str]:
         """Retourne les types de ports accessibles par le joueur."""
-        owned_vertices = set(player.settlements) | set(player.cities)
-        if not owned_vertices:
-            return set()
-
+        port_kind_by_vertex = self.board.port_kind_by_vertex
         kinds: Set[str] = set()
-        for port in self.board.ports:
-            if any(vertex in owned_vertices for vertex in port.vertices):
-                kinds.add(port.kind)
+        for vertex in player.settlements + player.cities:
+            kind = port_kind_by_vertex.get(vertex)
+            if kind is not None:
+                kinds.add(kind)
         return kinds
 
     def _trade_rate_for_resource(self, player: Player, resource: str) -> int:
@@ -1179,6 +1274,11 @@ class GameState:
             rate = min(rate, 2)
         return rate
 
+    @staticmethod
+    def _dev_card_playable(player: Player, card: str) -> bool:
+        """Carte détenue et non achetée ce tour-ci (deux lookups O(1))."""
+        return player.new_dev_cards.get(card, 0) == 0 and player.dev_cards.get(card, 0) > 0
+
     def _grant_new_dev_card(self, player: Player, card: str) -> None:
         """Ajoute une carte de développement fraîchement achetée."""
         if card not in player.new_dev_cards:
@@ -1218,6 +1318,33 @@ class GameState:
         new_state_fields["robber_roller_id"] = None
         new_state_fields["turn_subphase"] = TurnSubPhase.MAIN
 
+    def _longest_road_update_is_noop(
+        self,
+        players: List[Player],
+        new_settlement_vertex: int | None,
+    ) -> bool:
+        """Indique si le recalcul de la plus longue route peut être évité.
+
+        Le titre exige au moins 5 routes : tant que personne ne le détient et
+        qu'aucun joueur n'a 5 routes, le résultat est connu d'avance. Une
+        nouvelle colonie ne modifie les longueurs que si elle coupe la route
+        d'un adversaire (au moins deux de ses routes sur ce sommet).
+        """
+
+        if self.longest_road_owner is None and all(
+            len(player.roads) < 5 for player in players
+        ):
+            return True
+        if new_settlement_vertex is None:
+            return False
+        vertex_edges = self.board.vertices[new_settlement_vertex].edges
+        for player in players:
+            if player.player_id == self.current_player_id:
+                continue
+            if sum(1 for edge_id in vertex_edges if edge_id in player.roads) >= 2:
+                return False
+        return True
+
     def _apply_longest_road_update(
         self,
         new_state_fields: Dict[str, object],
@@ -1360,13 +1487,12 @@ class GameState:
         if not roads:
             return 0
 
+        road_ids = [edge_id for edge_id in roads if edge_id in board.edges]
+        endpoints = board.edge_endpoints[road_ids].tolist()
         adjacency_by_vertex: Dict[int, List[int]] = defaultdict(list)
-        for edge_id in roads:
-            edge = board.edges.get(edge_id)
-            if edge is None:
-                continue
-            for vertex_id in edge.vertices:
-                adjacency_by_vertex[vertex_id].append(edge_id)
+        for edge_id, (vertex_a, vertex_b) in zip(road_ids, endpoints):
+            adjacency_by_vertex[vertex_a].append(edge_id)
+            adjacency_by_vertex[vertex_b].append(edge_id)
 
         neighbors: Dict[int, Set[int]] = {edge_id: set() for edge_id in roads}
         for vertex_id, edges_at_vertex in adjacency_by_vertex.items():
@@ -1415,19 +1541,16 @@ class GameState:
         additional_edges: Optional[Iterable[int]] = None,
     ) -> bool:
         """Vérifie qu'une arête est connectée au réseau du joueur."""
-        edge = self.board.edges[edge_id]
-        player_vertices = set(player.settlements + player.cities)
-        if player_vertices.intersection(edge.vertices):
-            return True
-
-        player_edges = set(player.roads)
-        if additional_edges:
-            player_edges.update(additional_edges)
-
-        for owned_edge_id in player_edges:
-            owned_edge = self.board.edges[owned_edge_id]
-            if set(owned_edge.vertices).intersection(edge.vertices):
+        vertices = self.board.vertices
+        staged = set(additional_edges) if additional_edges else ()
+        # Adjacence par identifiants : seules les arêtes des deux extrémités
+        # (au plus six) peuvent relier l'arête au réseau du joueur.
+        for vertex_id in self.board.edges[edge_id].vertices:
+            if vertex_id in player.settlements or vertex_id in player.cities:
                 return True
+            for adjacent_edge_id in vertices[vertex_id].edges:
+                if adjacent_edge_id in player.roads or adjacent_edge_id in staged:
+                    return True
         return False
 
     def _vertex_is_occupied(self, vertex_id: int) -> bool:
@@ -1437,16 +1560,9 @@ class GameState:
                 return True
         return False
 
-    def _vertex_adjacent_vertices(self, vertex_id: int) -> List[int]:
+    def _vertex_adjacent_vertices(self, vertex_id: int) -> Tuple[int, ...]:
         """Retourne les sommets adjacents (distance 1) à un sommet donné."""
-        vertex = self.board.vertices[vertex_id]
-        neighbors: List[int] = []
-        for edge_id in vertex.edges:
-            edge = self.board.edges[edge_id]
-            a, b = edge.vertices
-            neighbor = b if a == vertex_id else a
-            neighbors.append(neighbor)
-        return neighbors
+        return self.board.vertex_neighbors(vertex_id)
 
     def _opponent_id(self, player_id: int) -> int | None:
         """Retourne l'identifiant de l'adversaire (1v1)."""
@@ -1466,6 +1582,19 @@ class GameState:
                 return False
         return True
 
+    def _road_network_vertices(self, player: Player) -> Set[int]:
+        """Sommets touchés par au moins une route du joueur."""
+        edges = self.board.edges
+        return {vertex_id for edge_id in player.roads for vertex_id in edges[edge_id].vertices}
+
+    def _player_network_vertices(
+        self, player: Player, road_vertices: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """Sommets touchés par le réseau du joueur (routes, colonies, villes)."""
+        if road_vertices is None:
+            road_vertices = self._road_network_vertices(player)
+        return road_vertices.union(player.settlements, player.cities)
+
     def _vertex_adjacent_to_player_road(self, player: Player, vertex_id: int) -> bool:
         """Vérifie qu'au moins une route du joueur aboutit sur le sommet."""
         vertex = self.board.vertices[vertex_id]
@@ -1479,19 +1608,13 @@ class GameState:
             dice_value: Valeur du lancer de dés
             players: Liste modifiable des joueurs (pour mutation)
         """
-        # Parcourir toutes les tuiles du plateau
-        for tile_id, tile in self.board.tiles.items():
-            # Ignorer si pas de numéro (pip) ou désert
-            if tile.pip is None or tile.resource == "DESERT":
-                continue
-
-            # Ignorer si le numéro ne correspond pas
-            if tile.pip != dice_value:
-                continue
-
+        # Seules les tuiles portant ce numéro produisent (index du plateau)
+        tiles = self.board.tiles
+        for tile_id in self.board.tiles_for_pip(dice_value):
             # Ignorer si le voleur bloque cette tuile
             if tile_id == self.robber_tile_id:
                 continue
+            tile = tiles[tile_id]
 
             # Distribuer aux colonies/villes sur les sommets adjacents
             for vertex_id in tile.vertices:
@@ -1507,7 +1630,7 @@ class GameState:
         """Calcule les quantités à défausser pour chaque joueur après un 7."""
         requirements: Dict[int, int] = {}
         for player in players:
-            total_cards = sum(player.resources.values())
+            total_cards = player.total_resources()
             if total_cards > DISCARD_THRESHOLD:
                 # On doit défausser la moitié des cartes (arrondi vers le bas)
                 requirements[player.player_id] = total_cards // 2
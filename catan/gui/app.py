@@ -21,7 +21,7 @@ from typing import Dict, Optional, Set, Tuple
 import pygame
 
 from catan.app.game_service import GameService
-from catan.engine.actions import BuyDevelopment, EndTurn
+from catan.engine.actions import EndTurn
 from catan.engine.state import GameState, SetupPhase, TurnSubPhase, RESOURCE_TYPES
 from catan.engine.rules import DISCARD_THRESHOLD
 from catan.gui.construction_controller import ConstructionController
@@ -35,6 +35,21 @@ from catan.gui.turn_controller import TurnController
 
 __all__ = ["ButtonState", "UIState", "DiscardPrompt", "BankTradePrompt", "YearOfPlentyPrompt", "CatanH2HApp"]
 
+# Ensembles de modes consultés à chaque calcul d'état d'interface
+_BUILD_MODES = frozenset({"build_road", "build_settlement", "build_city"})
+_ROBBER_MODES = frozenset({"move_robber", "discard", "discard_wait"})
+# Modes interactifs conservés lors de la synchronisation avec l'état de jeu
+_PRESERVED_MODES = _BUILD_MODES | {"bank_trade", "year_of_plenty", "select_road_building"}
+_ROLL_BLOCKING_MODES = _BUILD_MODES | _ROBBER_MODES
+_END_TURN_BLOCKING_MODES = _ROBBER_MODES | {"setup"}
+_CANCELLABLE_MODES = _BUILD_MODES | {
+    "move_robber",
+    "discard",
+    "bank_trade",
+    "year_of_plenty",
+    "select_road_building",
+}
+
 
 @dataclass(frozen=True)
 class ButtonState:
@@ -141,6 +156,11 @@ class CatanH2HApp:
         self._road_building_edges: list[int] = []
         self._year_of_plenty_selection: Dict[str, int] = {}
 
+        # État avec lequel les contrôleurs ont été synchronisés en dernier, et
+        # boutons calculés pour (cet état, ce mode).
+        self._synced_state: Optional[GameState] = None
+        self._buttons_cache: Optional[Tuple[str, Dict[str, ButtonState]]] = None
+
     # ------------------------------------------------------------------
     # Initialisation & synchronisation
     # ------------------------------------------------------------------
@@ -200,11 +220,22 @@ class CatanH2HApp:
         return self._board_renderer
 
     def refresh_state(self) -> None:
-        """Resynchronise les contrôleurs avec l'état courant."""
+        """Resynchronise les contrôleurs avec l'état courant.
+
+        À appeler après toute modification en place de l'état : `get_ui_state`
+        ne resynchronise que lorsque le GameService expose un nouvel état.
+        """
 
         if self.setup_controller is None:
             return
 
+        self._sync_controllers()
+        self._update_mode()
+
+    def _sync_controllers(self) -> None:
+        """Propage l'état courant aux contrôleurs et invalide leurs caches."""
+
+        assert self.setup_controller is not None
         self.setup_controller.refresh_state()
         assert self.turn_controller is not None
         self.turn_controller.refresh_state()
@@ -218,6 +249,11 @@ class CatanH2HApp:
         self.hud_controller.refresh_state()
         if self._board_renderer is not None:
             self._board_renderer.update_board(self.state.board)
+        self._synced_state = self.state
+        self._buttons_cache = None
+
+    def _update_mode(self) -> None:
+        """Ajuste le mode UI selon la phase et les sous-phases de l'état."""
 
         if self.state.phase in (SetupPhase.SETUP_ROUND_1, SetupPhase.SETUP_ROUND_2):
             self.mode = "setup"
@@ -229,7 +265,7 @@ class CatanH2HApp:
             requirements = self.turn_controller.get_discard_requirements()
             current_id = self.state.current_player_id
             player = self.state.players[current_id]
-            calc_required = max(sum(player.resources.values()) - DISCARD_THRESHOLD, 0)
+            calc_required = max(player.total_resources() - DISCARD_THRESHOLD, 0)
             required = requirements.get(current_id, 0)
             effective_required = max(required, calc_required)
             if effective_required > 0:
@@ -259,13 +295,13 @@ class CatanH2HApp:
             return
 
         # Préserver les modes interactifs utilisateur
-        if self.mode in {"bank_trade", "year_of_plenty", "select_road_building", "build_road", "build_settlement", "build_city"}:
+        if self.mode in _PRESERVED_MODES:
             return
 
         if self.mode == "setup":
             # Transition automatique vers le mode idle une fois le setup terminé
             self.mode = "idle"
-        elif self.mode in {"move_robber", "discard", "discard_wait"} and not self.turn_controller.is_in_robber_move_phase():
+        elif self.mode in _ROBBER_MODES and not self.turn_controller.is_in_robber_move_phase():
             self.mode = "idle"
 
     # ------------------------------------------------------------------
@@ -763,7 +799,11 @@ class CatanH2HApp:
         if self.setup_controller is None:
             raise RuntimeError("App non initialisée")
 
-        self.refresh_state()
+        # Les contrôleurs ne sont resynchronisés (et leurs caches d'actions
+        # légales vidés) que si l'état a changé depuis le dernier refresh.
+        if self.state is not self._synced_state:
+            self._sync_controllers()
+        self._update_mode()
 
         highlight_vertices: Set[int] = set()
         highlight_edges: Set[int] = set()
@@ -921,6 +961,14 @@ class CatanH2HApp:
         return f"{current_player.name} — Choisissez une action"
 
     def _build_buttons(self) -> Dict[str, ButtonState]:
+        # Les boutons ne dépendent que de l'état synchronisé et du mode
+        if self._buttons_cache is not None and self._buttons_cache[0] == self.mode:
+            return dict(self._buttons_cache[1])
+        buttons = self._compute_buttons()
+        self._buttons_cache = (self.mode, buttons)
+        return dict(buttons)
+
+    def _compute_buttons(self) -> Dict[str, ButtonState]:
         assert self.turn_controller is not None
         assert self.construction_controller is not None
 
@@ -929,15 +977,16 @@ class CatanH2HApp:
         can_roll = (
             self.state.phase == SetupPhase.PLAY
             and self.turn_controller.can_roll_dice()
-            and self.mode not in ("build_road", "build_settlement", "build_city", "move_robber", "discard", "discard_wait")
+            and self.mode not in _ROLL_BLOCKING_MODES
         )
 
         buttons["roll_dice"] = ButtonState("Lancer les dés", can_roll)
 
-        legal_actions = self.state.legal_actions()
+        # Actions légales et positions viennent des caches des contrôleurs,
+        # recalculés seulement après un changement d'état
         can_end_turn = (
-            EndTurn() in legal_actions
-            and self.mode not in ("setup", "move_robber", "discard", "discard_wait")
+            self.turn_controller.can_end_turn()
+            and self.mode not in _END_TURN_BLOCKING_MODES
         )
         buttons["end_turn"] = ButtonState("Terminer le tour", can_end_turn)
 
@@ -964,7 +1013,7 @@ class CatanH2HApp:
 
         can_buy_development = (
             self.mode == "idle"
-            and BuyDevelopment() in legal_actions
+            and self.construction_controller.can_buy_development()
         )
         buttons["buy_development"] = ButtonState("Acheter carte dev", can_buy_development)
 
@@ -1016,19 +1065,6 @@ class CatanH2HApp:
 
         # Bouton d'annulation actif lorsqu'un mode temporaire est enclenché
         cancel_label = "Réinitialiser" if self.mode == "discard" else "Annuler"
-        buttons["cancel"] = ButtonState(
-            cancel_label,
-            self.mode
-            in {
-                "build_road",
-                "build_settlement",
-                "build_city",
-                "move_robber",
-                "discard",
-                "bank_trade",
-                "year_of_plenty",
-                "select_road_building",
-            },
-        )
+        buttons["cancel"] = ButtonState(cancel_label, self.mode in _CANCELLABLE_MODES)
 
         return buttons
@@ -11,7 +11,7 @@ Conforme aux specs docs/gui-h2h.md section "Actions principales".
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 
 import pygame
 
@@ -47,6 +47,10 @@ class ConstructionController:
 
         # Cache for legal actions to avoid recomputation
         self._legal_actions_cache: Optional[list[Action]] = None
+        # Positions légales (routes, colonies, villes), extraites en une passe
+        self._legal_positions_cache: Optional[
+            Tuple[FrozenSet[int], FrozenSet[int], FrozenSet[int]]
+        ] = None
 
     def refresh_state(self) -> None:
         """Refresh internal state from game service.
@@ -55,6 +59,7 @@ class ConstructionController:
         """
         self.state = self.game_service.state
         self._legal_actions_cache = None
+        self._legal_positions_cache = None
 
     def _get_legal_actions(self) -> list[Action]:
         """Get legal actions with caching."""
@@ -64,20 +69,21 @@ class ConstructionController:
 
     # === Resource checks ===
 
+    def _can_pay(self, cost: Dict[str, int]) -> bool:
+        """Check a cost from COSTS against the current player's hand."""
+        resources = self.state.players[self.state.current_player_id].resources
+        for resource, amount in cost.items():
+            if resources.get(resource, 0) < amount:
+                return False
+        return True
+
     def can_afford_road(self) -> bool:
         """Check if current player can afford a road.
 
         Returns:
             True if player has enough resources for a road
         """
-        player = self.state.players[self.state.current_player_id]
-        road_cost = COSTS["road"]
-
-        for resource, amount in road_cost.items():
-            if player.resources.get(resource, 0) < amount:
-                return False
-
-        return True
+        return self._can_pay(COSTS["road"])
 
     def can_afford_settlement(self) -> bool:
         """Check if current player can afford a settlement.
@@ -85,14 +91,7 @@ class ConstructionController:
         Returns:
             True if player has enough resources for a settlement
         """
-        player = self.state.players[self.state.current_player_id]
-        settlement_cost = COSTS["settlement"]
-
-        for resource, amount in settlement_cost.items():
-            if player.resources.get(resource, 0) < amount:
-                return False
-
-        return True
+        return self._can_pay(COSTS["settlement"])
 
     def can_afford_city(self) -> bool:
         """Check if current player can afford a city.
@@ -100,14 +99,7 @@ class ConstructionController:
         Returns:
             True if player has enough resources for a city
         """
-        player = self.state.players[self.state.current_player_id]
-        city_cost = COSTS["city"]
-
-        for resource, amount in city_cost.items():
-            if player.resources.get(resource, 0) < amount:
-                return False
-
-        return True
+        return self._can_pay(COSTS["city"])
 
     def can_afford_development(self) -> bool:
         """Check if current player can afford a development card.
@@ -115,29 +107,47 @@ class ConstructionController:
         Returns:
             True if player has enough resources for a development card
         """
-        player = self.state.players[self.state.current_player_id]
-        dev_cost = COSTS["development"]
+        return self._can_pay(COSTS["development"])
 
-        for resource, amount in dev_cost.items():
-            if player.resources.get(resource, 0) < amount:
-                return False
+    def can_buy_development(self) -> bool:
+        """Check if buying a development card is currently legal.
 
-        return True
+        Returns:
+            True if BuyDevelopment is among the legal actions
+        """
+        return BuyDevelopment() in self._get_legal_actions()
 
     # === Legal positions ===
 
+    def _get_legal_positions(self) -> Tuple[FrozenSet[int], FrozenSet[int], FrozenSet[int]]:
+        """Positions légales (routes, colonies, villes), calculées une fois par état."""
+        if self._legal_positions_cache is None:
+            roads: Set[int] = set()
+            settlements: Set[int] = set()
+            cities: Set[int] = set()
+            for action in self._get_legal_actions():
+                if isinstance(action, PlaceRoad):
+                    if not action.free:
+                        roads.add(action.edge_id)
+                elif isinstance(action, PlaceSettlement):
+                    if not action.free:
+                        settlements.add(action.vertex_id)
+                elif isinstance(action, BuildCity):
+                    cities.add(action.vertex_id)
+            self._legal_positions_cache = (
+                frozenset(roads),
+                frozenset(settlements),
+                frozenset(cities),
+            )
+        return self._legal_positions_cache
+
     def get_legal_road_positions(self) -> Set[int]:
         """Get set of edge IDs where roads can be built.
 
         Returns:
             Set of legal edge IDs for road placement
         """
-        legal_actions = self._get_legal_actions()
-        return {
-            action.edge_id
-            for action in legal_actions
-            if isinstance(action, PlaceRoad) and not action.free
-        }
+        return set(self._get_legal_positions()[0])
 
     def get_legal_settlement_positions(self) -> Set[int]:
         """Get set of vertex IDs where settlements can be built.
@@ -145,12 +155,7 @@ class ConstructionController:
         Returns:
             Set of legal vertex IDs for settlement placement
         """
-        legal_actions = self._get_legal_actions()
-        return {
-            action.vertex_id
-            for action in legal_actions
-            if isinstance(action, PlaceSettlement) and not action.free
-        }
+        return set(self._get_legal_positions()[1])
 
     def get_legal_city_positions(self) -> Set[int]:
         """Get set of vertex IDs where cities can be built.
@@ -158,12 +163,7 @@ class ConstructionController:
         Returns:
             Set of legal vertex IDs for city upgrades
         """
-        legal_actions = self._get_legal_actions()
-        return {
-            action.vertex_id
-            for action in legal_actions
-            if isinstance(action, BuildCity)
-        }
+        return set(self._get_legal_positions()[2])
 
     # === Construction actions ===
 
@@ -38,6 +38,7 @@ class BoardGeometry:
         # Precompute screen positions for all vertices
         self._vertex_positions: Dict[int, Tuple[float, float]] = {}
         self._compute_vertex_positions()
+        self._surface_size = self._compute_surface_size()
 
     def _compute_vertex_positions(self) -> None:
         """Compute screen positions for all vertices with margin alignment."""
@@ -75,6 +76,10 @@ class BoardGeometry:
         Returns:
             (width, height) in pixels
         """
+        return self._surface_size
+
+    def _compute_surface_size(self) -> Tuple[float, float]:
+        """Compute the surface size once, positions never change afterwards."""
         # Compute bounds from vertex positions
         min_x = min(x for x, _ in self._vertex_positions.values())
         max_x = max(x for x, _ in self._vertex_positions.values())
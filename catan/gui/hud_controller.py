@@ -12,7 +12,7 @@ données prêtes à consommer par la couche de présentation.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
@@ -47,19 +47,22 @@ class HUDController:
         self.game_service = game_service
         self.screen = screen
         self.state: GameState = game_service.state
+        # Panneaux de l'état synchronisé : reconstruits après refresh_state()
+        # seulement, pas à chaque get_ui_state()
+        self._panels_cache: Optional[Tuple[PlayerPanel, ...]] = None
 
     def refresh_state(self) -> None:
         """Synchronise le contrôleur avec l'état courant du GameService."""
 
         self.state = self.game_service.state
+        self._panels_cache = None
 
     def get_player_panels(self) -> List[PlayerPanel]:
         """Retourne les panneaux HUD pour chaque joueur."""
 
-        panels: List[PlayerPanel] = []
-        for player in self.state.players:
-            panels.append(self._build_panel(player))
-        return panels
+        if self._panels_cache is None:
+            self._panels_cache = tuple(self._build_panel(player) for player in self.state.players)
+        return list(self._panels_cache)
 
     def is_discard_prompt_active(self) -> bool:
         """Indique si une phase de défausse est en cours."""
@@ -92,7 +95,7 @@ class HUDController:
         if self.state.turn_subphase == TurnSubPhase.ROBBER_DISCARD:
             pending_discard = self.state.pending_discards.get(player_id)
 
-        hand_size = sum(resources.values())
+        hand_size = player.total_resources()
         played_knights = player.played_dev_cards.get("KNIGHT", 0)
 
         return PlayerPanel(
@@ -16,6 +16,7 @@ Conventions visuelles (conforme docs/gui-h2h.md):
 from __future__ import annotations
 
 import math
+from array import array
 from typing import Dict, List, Tuple, Optional, Set
 
 import pygame
@@ -46,6 +47,7 @@ COLOR_ROBBER = (50, 50, 50)
 COLOR_NUMBER = (255, 255, 255)
 COLOR_NUMBER_RED = (255, 100, 100)
 ROBBER_OFFSET_Y = 22
+ROBBER_RADIUS = 15
 
 # Couleurs joueurs
 COLOR_PLAYER_0 = (30, 100, 200)  # Bleu
@@ -65,11 +67,44 @@ COLOR_HIGHLIGHT_TILE = (255, 255, 120, 90)     # Jaune clair semi-transparent
 ROAD_WIDTH = 6
 SETTLEMENT_RADIUS = 10
 CITY_SIZE = 16
+NUMBER_TOKEN_RADIUS = 16
 
 # Tailles pour détection de clics
 VERTEX_CLICK_RADIUS = 15  # Rayon de détection pour les clics sur sommets
 EDGE_CLICK_DISTANCE = 10  # Distance max pour détecter un clic sur une arête
 
+# Rangées (dy, demi-largeur) du disque de clic d'un sommet, en pixels entiers
+_VERTEX_DISC_SPANS: Tuple[Tuple[int, int], ...] = tuple(
+    (dy, math.isqrt(VERTEX_CLICK_RADIUS * VERTEX_CLICK_RADIUS - dy * dy))
+    for dy in range(-VERTEX_CLICK_RADIUS, VERTEX_CLICK_RADIUS + 1)
+)
+
+# Taille des cellules de la grille de hachage spatial pour le hit-test.
+# Un hex (rayon HEX_SIZE), un sommet ou une arête touchés par un clic sont
+# toujours dans la cellule du clic ou l'une de ses 8 voisines.
+HIT_GRID_CELL_SIZE = HEX_SIZE
+
+# Attributs de BoardRenderer qui ne dépendent que de la géométrie du plateau
+# (positions des sommets, sommets des tuiles et des arêtes), jamais modifiés
+# après calcul : ils sont partagés entre tous les renderers de même géométrie.
+_SCREEN_GEOMETRY_FIELDS: Tuple[str, ...] = (
+    "_hex_coords",
+    "_hex_centers",
+    "_hex_bounds",
+    "_hex_local_polygons",
+    "_hex_inner_radius_sq",
+    "_vertex_screen_coords",
+    "_edge_screen_coords",
+    "_layer_bounds",
+    "_vertex_bins",
+    "_edge_bins",
+    "_tile_bins",
+    "_vertex_lookup",
+    "_edge_neighbourhoods",
+    "_tile_neighbourhoods",
+)
+_SCREEN_GEOMETRY_CACHE: Dict[Tuple[object, ...], Dict[str, object]] = {}
+
 
 class BoardRenderer:
     """Rendu du plateau et des pièces."""
@@ -87,6 +122,16 @@ class BoardRenderer:
     # Map player_id -> couleur
     _PLAYER_COLORS: List[Tuple[int, int, int]] = [COLOR_PLAYER_0, COLOR_PLAYER_1]
 
+    # Map type de port -> couleur du marqueur
+    _PORT_COLORS: Dict[str, Tuple[int, int, int]] = {
+        "ANY": (200, 200, 200),      # Gray for 3:1
+        "BRICK": (200, 80, 50),      # Brick red
+        "LUMBER": (80, 150, 60),     # Green
+        "WOOL": (180, 255, 180),     # Light green
+        "GRAIN": (240, 220, 100),    # Yellow
+        "ORE": (120, 120, 120),      # Dark gray
+    }
+
     def __init__(self, screen: pygame.Surface, board: Board) -> None:
         """Initialize renderer with pygame surface and game board.
 
@@ -97,17 +142,97 @@ class BoardRenderer:
         self.screen = screen
         self.board = board
 
+        # Géométrie écran : calculée pour la première partie, puis reprise telle
+        # quelle (seules ressources, numéros et voleur changent entre parties)
+        geometry_key = self._geometry_key(board)
+        shared_geometry = _SCREEN_GEOMETRY_CACHE.get(geometry_key)
+        if shared_geometry is None:
+            self._compute_screen_geometry()
+            _SCREEN_GEOMETRY_CACHE[geometry_key] = {
+                name: getattr(self, name) for name in _SCREEN_GEOMETRY_FIELDS
+            }
+        else:
+            for name, value in shared_geometry.items():
+                setattr(self, name, value)
+        self._robber_centers = self._robber_centers_for(board)
+
+        # Font for numbers (lazy init on first render)
+        self._font: Optional[pygame.font.Font] = None
+        self._small_font: Optional[pygame.font.Font] = None
+
+        # Couche statique du plateau (tuiles, numéros, ports), construite au
+        # premier rendu puis simplement blittée à chaque frame
+        self._board_surface: Optional[pygame.Surface] = None
+        self._board_surface_origin: Tuple[int, int] = (0, 0)
+        self._board_surface_key: Tuple[Tuple[object, ...], ...] = ()
+
+        # Couche des pièces posées, reconstruite seulement après une construction
+        self._pieces_surface: Optional[pygame.Surface] = None
+        self._pieces_surface_origin: Tuple[int, int] = (0, 0)
+        self._pieces_key_cached: Tuple[Tuple[Tuple[int, ...], ...], ...] = ()
+
+        # Jetons numérotés par valeur de dé, partagés entre tuiles et reconstructions
+        self._number_tokens: Dict[int, pygame.Surface] = {}
+        # Textes des ports (taux + initiale de la ressource) par type de port
+        self._port_labels: Dict[str, Tuple[pygame.Surface, Optional[pygame.Surface]]] = {}
+
+        # Sprites translucides de surbrillance, dessinés une seule fois
+        self._vertex_highlight_sprite: Optional[pygame.Surface] = None
+        self._tile_highlight_sprites: Dict[int, pygame.Surface] = {}
+        self._edge_highlight_sprites: Dict[
+            int, Tuple[pygame.Surface, Tuple[int, int]]
+        ] = {}
+        # Sprites de bâtiments par couleur de joueur
+        self._settlement_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self._city_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # Voleur : seul élément mobile de la couche plateau
+        self._robber_sprite: Optional[pygame.Surface] = None
+
+    @staticmethod
+    def _geometry_key(board: Board) -> Tuple[object, ...]:
+        """Signature de la géométrie du plateau (indépendante des ressources)."""
+        return (
+            tuple((vertex_id, vertex.position) for vertex_id, vertex in board.vertices.items()),
+            tuple((tile_id, tile.vertices) for tile_id, tile in board.tiles.items()),
+            tuple((edge_id, edge.vertices) for edge_id, edge in board.edges.items()),
+        )
+
+    def _compute_screen_geometry(self) -> None:
+        """Coordonnées écran et structures de hit-test du plateau courant."""
         # Precompute hex coordinates for all tiles
         self._hex_coords: Dict[int, List[Tuple[int, int]]] = {}
+        self._hex_centers: Dict[int, Tuple[int, int]] = {}
+        # Boîte englobante (origine, taille) et polygone local de chaque hex
+        self._hex_bounds: Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]] = {}
+        self._hex_local_polygons: Dict[int, List[Tuple[int, int]]] = {}
+        # Carré du rayon du disque inscrit (centre -> bord le plus proche) de chaque hex
+        self._hex_inner_radius_sq: Dict[int, float] = {}
         self._vertex_screen_coords: Dict[int, Tuple[int, int]] = {}
+        self._edge_screen_coords: Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]] = {}
         self._precompute_coordinates()
-
-        # Font for numbers (lazy init on first render)
-        self._font: Optional[pygame.font.Font] = None
+        self._layer_bounds = self._compute_layer_bounds()
+
+        # Grilles de hachage spatial (cellule -> ids) pour le hit-test
+        self._vertex_bins: Dict[Tuple[int, int], List[int]] = {}
+        self._edge_bins: Dict[Tuple[int, int], List[int]] = {}
+        self._tile_bins: Dict[Tuple[int, int], List[int]] = {}
+        self._build_hit_grids()
+        # Table pixel -> sommet (id + 1, 0 si aucun) sur la zone du plateau :
+        # un clic entier se résout en une seule indexation
+        self._vertex_lookup = self._build_vertex_lookup()
+        # Candidats pré-fusionnés (cellule + 8 voisines, triés) pour arêtes et tuiles
+        self._edge_neighbourhoods = self._build_neighbourhoods(self._edge_bins)
+        self._tile_neighbourhoods = self._build_neighbourhoods(self._tile_bins)
 
     def update_board(self, board: Board) -> None:
         """Met à jour le plateau rendu (utile pour déplacement du voleur)."""
         self.board = board
+        self._robber_centers = self._robber_centers_for(board)
+        if (
+            self._board_surface is not None
+            and self._static_board_key(board) != self._board_surface_key
+        ):
+            self._board_surface = None
 
     def _precompute_coordinates(self) -> None:
         """Precompute screen coordinates for all hexagons and vertices.
@@ -146,6 +271,83 @@ class BoardRenderer:
                     vertices.append(self._vertex_screen_coords[vid])
 
             self._hex_coords[tile_id] = vertices
+            if vertices:
+                self._hex_centers[tile_id] = (
+                    sum(v[0] for v in vertices) // len(vertices),
+                    sum(v[1] for v in vertices) // len(vertices),
+                )
+                min_x = min(v[0] for v in vertices)
+                min_y = min(v[1] for v in vertices)
+                width = max(v[0] for v in vertices) - min_x + 1
+                height = max(v[1] for v in vertices) - min_y + 1
+                self._hex_bounds[tile_id] = ((min_x, min_y), (width, height))
+                self._hex_local_polygons[tile_id] = [
+                    (vx - min_x, vy - min_y) for vx, vy in vertices
+                ]
+                center = self._hex_centers[tile_id]
+                self._hex_inner_radius_sq[tile_id] = min(
+                    self._point_to_segment_distance_sq(center, vertices[i - 1], vertices[i])
+                    for i in range(len(vertices))
+                )
+
+        # Extrémités écran de chaque arête (routes, surbrillances, hit-test)
+        for edge_id, edge in self.board.edges.items():
+            v1_id, v2_id = edge.vertices
+            if v1_id in self._vertex_screen_coords and v2_id in self._vertex_screen_coords:
+                self._edge_screen_coords[edge_id] = (
+                    self._vertex_screen_coords[v1_id],
+                    self._vertex_screen_coords[v2_id],
+                )
+
+    @staticmethod
+    def _cell_of(x: float, y: float) -> Tuple[int, int]:
+        return (int(x // HIT_GRID_CELL_SIZE), int(y // HIT_GRID_CELL_SIZE))
+
+    def _build_hit_grids(self) -> None:
+        """Range sommets, arêtes (milieu) et tuiles (centre) par cellule."""
+        for vertex_id, (x, y) in self._vertex_screen_coords.items():
+            self._vertex_bins.setdefault(self._cell_of(x, y), []).append(vertex_id)
+        for edge_id, ((x1, y1), (x2, y2)) in self._edge_screen_coords.items():
+            cell = self._cell_of((x1 + x2) / 2, (y1 + y2) / 2)
+            self._edge_bins.setdefault(cell, []).append(edge_id)
+        for tile_id, (x, y) in self._hex_centers.items():
+            self._tile_bins.setdefault(self._cell_of(x, y), []).append(tile_id)
+
+    def _build_vertex_lookup(self) -> array:
+        """Rastérise le disque de clic de chaque sommet dans une table plate."""
+        left, top, width, height = self._layer_bounds
+        lookup = array("H", [0]) * (width * height)
+        # Les disques de clic sont disjoints : pas de conflit à arbitrer
+        for vertex_id, (x, y) in self._vertex_screen_coords.items():
+            slot = array("H", [vertex_id + 1])
+            for dy, half_width in _VERTEX_DISC_SPANS:
+                row = y + dy - top
+                if not 0 <= row < height:
+                    continue
+                start = max(x - half_width - left, 0)
+                end = min(x + half_width - left + 1, width)
+                if start < end:
+                    offset = row * width
+                    lookup[offset + start : offset + end] = slot * (end - start)
+        return lookup
+
+    @staticmethod
+    def _build_neighbourhoods(
+        bins: Dict[Tuple[int, int], List[int]]
+    ) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+        """Pour chaque cellule, ids triés de la cellule et de ses 8 voisines."""
+        neighbourhoods: Dict[Tuple[int, int], List[int]] = {}
+        for (cx, cy), ids in bins.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    neighbourhoods.setdefault((cx + dx, cy + dy), []).extend(ids)
+        return {cell: tuple(sorted(ids)) for cell, ids in neighbourhoods.items()}
+
+    def _candidates(
+        self, neighbourhoods: Dict[Tuple[int, int], Tuple[int, ...]], pos: Tuple[float, float]
+    ) -> Tuple[int, ...]:
+        """Ids rangés dans la cellule de `pos` et ses 8 voisines, triés par id."""
+        return neighbourhoods.get(self._cell_of(pos[0], pos[1]), ())
 
     def _ensure_font(self) -> pygame.font.Font:
         """Lazy init font."""
@@ -154,73 +356,129 @@ class BoardRenderer:
             self._font = pygame.font.SysFont("Arial", 18, bold=True)
         return self._font
 
+    def _ensure_small_font(self) -> pygame.font.Font:
+        """Lazy init de la petite police (initiale de ressource des ports)."""
+        if self._small_font is None:
+            pygame.font.init()
+            self._small_font = pygame.font.SysFont("Arial", 10, bold=True)
+        return self._small_font
+
     def render_board(self) -> None:
         """Render the board: hexes, numbers, ports."""
+        if self._board_surface is None:
+            self._build_board_surface()
+        assert self._board_surface is not None
+        self.screen.blit(self._board_surface, self._board_surface_origin)
+
+        # Seul le voleur bouge : il est blitté par-dessus la couche statique
+        sprite = self._robber_sprite
+        if sprite is None:
+            size = 2 * ROBBER_RADIUS + 1
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = (ROBBER_RADIUS, ROBBER_RADIUS)
+            pygame.draw.circle(sprite, COLOR_ROBBER, center, ROBBER_RADIUS, width=0)
+            # Robber outline
+            pygame.draw.circle(sprite, (200, 200, 200), center, ROBBER_RADIUS, width=2)
+            self._robber_sprite = sprite
+        for x, y in self._robber_centers:
+            self.screen.blit(sprite, (x - ROBBER_RADIUS, y - ROBBER_RADIUS))
+
+    @property
+    def board_rect(self) -> pygame.Rect:
+        """Zone écran couverte par le plateau (tuiles, ports, pièces, surbrillances)."""
+        return pygame.Rect(self._layer_bounds)
+
+    def _robber_centers_for(self, board: Board) -> Tuple[Tuple[int, int], ...]:
+        """Position écran du voleur, recalculée seulement quand le plateau change."""
+        centers = []
+        for tile_id, tile in board.tiles.items():
+            if tile.has_robber:
+                center_x, center_y = self._hex_centers[tile_id]
+                centers.append((center_x, center_y + ROBBER_OFFSET_Y))
+        return tuple(centers)
+
+    def _compute_layer_bounds(self) -> Tuple[int, int, int, int]:
+        """Rectangle (left, top, width, height) des couches pré-rendues du plateau."""
+        xs = [x for x, _ in self._vertex_screen_coords.values()]
+        ys = [y for _, y in self._vertex_screen_coords.values()]
+        # Marge d'un hex : couvre les marqueurs de ports poussés vers l'extérieur
+        left = min(xs) - HEX_SIZE
+        top = min(ys) - HEX_SIZE
+        width = max(xs) - left + HEX_SIZE + 1
+        height = max(ys) - top + HEX_SIZE + 1
+        return left, top, width, height
+
+    def _build_board_surface(self) -> None:
+        """Pré-rend tuiles, numéros et ports dans une surface réutilisée à chaque frame."""
+        left, top, width, height = self._layer_bounds
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        def local(point: Tuple[int, int]) -> Tuple[int, int]:
+            return (point[0] - left, point[1] - top)
+
         for tile_id, tile in self.board.tiles.items():
-            vertices = self._hex_coords[tile_id]
-            center_x = sum(v[0] for v in vertices) // 6
-            center_y = sum(v[1] for v in vertices) // 6
+            vertices = [local(v) for v in self._hex_coords[tile_id]]
+            center = local(self._hex_centers[tile_id])
 
             # Fill hex with resource color
             color = self._RESOURCE_COLORS.get(tile.resource, COLOR_DESERT)
-            pygame.draw.polygon(self.screen, color, vertices)
+            pygame.draw.polygon(surface, color, vertices)
 
             # Draw border
-            pygame.draw.polygon(self.screen, (0, 0, 0), vertices, width=2)
+            pygame.draw.polygon(surface, (0, 0, 0), vertices, width=2)
 
             # Draw number (if not desert)
             if tile.pip is not None:
-                # Draw white circle background for better readability
-                pygame.draw.circle(self.screen, (255, 255, 255), (center_x, center_y), 16, width=0)
-                pygame.draw.circle(self.screen, (0, 0, 0), (center_x, center_y), 16, width=2)
-
-                # All numbers in black for better contrast
-                font = self._ensure_font()
-                text = font.render(str(tile.pip), True, (0, 0, 0))
-                text_rect = text.get_rect(center=(center_x, center_y))
-                self.screen.blit(text, text_rect)
-
-            # Draw robber if present
-            if tile.has_robber:
-                robber_center = (center_x, center_y + ROBBER_OFFSET_Y)
-                pygame.draw.circle(
-                    self.screen, COLOR_ROBBER, robber_center, 15, width=0
-                )
-                # Robber outline
-                pygame.draw.circle(
-                    self.screen, (200, 200, 200), robber_center, 15, width=2
-                )
+                token = self._number_token(tile.pip)
+                surface.blit(token, token.get_rect(center=center))
 
         # Draw ports (simple markers on edges)
-        self._render_ports()
+        self._render_ports(surface, (left, top))
+
+        self._board_surface = surface
+        self._board_surface_origin = (left, top)
+        self._board_surface_key = self._static_board_key(self.board)
+
+    def _number_token(self, pip: int) -> pygame.Surface:
+        """Jeton numéroté (disque blanc + numéro), rendu une fois par valeur de dé."""
+        token = self._number_tokens.get(pip)
+        if token is None:
+            radius = NUMBER_TOKEN_RADIUS
+            token = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            center = (radius, radius)
+            # Draw white circle background for better readability
+            pygame.draw.circle(token, (255, 255, 255), center, radius, width=0)
+            pygame.draw.circle(token, (0, 0, 0), center, radius, width=2)
+
+            # All numbers in black for better contrast
+            text = self._ensure_font().render(str(pip), True, (0, 0, 0))
+            token.blit(text, text.get_rect(center=center))
+            self._number_tokens[pip] = token
+        return token
 
-    def _render_ports(self) -> None:
+    @staticmethod
+    def _static_board_key(board: Board) -> Tuple[Tuple[object, ...], ...]:
+        """Signature de la partie statique du plateau (tuiles et ports, hors voleur)."""
+        return (
+            tuple((tile_id, tile.resource, tile.pip) for tile_id, tile in board.tiles.items()),
+            tuple((port.port_id, port.kind) for port in board.ports),
+        )
+
+    def _render_ports(self, surface: pygame.Surface, origin: Tuple[int, int]) -> None:
         """Draw port markers on corresponding edges.
 
         Ports are displayed as larger circles with resource type indicators,
         positioned slightly outside the edge to be more visible.
         """
         PORT_RADIUS = 18  # Larger radius for better visibility
-        PORT_OFFSET_FACTOR = 1.3  # Push port markers outward from center
-
-        # Map port types to colors for better recognition
-        PORT_COLORS = {
-            "ANY": (200, 200, 200),      # Gray for 3:1
-            "BRICK": (200, 80, 50),      # Brick red
-            "LUMBER": (80, 150, 60),     # Green
-            "WOOL": (180, 255, 180),     # Light green
-            "GRAIN": (240, 220, 100),    # Yellow
-            "ORE": (120, 120, 120),      # Dark gray
-        }
+        origin_x, origin_y = origin
 
         for port in self.board.ports:
-            # Get the two vertices of the port
-            v1_id, v2_id = port.vertices
-            if v1_id not in self._vertex_screen_coords or v2_id not in self._vertex_screen_coords:
+            endpoints = self._edge_screen_coords.get(port.edge_id)
+            if endpoints is None:
                 continue
-
-            v1_pos = self._vertex_screen_coords[v1_id]
-            v2_pos = self._vertex_screen_coords[v2_id]
+            v1_pos, v2_pos = endpoints
 
             # Calculate midpoint of the edge
             edge_mid_x = (v1_pos[0] + v2_pos[0]) / 2
@@ -247,85 +505,151 @@ class BoardRenderer:
                 # Fallback to edge midpoint
                 port_x = int(edge_mid_x)
                 port_y = int(edge_mid_y)
+            port_x -= origin_x
+            port_y -= origin_y
 
             # Draw port circle with resource-specific color
-            port_color = PORT_COLORS.get(port.kind, (255, 255, 255))
-            pygame.draw.circle(self.screen, port_color, (port_x, port_y), PORT_RADIUS, width=0)
-            pygame.draw.circle(self.screen, (0, 0, 0), (port_x, port_y), PORT_RADIUS, width=3)
-
-            # Draw port ratio text
-            font = self._ensure_font()
-            if port.kind == "ANY":
-                label = "3:1"
-            else:
-                label = f"2:1"
-
-            text = font.render(label, True, (0, 0, 0))
-            text_rect = text.get_rect(center=(port_x, port_y - 2))
-            self.screen.blit(text, text_rect)
-
-            # Draw small resource indicator for specific ports
-            if port.kind != "ANY":
-                small_font = pygame.font.SysFont("Arial", 10, bold=True)
-                res_text = small_font.render(port.kind[0], True, (0, 0, 0))
-                res_rect = res_text.get_rect(center=(port_x, port_y + 6))
-                self.screen.blit(res_text, res_rect)
+            port_color = self._PORT_COLORS.get(port.kind, (255, 255, 255))
+            pygame.draw.circle(surface, port_color, (port_x, port_y), PORT_RADIUS, width=0)
+            pygame.draw.circle(surface, (0, 0, 0), (port_x, port_y), PORT_RADIUS, width=3)
+
+            # Draw port ratio text, then the resource indicator for specific ports
+            text, res_text = self._port_label(port.kind)
+            surface.blit(text, text.get_rect(center=(port_x, port_y - 2)))
+            if res_text is not None:
+                surface.blit(res_text, res_text.get_rect(center=(port_x, port_y + 6)))
+
+    def _port_label(self, kind: str) -> Tuple[pygame.Surface, Optional[pygame.Surface]]:
+        """Textes d'un marqueur de port, rendus une fois par type de port."""
+        labels = self._port_labels.get(kind)
+        if labels is None:
+            label = "3:1" if kind == "ANY" else "2:1"
+            text = self._ensure_font().render(label, True, (0, 0, 0))
+            res_text = (
+                None
+                if kind == "ANY"
+                else self._ensure_small_font().render(kind[0], True, (0, 0, 0))
+            )
+            labels = (text, res_text)
+            self._port_labels[kind] = labels
+        return labels
 
     def render_pieces(self, state: GameState) -> None:
         """Render roads, settlements, and cities from game state.
 
+        Les pièces sont dessinées dans une couche réutilisée tant qu'aucune
+        construction n'a eu lieu.
+
         Args:
             state: current game state
         """
-        # Render roads
+        key = self._pieces_key(state)
+        if self._pieces_surface is None or key != self._pieces_key_cached:
+            self._build_pieces_surface(state)
+            self._pieces_key_cached = key
+        assert self._pieces_surface is not None
+        self.screen.blit(self._pieces_surface, self._pieces_surface_origin)
+
+    def board_content_key(self, state: GameState) -> Tuple[object, ...]:
+        """Signature de ce que render_board et render_pieces dessinent pour `state`.
+
+        Deux états de même signature produisent les mêmes pixels sur board_rect
+        (hors surbrillances) : une action sans effet sur le plateau (dés,
+        échange, fin de tour) n'oblige pas à le recomposer.
+        """
+        return (
+            self._static_board_key(self.board),
+            self._robber_centers,
+            self._pieces_key(state),
+        )
+
+    @staticmethod
+    def _pieces_key(state: GameState) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        """Signature des pièces posées (routes, colonies, villes) de chaque joueur."""
+        return tuple(
+            (tuple(player.roads), tuple(player.settlements), tuple(player.cities))
+            for player in state.players
+        )
+
+    def _build_pieces_surface(self, state: GameState) -> None:
+        """Pré-rend routes et bâtiments de tous les joueurs dans une couche transparente."""
+        left, top, width, height = self._layer_bounds
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        origin = (left, top)
+
+        ox, oy = origin
+        vertex_coords = self._vertex_screen_coords
+
         for player_id, player in enumerate(state.players):
             color = self._PLAYER_COLORS[player_id]
 
             for edge_id in player.roads:
-                self._draw_road(edge_id, color)
-
-            for vertex_id in player.settlements:
-                self._draw_settlement(vertex_id, color)
+                self._draw_road(surface, origin, edge_id, color)
+
+            # Bâtiments : sprites par couleur, blittés en un seul appel par joueur
+            settlement = self._settlement_sprite(color)
+            city = self._city_sprite(color)
+            settlement_half = SETTLEMENT_RADIUS
+            city_half = CITY_SIZE // 2
+            blits = [
+                (settlement, (x - ox - settlement_half, y - oy - settlement_half))
+                for x, y in (
+                    vertex_coords[vertex_id]
+                    for vertex_id in player.settlements
+                    if vertex_id in vertex_coords
+                )
+            ]
+            blits.extend(
+                (city, (x - ox - city_half, y - oy - city_half))
+                for x, y in (
+                    vertex_coords[vertex_id]
+                    for vertex_id in player.cities
+                    if vertex_id in vertex_coords
+                )
+            )
+            surface.blits(blits, doreturn=False)
 
-            for vertex_id in player.cities:
-                self._draw_city(vertex_id, color)
+        self._pieces_surface = surface
+        self._pieces_surface_origin = origin
 
-    def _draw_road(self, edge_id: int, color: Tuple[int, int, int]) -> None:
+    def _draw_road(
+        self,
+        surface: pygame.Surface,
+        origin: Tuple[int, int],
+        edge_id: int,
+        color: Tuple[int, int, int],
+    ) -> None:
         """Draw a road on the specified edge."""
-        edge = self.board.edges.get(edge_id)
-        if edge is None:
-            return
-
-        v1_id, v2_id = edge.vertices
-        if v1_id not in self._vertex_screen_coords or v2_id not in self._vertex_screen_coords:
-            return
-
-        v1_pos = self._vertex_screen_coords[v1_id]
-        v2_pos = self._vertex_screen_coords[v2_id]
-
-        pygame.draw.line(self.screen, color, v1_pos, v2_pos, width=ROAD_WIDTH)
-
-    def _draw_settlement(self, vertex_id: int, color: Tuple[int, int, int]) -> None:
-        """Draw a settlement at the specified vertex."""
-        if vertex_id not in self._vertex_screen_coords:
+        endpoints = self._edge_screen_coords.get(edge_id)
+        if endpoints is None:
             return
 
-        pos = self._vertex_screen_coords[vertex_id]
-        pygame.draw.circle(self.screen, color, pos, SETTLEMENT_RADIUS, width=0)
-        pygame.draw.circle(self.screen, (0, 0, 0), pos, SETTLEMENT_RADIUS, width=2)
-
-    def _draw_city(self, vertex_id: int, color: Tuple[int, int, int]) -> None:
-        """Draw a city at the specified vertex."""
-        if vertex_id not in self._vertex_screen_coords:
-            return
-
-        pos = self._vertex_screen_coords[vertex_id]
-
-        # Draw as a square
-        rect = pygame.Rect(0, 0, CITY_SIZE, CITY_SIZE)
-        rect.center = pos
-        pygame.draw.rect(self.screen, color, rect, width=0)
-        pygame.draw.rect(self.screen, (0, 0, 0), rect, width=2)
+        (x1, y1), (x2, y2) = endpoints
+        ox, oy = origin
+        pygame.draw.line(surface, color, (x1 - ox, y1 - oy), (x2 - ox, y2 - oy), width=ROAD_WIDTH)
+
+    def _settlement_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Colonie (disque cerclé de noir) pré-rendue une fois par couleur de joueur."""
+        sprite = self._settlement_sprites.get(color)
+        if sprite is None:
+            size = 2 * SETTLEMENT_RADIUS + 1
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = (SETTLEMENT_RADIUS, SETTLEMENT_RADIUS)
+            pygame.draw.circle(sprite, color, center, SETTLEMENT_RADIUS, width=0)
+            pygame.draw.circle(sprite, (0, 0, 0), center, SETTLEMENT_RADIUS, width=2)
+            self._settlement_sprites[color] = sprite
+        return sprite
+
+    def _city_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Ville (carré cerclé de noir) pré-rendue une fois par couleur de joueur."""
+        sprite = self._city_sprites.get(color)
+        if sprite is None:
+            sprite = pygame.Surface((CITY_SIZE, CITY_SIZE), pygame.SRCALPHA)
+            rect = sprite.get_rect()
+            pygame.draw.rect(sprite, color, rect, width=0)
+            pygame.draw.rect(sprite, (0, 0, 0), rect, width=2)
+            self._city_sprites[color] = sprite
+        return sprite
 
     def render_highlighted_vertices(self, vertex_ids: Set[int]) -> None:
         """Render highlighted vertices (for legal settlement placements).
@@ -333,23 +657,28 @@ class BoardRenderer:
         Args:
             vertex_ids: Set of vertex IDs to highlight
         """
-        for vertex_id in vertex_ids:
-            if vertex_id not in self._vertex_screen_coords:
-                continue
-
-            pos = self._vertex_screen_coords[vertex_id]
-
-            # Draw semi-transparent circle
-            # Create a temporary surface with alpha
+        sprite = self._vertex_highlight_sprite
+        if sprite is None:
             size = SETTLEMENT_RADIUS * 3
-            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
             pygame.draw.circle(
-                surf,
+                sprite,
                 COLOR_HIGHLIGHT_VERTEX,
                 (size // 2, size // 2),
                 SETTLEMENT_RADIUS + 5
             )
-            self.screen.blit(surf, (pos[0] - size // 2, pos[1] - size // 2))
+            self._vertex_highlight_sprite = sprite
+        half = sprite.get_width() // 2
+        vertex_coords = self._vertex_screen_coords
+
+        self.screen.blits(
+            [
+                (sprite, (vertex_coords[vertex_id][0] - half, vertex_coords[vertex_id][1] - half))
+                for vertex_id in vertex_ids
+                if vertex_id in vertex_coords
+            ],
+            doreturn=False,
+        )
 
     def render_highlighted_edges(self, edge_ids: Set[int]) -> None:
         """Render highlighted edges (for legal road placements).
@@ -357,26 +686,43 @@ class BoardRenderer:
         Args:
             edge_ids: Set of edge IDs to highlight
         """
+        blits = []
         for edge_id in edge_ids:
-            edge = self.board.edges.get(edge_id)
-            if edge is None:
-                continue
+            sprite = self._edge_highlight_sprites.get(edge_id)
+            if sprite is None:
+                endpoints = self._edge_screen_coords.get(edge_id)
+                if endpoints is None:
+                    continue
+                sprite = self._build_edge_highlight_sprite(endpoints)
+                self._edge_highlight_sprites[edge_id] = sprite
+            blits.append(sprite)
+        self.screen.blits(blits, doreturn=False)
 
-            v1_id, v2_id = edge.vertices
-            if v1_id not in self._vertex_screen_coords or v2_id not in self._vertex_screen_coords:
-                continue
-
-            v1_pos = self._vertex_screen_coords[v1_id]
-            v2_pos = self._vertex_screen_coords[v2_id]
+    @staticmethod
+    def _build_edge_highlight_sprite(
+        endpoints: Tuple[Tuple[int, int], Tuple[int, int]]
+    ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Trait épais d'une arête pré-rendu sur fond transparent par colorkey.
 
-            # Draw thicker semi-transparent line
-            pygame.draw.line(
-                self.screen,
-                (100, 255, 100),  # Bright green
-                v1_pos,
-                v2_pos,
-                width=ROAD_WIDTH + 4
-            )
+        Un trait opaque n'a pas besoin d'alpha par pixel : le colorkey encodé
+        en RLE se blitte bien plus vite que le tracé ou qu'un sprite SRCALPHA.
+        """
+        (x1, y1), (x2, y2) = endpoints
+        width = ROAD_WIDTH + 4
+        left = min(x1, x2) - width
+        top = min(y1, y2) - width
+        sprite = pygame.Surface((abs(x2 - x1) + 2 * width + 1, abs(y2 - y1) + 2 * width + 1))
+        sprite.fill((0, 0, 0))
+        # Draw thicker line
+        pygame.draw.line(
+            sprite,
+            (100, 255, 100),  # Bright green
+            (x1 - left, y1 - top),
+            (x2 - left, y2 - top),
+            width=width
+        )
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return sprite, (left, top)
 
     def get_vertex_at_position(self, pos: Tuple[int, int]) -> Optional[int]:
         """Find vertex ID at given screen position.
@@ -388,13 +734,31 @@ class BoardRenderer:
             Vertex ID if click is near a vertex, None otherwise
         """
         click_x, click_y = pos
-
-        for vertex_id, vertex_pos in self._vertex_screen_coords.items():
-            vx, vy = vertex_pos
-            distance = math.sqrt((click_x - vx) ** 2 + (click_y - vy) ** 2)
-
-            if distance <= VERTEX_CLICK_RADIUS:
-                return vertex_id
+        if isinstance(click_x, int) and isinstance(click_y, int):
+            left, top, width, height = self._layer_bounds
+            col = click_x - left
+            row = click_y - top
+            if 0 <= col < width and 0 <= row < height:
+                slot = self._vertex_lookup[row * width + col]
+                return slot - 1 if slot else None
+            return None
+
+        # Position non entière : parcours des cellules de la grille de hachage
+        max_distance_sq = VERTEX_CLICK_RADIUS * VERTEX_CLICK_RADIUS
+
+        # Les disques de clic sont disjoints : inutile de trier les candidats,
+        # on ne visite que les cellules (au plus 2x2) touchées par le disque.
+        min_cx, min_cy = self._cell_of(click_x - VERTEX_CLICK_RADIUS, click_y - VERTEX_CLICK_RADIUS)
+        max_cx, max_cy = self._cell_of(click_x + VERTEX_CLICK_RADIUS, click_y + VERTEX_CLICK_RADIUS)
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                for vertex_id in self._vertex_bins.get((cell_x, cell_y), ()):
+                    vx, vy = self._vertex_screen_coords[vertex_id]
+                    dx = click_x - vx
+                    dy = click_y - vy
+
+                    if dx * dx + dy * dy <= max_distance_sq:
+                        return vertex_id
 
         return None
 
@@ -402,9 +766,21 @@ class BoardRenderer:
         """Return the tile ID containing the given position, if any."""
 
         x, y = pos
+        hex_centers = self._hex_centers
+        inner_radius_sq = self._hex_inner_radius_sq
+
+        candidates = self._candidates(self._tile_neighbourhoods, pos)
+        # Dans le disque inscrit d'un hex convexe, le point y est forcément :
+        # une comparaison de carrés évite le test polygone dans le cas courant
+        for tile_id in candidates:
+            center_x, center_y = hex_centers[tile_id]
+            dx = x - center_x
+            dy = y - center_y
+            if dx * dx + dy * dy < inner_radius_sq[tile_id]:
+                return tile_id
 
-        for tile_id, vertices in self._hex_coords.items():
-            if self._point_in_polygon(x, y, vertices):
+        for tile_id in candidates:
+            if self._point_in_polygon(x, y, self._hex_coords[tile_id]):
                 return tile_id
 
         return None
@@ -416,24 +792,19 @@ class BoardRenderer:
             return
 
         for tile_id in tile_ids:
-            vertices = self._hex_coords.get(tile_id)
-            if not vertices:
-                continue
-
-            min_x = min(v[0] for v in vertices)
-            min_y = min(v[1] for v in vertices)
-            max_x = max(v[0] for v in vertices)
-            max_y = max(v[1] for v in vertices)
-
-            width = int(max_x - min_x) + 1
-            height = int(max_y - min_y) + 1
-            if width <= 0 or height <= 0:
+            bounds = self._hex_bounds.get(tile_id)
+            if bounds is None:
                 continue
 
-            surf = pygame.Surface((width, height), pygame.SRCALPHA)
-            local_vertices = [(vx - min_x, vy - min_y) for vx, vy in vertices]
-            pygame.draw.polygon(surf, COLOR_HIGHLIGHT_TILE, local_vertices)
-            self.screen.blit(surf, (min_x, min_y))
+            origin, size = bounds
+            sprite = self._tile_highlight_sprites.get(tile_id)
+            if sprite is None:
+                sprite = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.polygon(
+                    sprite, COLOR_HIGHLIGHT_TILE, self._hex_local_polygons[tile_id]
+                )
+                self._tile_highlight_sprites[tile_id] = sprite
+            self.screen.blit(sprite, origin)
 
     @staticmethod
     def _point_in_polygon(x: float, y: float, vertices: List[Tuple[int, int]]) -> bool:
@@ -468,32 +839,33 @@ class BoardRenderer:
             Edge ID if click is near an edge, None otherwise
         """
         click_x, click_y = pos
-
-        for edge_id, edge in self.board.edges.items():
-            v1_id, v2_id = edge.vertices
-            if v1_id not in self._vertex_screen_coords or v2_id not in self._vertex_screen_coords:
-                continue
-
-            v1_pos = self._vertex_screen_coords[v1_id]
-            v2_pos = self._vertex_screen_coords[v2_id]
-
-            # Calculate distance from point to line segment
-            distance = self._point_to_segment_distance(
+        max_distance_sq = EDGE_CLICK_DISTANCE * EDGE_CLICK_DISTANCE
+        best_edge: Optional[int] = None
+        best_distance_sq = max_distance_sq
+
+        # Près d'un sommet plusieurs arêtes sont à portée : on garde la plus proche
+        for edge_id in self._candidates(self._edge_neighbourhoods, pos):
+            v1_pos, v2_pos = self._edge_screen_coords[edge_id]
+            # Squared distance from point to line segment (no sqrt needed)
+            distance_sq = self._point_to_segment_distance_sq(
                 (click_x, click_y), v1_pos, v2_pos
             )
 
-            if distance <= EDGE_CLICK_DISTANCE:
-                return edge_id
+            if distance_sq <= max_distance_sq and (
+                best_edge is None or distance_sq < best_distance_sq
+            ):
+                best_edge = edge_id
+                best_distance_sq = distance_sq
 
-        return None
+        return best_edge
 
-    def _point_to_segment_distance(
-        self,
+    @staticmethod
+    def _point_to_segment_distance_sq(
         point: Tuple[int, int],
         seg_a: Tuple[int, int],
         seg_b: Tuple[int, int]
     ) -> float:
-        """Calculate distance from point to line segment.
+        """Calculate squared distance from point to line segment.
 
         Args:
             point: (x, y) coordinates of point
@@ -501,7 +873,7 @@ class BoardRenderer:
             seg_b: (x, y) coordinates of segment end
 
         Returns:
-            Distance from point to segment
+            Squared distance from point to segment
         """
         px, py = point
         ax, ay = seg_a
@@ -520,7 +892,7 @@ class BoardRenderer:
 
         if ab_squared == 0:
             # A and B are the same point
-            return math.sqrt(apx * apx + apy * apy)
+            return apx * apx + apy * apy
 
         # Project AP onto AB, computing parameterized position t
         t = max(0, min(1, (apx * abx + apy * aby) / ab_squared))
@@ -533,7 +905,7 @@ class BoardRenderer:
         dx = px - proj_x
         dy = py - proj_y
 
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
 
 
 __all__ = ["BoardRenderer", "SCREEN_WIDTH", "SCREEN_HEIGHT"]
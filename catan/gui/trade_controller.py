@@ -57,18 +57,16 @@ class TradeController:
         player = self.state.players[self.state.current_player_id]
         rates = {resource: 4 for resource in RESOURCE_TYPES}
 
-        owned_vertices = set(player.settlements) | set(player.cities)
-        if not owned_vertices:
-            return rates
-
+        port_kind_by_vertex = self.state.board.port_kind_by_vertex
         has_any_port = False
-        for port in self.state.board.ports:
-            if not any(vertex in owned_vertices for vertex in port.vertices):
+        for vertex in player.settlements + player.cities:
+            kind = port_kind_by_vertex.get(vertex)
+            if kind is None:
                 continue
-            if port.kind == "ANY":
+            if kind == "ANY":
                 has_any_port = True
             else:
-                rates[port.kind] = min(rates[port.kind], 2)
+                rates[kind] = min(rates[kind], 2)
 
         if has_any_port:
             for resource in RESOURCE_TYPES:
@@ -20,7 +20,7 @@ import pygame
 
 from catan.app.game_service import GameService
 from catan.engine.state import GameState, TurnSubPhase
-from catan.engine.actions import Action, RollDice, DiscardResources, MoveRobber
+from catan.engine.actions import Action, EndTurn, RollDice, DiscardResources, MoveRobber
 
 
 class TurnController:
@@ -68,6 +68,14 @@ class TurnController:
         """
         return not self.state.dice_rolled_this_turn
 
+    def can_end_turn(self) -> bool:
+        """Check if the current turn can be ended.
+
+        Returns:
+            True if EndTurn is among the legal actions
+        """
+        return EndTurn() in self._get_legal_actions()
+
     def handle_roll_dice(
         self,
         forced_value: Optional[int] = None,
@@ -90,25 +98,8 @@ class TurnController:
         if forced_dice is not None:
             dice_pair = forced_dice
         elif forced_value is not None:
-            # Convert total to a valid dice pair
-            # For example, 7 could be (3, 4), 2 is (1, 1), 12 is (6, 6)
-            if forced_value == 2:
-                dice_pair = (1, 1)
-            elif forced_value == 12:
-                dice_pair = (6, 6)
-            else:
-                # For other values, split evenly if possible
-                # e.g., 7 -> (3, 4), 8 -> (4, 4)
-                die1 = forced_value // 2
-                die2 = forced_value - die1
-                # Ensure both dice are in valid range [1, 6]
-                if die1 < 1:
-                    die1 = 1
-                    die2 = forced_value - 1
-                elif die2 > 6:
-                    die2 = 6
-                    die1 = forced_value - 6
-                dice_pair = (die1, die2)
+            # Répartition la plus équilibrée, e.g. 7 -> (3, 4), 8 -> (4, 4)
+            dice_pair = (forced_value // 2, forced_value - forced_value // 2)
 
         # Create and dispatch roll dice action
         action = RollDice(forced_value=dice_pair)
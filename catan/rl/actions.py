@@ -64,10 +64,7 @@ class ActionEncoder:
     def build_mask(self, state: GameState) -> np.ndarray:
         """Construit le masque booléen des actions légales."""
 
-        legal = state.legal_actions()
-        self._space.register(legal)
-        mask = self._space.mask(legal)
-        return np.array(mask, dtype=np.bool_)
+        return self._space.legal_mask(state.legal_actions())
 
     def decode(self, index: int, legal_actions: Iterable[Action]) -> Action:
         """Retrouve une action légale à partir de son index."""
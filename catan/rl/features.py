@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import weakref
 from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 import numpy as np
 
+from catan.engine.board import Board
 from catan.engine.state import (
     DEFAULT_DEV_DECK,
     DEV_CARD_TYPES,
@@ -25,9 +27,18 @@ _RESOURCE_TO_INDEX: Dict[str, int] = {
 _DEV_TO_INDEX: Dict[str, int] = {card: idx for idx, card in enumerate(DEV_CARD_TYPES)}
 _DEV_DECK_COUNTS = Counter(DEFAULT_DEV_DECK)
 _DEV_DECK_TOTAL = float(len(DEFAULT_DEV_DECK))
+# Nombre maximal d'exemplaires de chaque carte, dans l'ordre de DEV_CARD_TYPES
+_DEV_MAX_COUNTS: Tuple[float, ...] = tuple(
+    float(_DEV_DECK_COUNTS.get(card, 1)) for card in DEV_CARD_TYPES
+)
 _RESOURCE_NORMALIZER = 19.0
 _TURN_NORMALIZER = 200.0
 
+# Tenseur du plateau par objet Board : ressources et numéros ne changent pas
+# pour un plateau donné (un déplacement du voleur crée un nouveau Board).
+# Les tableaux sont partagés entre observations, donc en lecture seule.
+_BOARD_TENSORS: "weakref.WeakKeyDictionary[Board, np.ndarray]" = weakref.WeakKeyDictionary()
+
 
 @dataclass(frozen=True)
 class ObservationTensor:
@@ -87,7 +98,16 @@ def build_observation(
 
 
 def _encode_board(state: GameState) -> np.ndarray:
-    tiles = state.board.tiles
+    tensor = _BOARD_TENSORS.get(state.board)
+    if tensor is None:
+        tensor = _build_board_tensor(state.board)
+        tensor.setflags(write=False)
+        _BOARD_TENSORS[state.board] = tensor
+    return tensor
+
+
+def _build_board_tensor(board: Board) -> np.ndarray:
+    tiles = board.tiles
     num_tiles = max(tiles) + 1 if tiles else 0
     tensor = np.zeros((num_tiles, 6), dtype=np.float32)
     for tile_id, tile in tiles.items():
@@ -155,20 +175,18 @@ def _encode_dev_cards(state: GameState, current_player: int) -> np.ndarray:
     tensor = np.zeros((len(state.players), len(DEV_CARD_TYPES)), dtype=np.float32)
     for player_id, player in enumerate(state.players):
         ego_index = 0 if player_id == current_player else 1
-        for card in DEV_CARD_TYPES:
-            index = _DEV_TO_INDEX[card]
-            max_count = float(_DEV_DECK_COUNTS.get(card, 1))
+        for index, (card, max_count) in enumerate(zip(DEV_CARD_TYPES, _DEV_MAX_COUNTS)):
             count = player.dev_cards.get(card, 0) + player.new_dev_cards.get(card, 0)
             tensor[ego_index, index] = count / max_count
     return tensor
 
 
 def _encode_bank(state: GameState) -> np.ndarray:
-    tensor = np.zeros(len(RESOURCE_TYPES), dtype=np.float32)
-    for resource, index in _RESOURCE_TO_INDEX.items():
-        amount = state.bank_resources.get(resource, 0)
-        tensor[index] = amount / _RESOURCE_NORMALIZER
-    return tensor
+    bank = state.bank_resources
+    return np.array(
+        [bank.get(resource, 0) / _RESOURCE_NORMALIZER for resource in RESOURCE_TYPES],
+        dtype=np.float32,
+    )
 
 
 def _encode_metadata(state: GameState, current_player: int) -> np.ndarray:
@@ -186,20 +204,24 @@ def _encode_metadata(state: GameState, current_player: int) -> np.ndarray:
         8: Development deck remaining (normalized)
         9: Reserved for future use
     """
-    metadata = np.zeros(10, dtype=np.float32)
-    metadata[0] = 1.0 if state.phase == SetupPhase.SETUP_ROUND_1 else 0.0
-    metadata[1] = 1.0 if state.phase == SetupPhase.SETUP_ROUND_2 else 0.0
-    metadata[2] = 1.0 if state.phase == SetupPhase.PLAY else 0.0
-    metadata[3] = state.turn_number / _TURN_NORMALIZER
-    metadata[4] = _encode_owner_ego(state.longest_road_owner, current_player)
-    metadata[5] = _encode_owner_ego(state.largest_army_owner, current_player)
-
     opponent_id = 1 - current_player
-    metadata[6] = state.players[current_player].victory_points / VP_TO_WIN
-    metadata[7] = state.players[opponent_id].victory_points / VP_TO_WIN
-    metadata[8] = len(state.dev_deck) / _DEV_DECK_TOTAL
-    # metadata[9] reserved
-    return metadata
+    # Valeurs calculées en flottants Python puis converties en un seul appel,
+    # plutôt que dix écritures scalaires dans le tableau numpy
+    return np.array(
+        (
+            1.0 if state.phase == SetupPhase.SETUP_ROUND_1 else 0.0,
+            1.0 if state.phase == SetupPhase.SETUP_ROUND_2 else 0.0,
+            1.0 if state.phase == SetupPhase.PLAY else 0.0,
+            state.turn_number / _TURN_NORMALIZER,
+            _encode_owner_ego(state.longest_road_owner, current_player),
+            _encode_owner_ego(state.largest_army_owner, current_player),
+            state.players[current_player].victory_points / VP_TO_WIN,
+            state.players[opponent_id].victory_points / VP_TO_WIN,
+            len(state.dev_deck) / _DEV_DECK_TOTAL,
+            0.0,  # metadata[9] reserved
+        ),
+        dtype=np.float32,
+    )
 
 
 def _encode_owner_ego(owner_id: int | None, current_player: int) -> float:
@@ -221,7 +243,4 @@ def _encode_legal_actions(
         return action_encoder.build_mask(state)
 
     space = action_space or ActionSpace(build_default_action_catalog(state.board))
-    legal_actions = state.legal_actions()
-    space.register(legal_actions)
-    mask = space.mask(legal_actions)
-    return np.array(mask, dtype=np.bool_)
+    return space.legal_mask(state.legal_actions())
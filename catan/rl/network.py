@@ -154,10 +154,9 @@ class CatanPolicyValueNetwork(nn.Module):
         Returns:
             probs: (B, action_size) distribution de probabilité normalisée
         """
-        # Remplacer les logits des actions illégales par -inf
-        masked_logits = torch.where(
-            mask, logits / temperature, torch.tensor(float("-inf"), device=logits.device)
-        )
+        # Remplacer les logits des actions illégales par -inf (scalaire Python :
+        # pas de tenseur 0-d alloué à chaque appel)
+        masked_logits = torch.where(mask, logits / temperature, float("-inf"))
 
         # Appliquer softmax
         probs = torch.softmax(masked_logits, dim=-1)
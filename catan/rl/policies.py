@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+import weakref
 from dataclasses import dataclass
 from typing import Dict, Mapping, MutableMapping, Optional, Sequence
 
@@ -30,6 +31,10 @@ from catan.engine.state import GameState, Player, SetupPhase, TurnSubPhase, RESO
 ResourceMap = Mapping[str, int]
 MutableResourceMap = MutableMapping[str, int]
 
+# Valeur heuristique de chaque sommet (somme des pips adjacents) par objet Board :
+# les pips ne changent pas pour un plateau donné (cf. catan.rl.features).
+_VERTEX_VALUES: "weakref.WeakKeyDictionary[Board, Dict[int, float]]" = weakref.WeakKeyDictionary()
+
 
 class AgentPolicy:
     """Interface minimale utilisée par la simulation headless."""
@@ -141,8 +146,15 @@ class HeuristicPolicy(AgentPolicy):
 
     @staticmethod
     def _vertex_value(board: Board, vertex_id: int) -> float:
-        vertex = board.vertices[vertex_id]
-        return sum((board.tiles[tile_id].pip or 0.0) for tile_id in vertex.adjacent_tiles)
+        values = _VERTEX_VALUES.get(board)
+        if values is None:
+            tiles = board.tiles
+            values = {
+                vid: sum((tiles[tile_id].pip or 0.0) for tile_id in vertex.adjacent_tiles)
+                for vid, vertex in board.vertices.items()
+            }
+            _VERTEX_VALUES[board] = values
+        return values[vertex_id]
 
     def _road_value(self, board: Board, edge_id: int) -> float:
         edge = board.edges[edge_id]
@@ -277,7 +289,7 @@ class HeuristicPolicy(AgentPolicy):
         steal_bonus = 0.0
         if action.steal_from is not None:
             victim = context.state.players[action.steal_from]
-            steal_bonus = sum(victim.resources.values()) * 2.0
+            steal_bonus = victim.total_resources() * 2.0
         return pip_value * 5.0 + steal_bonus
 
     def _score_trade_response(self, context: _HeuristicContext, action: Action) -> float:
@@ -9,9 +9,12 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import combinations, combinations_with_replacement
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
+
 from catan.engine.actions import (
     AcceptPlayerTrade,
     Action,
@@ -35,9 +38,17 @@ from catan.engine.serialize import snapshot_to_state, state_to_snapshot
 ActionKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
 
 
+# Champs des dataclasses d'actions, par classe (dataclasses.fields est coûteux)
+_ACTION_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+# Types déjà hashables et immuables, renvoyés tels quels par _normalize_value
+_SCALAR_TYPES = frozenset({int, str, bool, float, type(None)})
+
+
 def _normalize_value(value: Any) -> Any:
     """Transforme récursivement une valeur potentiellement mutable en forme hashable."""
 
+    if value.__class__ in _SCALAR_TYPES:
+        return value
     if isinstance(value, dict):
         return tuple(sorted((k, _normalize_value(v)) for k, v in value.items()))
     if isinstance(value, list):
@@ -50,12 +61,13 @@ def _normalize_value(value: Any) -> Any:
 def _action_key(action: Action) -> ActionKey:
     """Crée une clé hashable pour un objet Action."""
 
-    fields = dataclasses.fields(action)
-    payload = tuple(
-        (field.name, _normalize_value(getattr(action, field.name)))
-        for field in fields
-    )
-    return (action.__class__.__name__, payload)
+    action_cls = action.__class__
+    field_names = _ACTION_FIELD_NAMES.get(action_cls)
+    if field_names is None:
+        field_names = tuple(field.name for field in dataclasses.fields(action))
+        _ACTION_FIELD_NAMES[action_cls] = field_names
+    payload = tuple((name, _normalize_value(getattr(action, name))) for name in field_names)
+    return (action_cls.__name__, payload)
 
 
 class ActionSpace:
@@ -86,6 +98,33 @@ class ActionSpace:
             self._keys.append(key)
             self._key_to_index[key] = index
 
+    def register_indices(self, actions: Iterable[Action]) -> np.ndarray:
+        """Enregistre les actions manquantes et renvoie leurs index, en un passage."""
+
+        indices: List[int] = []
+        for action in actions:
+            key = _action_key(action)
+            index = self._key_to_index.get(key)
+            if index is None:
+                index = len(self._catalog)
+                self._catalog.append(action)
+                self._keys.append(key)
+                self._key_to_index[key] = index
+            indices.append(index)
+        return np.array(indices, dtype=np.intp)
+
+    def legal_mask(self, legal_actions: Iterable[Action]) -> np.ndarray:
+        """Enregistre les actions légales et renvoie le masque numpy correspondant.
+
+        Une seule clé par action légale puis une écriture groupée dans le
+        masque, au lieu d'un parcours de tout le catalogue.
+        """
+
+        indices = self.register_indices(legal_actions)
+        mask = np.zeros(len(self._catalog), dtype=np.bool_)
+        mask[indices] = True
+        return mask
+
     def mask(self, legal_actions: Iterable[Action]) -> List[bool]:
         """Construit le masque booléen aligné sur le catalogue courant."""
 
@@ -197,6 +236,13 @@ def build_default_action_catalog(board: Board | None = None) -> List[Action]:
     return catalog
 
 
+@lru_cache(maxsize=None)
+def _zero_reward(num_players: int) -> Tuple[float, ...]:
+    """Récompense nulle partagée (tuple immuable) pour un nombre de joueurs."""
+
+    return (0.0,) * num_players
+
+
 @dataclass(frozen=True)
 class StepResult:
     """Résultat d'un appel à HeadlessEnv.step()."""
@@ -221,7 +267,10 @@ class HeadlessEnv:
         self._base_catalog = (
             list(action_catalog) if action_catalog is not None else build_default_action_catalog()
         )
-        self._action_space = ActionSpace(self._base_catalog)
+        # Espace de base indexé une seule fois : reset() en repart par copie
+        # plutôt que de recalculer la clé des milliers d'actions du catalogue
+        self._base_space = ActionSpace(self._base_catalog)
+        self._action_space = self._base_space.copy()
 
     @property
     def state(self) -> GameState:
@@ -253,7 +302,7 @@ class HeadlessEnv:
             self._state = GameState.new_1v1_game(seed=effective_seed)
 
         # Réinitialiser l'espace d'actions
-        self._action_space = ActionSpace(self._base_catalog)
+        self._action_space = self._base_space.copy()
         if action_catalog:
             self._action_space.register(action_catalog)
         self._action_space.register(self._state.legal_actions())
@@ -267,22 +316,18 @@ class HeadlessEnv:
     def legal_actions_mask(self) -> List[bool]:
         """Retourne un masque booléen aligné sur le catalogue courant."""
 
-        legal = self.state.legal_actions()
-        self._action_space.register(legal)
-        return self._action_space.mask(legal)
+        return self._action_space.legal_mask(self.state.legal_actions()).tolist()
 
     def step(self, action: Action) -> StepResult:
         """Applique une action et renvoie le résultat."""
 
-        current_state = self.state
-        if not current_state.is_action_legal(action):
-            raise ValueError(f"Action illégale: {action}")
-
-        new_state = current_state.apply_action(action)
+        # apply_action valide déjà l'action (même ValueError) : pas de second
+        # passage par is_action_legal sur le chemin chaud
+        new_state = self.state.apply_action(action)
         self._state = new_state
         self._action_space.register(new_state.legal_actions())
 
-        reward = tuple(0.0 for _ in new_state.players)
+        reward = _zero_reward(len(new_state.players))
         done = new_state.is_game_over
         info = {"last_action": action}
 
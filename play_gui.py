@@ -18,12 +18,15 @@ Raccourcis clavier principaux:
 from __future__ import annotations
 
 import sys
-from typing import Dict, Tuple, Iterable, Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Tuple, Optional
 
 import pygame
 
 from catan.app.game_service import GameService
-from catan.gui.app import CatanH2HApp, DiscardPrompt, BankTradePrompt, YearOfPlentyPrompt
+from catan.engine.state import RESOURCE_TYPES
+from catan.gui.app import CatanH2HApp, DiscardPrompt, BankTradePrompt, UIState, YearOfPlentyPrompt
 from catan.gui.hud_controller import PlayerPanel
 from catan.gui.renderer import (
     COLOR_BG,
@@ -50,6 +53,304 @@ KEY_BINDINGS: Tuple[Tuple[str, int, str], ...] = (
     ("BACKSPACE", pygame.K_BACKSPACE, "cancel"),
 )
 
+# Index touche -> action pour le traitement des KEYDOWN
+_KEY_TO_ACTION: Dict[int, str] = {key: action for _, key, action in KEY_BINDINGS}
+
+# Modes annulés par ESC (sinon ESC quitte la partie)
+_ESCAPE_CANCEL_MODES = frozenset({"build_road", "build_settlement", "build_city", "move_robber"})
+
+# Nombre de surfaces de texte conservées : les lignes de statut changent au fil
+# de la partie, le cache doit rester borné (éviction de la moins récente)
+TEXT_CACHE_SIZE = 256
+
+# Libellés des ressources dans les panneaux modaux (défausse, banque, Invention)
+_RESOURCE_LABELS: Dict[str, str] = {resource: resource.title() for resource in RESOURCE_TYPES}
+# Libellés raccourcis des boutons "Ressource à recevoir"
+_RESOURCE_SHORT_LABELS: Dict[str, str] = {
+    resource: resource[:4].upper() for resource in RESOURCE_TYPES
+}
+
+# Évènements fenêtre nécessitant un rafraîchissement (exposition, redimensionnement)
+_REDRAW_EVENTS = frozenset(
+    getattr(pygame, name)
+    for name in ("VIDEOEXPOSE", "VIDEORESIZE", "WINDOWEXPOSED", "WINDOWRESTORED")
+    if hasattr(pygame, name)
+)
+
+# Types d'évènements lus par la boucle principale ; tous les autres sont bloqués
+_HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, *_REDRAW_EVENTS]
+
+
+def merge_overlapping(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Fusionne les rectangles qui se chevauchent (une recomposition par zone)."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def build_bank_trade_layout(prompt: BankTradePrompt) -> Dict[str, object]:
+    panel_width = 480
+    padding = 16
+    row_height = 42
+
+    # Section "Donner" : 5 ressources + titre
+    give_section_height = padding + 30 + len(prompt.resource_order) * row_height
+
+    # Section "Recevoir" : 5 boutons + titre
+    receive_section_height = padding + 30 + 50
+
+    # Section boutons
+    buttons_section_height = 60
+
+    panel_height = give_section_height + receive_section_height + buttons_section_height + padding
+
+    panel_rect = pygame.Rect(
+        SCREEN_WIDTH // 2 - panel_width // 2,
+        SCREEN_HEIGHT // 2 - panel_height // 2,
+        panel_width,
+        panel_height,
+    )
+
+    # Section "Donner"
+    give_title_pos = (panel_rect.left + 16, panel_rect.top + padding)
+    give_rows = []
+    for idx, resource in enumerate(prompt.resource_order):
+        row_top = panel_rect.top + padding + 30 + idx * row_height
+        label_pos = (panel_rect.left + 16, row_top + 8)
+        minus_rect = pygame.Rect(panel_rect.left + panel_width - 100, row_top + 4, 32, 32)
+        plus_rect = pygame.Rect(panel_rect.left + panel_width - 60, row_top + 4, 32, 32)
+        give_rows.append(
+            {
+                "resource": resource,
+                "label_pos": label_pos,
+                "minus_rect": minus_rect,
+                "plus_rect": plus_rect,
+            }
+        )
+
+    # Section "Recevoir"
+    receive_title_pos = (panel_rect.left + 16, panel_rect.top + give_section_height + padding)
+    receive_buttons = []
+    button_width = 80
+    button_spacing = 8
+    receive_buttons_top = panel_rect.top + give_section_height + padding + 30
+    for idx, resource in enumerate(prompt.resource_order):
+        button_rect = pygame.Rect(
+            panel_rect.left + 16 + idx * (button_width + button_spacing),
+            receive_buttons_top,
+            button_width,
+            36,
+        )
+        receive_buttons.append({"resource": resource, "rect": button_rect})
+
+    # Boutons Valider/Annuler
+    confirm_rect = pygame.Rect(
+        panel_rect.left + 16,
+        panel_rect.bottom - buttons_section_height + 12,
+        180,
+        40,
+    )
+    cancel_rect = pygame.Rect(
+        confirm_rect.right + 12,
+        confirm_rect.top,
+        180,
+        40,
+    )
+
+    return {
+        "panel_rect": panel_rect,
+        "give_title_pos": give_title_pos,
+        "give_rows": give_rows,
+        "receive_title_pos": receive_title_pos,
+        "receive_buttons": receive_buttons,
+        "confirm_rect": confirm_rect,
+        "cancel_rect": cancel_rect,
+    }
+
+
+# La géométrie du panneau de défausse ne dépend que de l'ordre des
+# ressources : construite une fois à l'entrée en défausse, puis réutilisée
+# à chaque +/- (qui ne change que la sélection)
+_DISCARD_LAYOUT_CACHE: Dict[Tuple[str, ...], Dict[str, object]] = {}
+
+
+def build_discard_layout(prompt: DiscardPrompt) -> Dict[str, object]:
+    layout = _DISCARD_LAYOUT_CACHE.get(prompt.resource_order)
+    if layout is None:
+        layout = _compute_discard_layout(prompt.resource_order)
+        _DISCARD_LAYOUT_CACHE[prompt.resource_order] = layout
+    return layout
+
+
+def _compute_discard_layout(resource_order: Tuple[str, ...]) -> Dict[str, object]:
+    panel_width = 360
+    row_height = 42
+    padding = 16
+    rows_count = len(resource_order)
+    panel_height = padding * 2 + rows_count * row_height + 70
+
+    panel_rect = pygame.Rect(40, SCREEN_HEIGHT - panel_height - 40, panel_width, panel_height)
+
+    rows = []
+    # Cibles de clic à plat (rect, ressource, delta) : un simple parcours
+    buttons: List[Tuple[pygame.Rect, str, int]] = []
+    for idx, resource in enumerate(resource_order):
+        row_top = panel_rect.top + padding + idx * row_height
+        label_pos = (panel_rect.left + 16, row_top + 8)
+        minus_rect = pygame.Rect(panel_rect.left + 220, row_top + 4, 32, 32)
+        plus_rect = pygame.Rect(panel_rect.left + 260, row_top + 4, 32, 32)
+        rows.append(
+            {
+                "resource": resource,
+                "label_pos": label_pos,
+                "minus_rect": minus_rect,
+                "plus_rect": plus_rect,
+            }
+        )
+        buttons.append((minus_rect, resource, -1))
+        buttons.append((plus_rect, resource, 1))
+
+    confirm_rect = pygame.Rect(panel_rect.left + 16, panel_rect.bottom - 56, 140, 36)
+    reset_rect = pygame.Rect(confirm_rect.right + 12, confirm_rect.top, 140, 36)
+
+    return {
+        "panel_rect": panel_rect,
+        "rows": rows,
+        "buttons": buttons,
+        "confirm_rect": confirm_rect,
+        "reset_rect": reset_rect,
+    }
+
+
+def build_year_of_plenty_layout(prompt: YearOfPlentyPrompt) -> Dict[str, object]:
+    panel_width = 380
+    row_height = 42
+    padding = 16
+    rows_count = len(prompt.resource_order)
+    panel_height = padding * 3 + 30 + rows_count * row_height + 60
+
+    panel_rect = pygame.Rect(
+        SCREEN_WIDTH // 2 - panel_width // 2,
+        SCREEN_HEIGHT // 2 - panel_height // 2,
+        panel_width,
+        panel_height,
+    )
+
+    rows = []
+    for idx, resource in enumerate(prompt.resource_order):
+        row_top = panel_rect.top + padding + 30 + idx * row_height
+        label_pos = (panel_rect.left + 16, row_top + 8)
+        minus_rect = pygame.Rect(panel_rect.left + 250, row_top + 4, 32, 32)
+        plus_rect = pygame.Rect(panel_rect.left + 290, row_top + 4, 32, 32)
+        rows.append(
+            {
+                "resource": resource,
+                "label_pos": label_pos,
+                "minus_rect": minus_rect,
+                "plus_rect": plus_rect,
+            }
+        )
+
+    confirm_rect = pygame.Rect(panel_rect.left + 16, panel_rect.bottom - 56, 160, 40)
+    reset_rect = pygame.Rect(confirm_rect.right + 12, confirm_rect.top, 160, 40)
+
+    return {
+        "panel_rect": panel_rect,
+        "rows": rows,
+        "confirm_rect": confirm_rect,
+        "reset_rect": reset_rect,
+    }
+
+
+def hud_content_key(state: UIState) -> Tuple[object, ...]:
+    # Seuls champs de ui_state lus par build_hud_blits
+    return (
+        state.instructions,
+        state.buttons,
+        state.last_dice_roll,
+        state.dice_rolled_this_turn,
+    )
+
+
+def build_modal_layouts(
+    state: UIState,
+) -> Tuple[Optional[Dict[str, object]], Optional[Dict[str, object]], Optional[Dict[str, object]]]:
+    """Layouts des panneaux modaux (défausse, échange banque, Invention) du mode courant."""
+    discard = (
+        build_discard_layout(state.discard_prompt)
+        if state.mode == "discard" and state.discard_prompt
+        else None
+    )
+    bank_trade = (
+        build_bank_trade_layout(state.bank_trade_prompt)
+        if state.mode == "bank_trade" and state.bank_trade_prompt
+        else None
+    )
+    year_of_plenty = (
+        build_year_of_plenty_layout(state.year_of_plenty_prompt)
+        if state.mode == "year_of_plenty" and state.year_of_plenty_prompt
+        else None
+    )
+    return discard, bank_trade, year_of_plenty
+
+
+def build_modal_buttons(
+    app: CatanH2HApp,
+    discard: Optional[Dict[str, object]],
+    bank_trade: Optional[Dict[str, object]],
+    year_of_plenty: Optional[Dict[str, object]],
+) -> List[Tuple[pygame.Rect, Callable[[], bool]]]:
+    """Zones cliquables des panneaux modaux, dans l'ordre de priorité des clics.
+
+    Construites avec les layouts (donc avec ui_state) : un clic ne fait
+    qu'un parcours de cette liste et appelle la commande associée.
+    """
+    buttons: List[Tuple[pygame.Rect, Callable[[], bool]]] = []
+    if year_of_plenty:
+        for row in year_of_plenty["rows"]:  # type: ignore[attr-defined]
+            resource = row["resource"]
+            buttons.append(
+                (row["minus_rect"], partial(app.adjust_year_of_plenty_selection, resource, -1))
+            )
+            buttons.append(
+                (row["plus_rect"], partial(app.adjust_year_of_plenty_selection, resource, 1))
+            )
+        buttons.append((year_of_plenty["confirm_rect"], app.confirm_year_of_plenty_selection))
+        buttons.append((year_of_plenty["reset_rect"], app.reset_year_of_plenty_selection))
+    if bank_trade:
+        for row in bank_trade["give_rows"]:  # type: ignore[attr-defined]
+            resource = row["resource"]
+            buttons.append((row["minus_rect"], partial(app.adjust_bank_trade_give, resource, -1)))
+            buttons.append((row["plus_rect"], partial(app.adjust_bank_trade_give, resource, 1)))
+        for button_info in bank_trade["receive_buttons"]:  # type: ignore[attr-defined]
+            buttons.append(
+                (
+                    button_info["rect"],
+                    partial(app.select_bank_trade_receive, button_info["resource"]),
+                )
+            )
+        buttons.append((bank_trade["confirm_rect"], app.confirm_bank_trade_selection))
+        buttons.append((bank_trade["cancel_rect"], partial(app.trigger_action, "cancel")))
+    if discard:
+        for rect, resource, delta in discard["buttons"]:  # type: ignore[attr-defined]
+            buttons.append((rect, partial(app.adjust_discard_selection, resource, delta)))
+        buttons.append((discard["confirm_rect"], app.confirm_discard_selection))
+        buttons.append((discard["reset_rect"], app.reset_discard_selection))
+    return buttons  # type: ignore[return-value]
+
+
+def modal_command_at(
+    buttons: List[Tuple[pygame.Rect, Callable[[], bool]]], pos: Tuple[int, int]
+) -> Optional[Callable[[], bool]]:
+    """Commande du premier bouton modal sous le curseur (ordre de priorité)."""
+    return next((command for rect, command in buttons if rect.collidepoint(pos)), None)
+
 
 def main() -> int:
     import argparse
@@ -71,6 +372,10 @@ def main() -> int:
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("CatanBot — GUI H2H (prototype)")
+    # Seuls les évènements traités par la boucle entrent dans la file : pas de
+    # survol, donc pas de MOUSEMOTION (des centaines par seconde) à ignorer un par un.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(_HANDLED_EVENTS)
 
     app = CatanH2HApp(game_service=GameService(), screen=screen)
     app.start_new_game(
@@ -82,6 +387,44 @@ def main() -> int:
     font = pygame.font.SysFont("Arial", 20, bold=True)
     small_font = pygame.font.SysFont("Arial", 16)
 
+    # Surfaces de texte déjà rastérisées, indexées par (police, texte, couleur),
+    # de la moins à la plus récemment utilisée
+    text_cache: OrderedDict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = OrderedDict()
+
+    def render_text(
+        text_font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        key = (id(text_font), text, color)
+        surface = text_cache.get(key)
+        if surface is None:
+            surface = text_font.render(text, True, color)
+            text_cache[key] = surface
+            if len(text_cache) > TEXT_CACHE_SIZE:
+                text_cache.popitem(last=False)
+        else:
+            text_cache.move_to_end(key)
+        return surface
+
+    # Lignes "Res: ..." des panneaux joueurs, indexées par les quantités dans
+    # l'ordre de RESOURCE_TYPES (la main change rarement d'une frame à l'autre)
+    resource_lines_cache: Dict[Tuple[int, ...], Tuple[str, Optional[str]]] = {}
+
+    def resource_lines(resources: Dict[str, int]) -> Tuple[str, Optional[str]]:
+        counts = tuple(resources.get(res, 0) for res in RESOURCE_TYPES)
+        lines = resource_lines_cache.get(counts)
+        if lines is None:
+            res_list = [
+                f"{res}:{count}" for res, count in zip(RESOURCE_TYPES, counts) if count > 0
+            ]
+            if not res_list:
+                lines = ("Res: Aucune", None)
+            else:
+                # Première ligne : 3 premières ressources, la suite en dessous
+                second = f"     {', '.join(res_list[3:])}" if len(res_list) > 3 else None
+                lines = (f"Res: {', '.join(res_list[:3])}", second)
+            resource_lines_cache[counts] = lines
+        return lines
+
     def format_resource_summary(resources: Dict[str, int]) -> str:
         parts = [f"{res}:{count}" for res, count in resources.items() if count > 0]
         return ", ".join(parts) if parts else "Aucune"
@@ -90,174 +433,68 @@ def main() -> int:
         parts = [f"{card}:{count}" for card, count in cards.items() if count > 0]
         return ", ".join(parts) if parts else "Aucune"
 
-    def build_bank_trade_layout(prompt: BankTradePrompt) -> Dict[str, object]:
-        panel_width = 480
-        padding = 16
-        row_height = 42
-
-        # Section "Donner" : 5 ressources + titre
-        give_section_height = padding + 30 + len(prompt.resource_order) * row_height
-
-        # Section "Recevoir" : 5 boutons + titre
-        receive_section_height = padding + 30 + 50
-
-        # Section boutons
-        buttons_section_height = 60
-
-        panel_height = give_section_height + receive_section_height + buttons_section_height + padding
+    def build_hud_blits(state: UIState) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        # Instructions
+        blits = [(render_text(font, state.instructions, (255, 255, 255)), (20, 20))]
 
-        panel_rect = pygame.Rect(
-            SCREEN_WIDTH // 2 - panel_width // 2,
-            SCREEN_HEIGHT // 2 - panel_height // 2,
-            panel_width,
-            panel_height,
-        )
+        # Tableau des actions disponibles
+        y_offset = 60
+        for label, key, action in KEY_BINDINGS:
+            button_state = state.buttons.get(action)
+            enabled = button_state.enabled if button_state else False
+            text = f"[{label}] {button_state.label if button_state else action}"
+            color = (200, 255, 200) if enabled else (120, 120, 120)
+            blits.append((render_text(small_font, text, color), (20, y_offset)))
+            y_offset += 24
 
-        # Section "Donner"
-        give_title_pos = (panel_rect.left + 16, panel_rect.top + padding)
-        give_rows = []
-        for idx, resource in enumerate(prompt.resource_order):
-            row_top = panel_rect.top + padding + 30 + idx * row_height
-            label_pos = (panel_rect.left + 16, row_top + 8)
-            minus_rect = pygame.Rect(panel_rect.left + panel_width - 100, row_top + 4, 32, 32)
-            plus_rect = pygame.Rect(panel_rect.left + panel_width - 60, row_top + 4, 32, 32)
-            give_rows.append(
-                {
-                    "resource": resource,
-                    "label_pos": label_pos,
-                    "minus_rect": minus_rect,
-                    "plus_rect": plus_rect,
-                }
-            )
+        # Dernier lancer de dés
+        if state.last_dice_roll is not None:
+            dice_text = f"Dernier lancer: {state.last_dice_roll}"
+        else:
+            dice_text = "Dernier lancer: —"
 
-        # Section "Recevoir"
-        receive_title_pos = (panel_rect.left + 16, panel_rect.top + give_section_height + padding)
-        receive_buttons = []
-        button_width = 80
-        button_spacing = 8
-        receive_buttons_top = panel_rect.top + give_section_height + padding + 30
-        for idx, resource in enumerate(prompt.resource_order):
-            button_rect = pygame.Rect(
-                panel_rect.left + 16 + idx * (button_width + button_spacing),
-                receive_buttons_top,
-                button_width,
-                36,
-            )
-            receive_buttons.append({"resource": resource, "rect": button_rect})
+        if not state.dice_rolled_this_turn:
+            dice_text += " (à lancer)"
 
-        # Boutons Valider/Annuler
-        confirm_rect = pygame.Rect(
-            panel_rect.left + 16,
-            panel_rect.bottom - buttons_section_height + 12,
-            180,
-            40,
-        )
-        cancel_rect = pygame.Rect(
-            confirm_rect.right + 12,
-            confirm_rect.top,
-            180,
-            40,
-        )
+        dice_surf = render_text(small_font, dice_text, (240, 240, 240))
+        blits.append((dice_surf, (SCREEN_WIDTH - 360, 20)))
+        return blits
 
-        return {
-            "panel_rect": panel_rect,
-            "give_title_pos": give_title_pos,
-            "give_rows": give_rows,
-            "receive_title_pos": receive_title_pos,
-            "receive_buttons": receive_buttons,
-            "confirm_rect": confirm_rect,
-            "cancel_rect": cancel_rect,
-        }
+    def build_player_panels_overlay(
+        panels: Tuple[PlayerPanel, ...],
+    ) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Pré-rendre les panneaux joueurs dans une surface transparente.
 
-    def build_discard_layout(prompt: DiscardPrompt) -> Dict[str, object]:
+        Les panneaux ne changent qu'avec l'état de la partie : la surface est
+        reconstruite avec ui_state et simplement blittée à chaque frame.
+        """
+        if not panels:
+            return None
         panel_width = 360
-        row_height = 42
-        padding = 16
-        rows_count = len(prompt.resource_order)
-        panel_height = padding * 2 + rows_count * row_height + 70
-
-        panel_rect = pygame.Rect(40, SCREEN_HEIGHT - panel_height - 40, panel_width, panel_height)
-
-        rows = []
-        for idx, resource in enumerate(prompt.resource_order):
-            row_top = panel_rect.top + padding + idx * row_height
-            label_pos = (panel_rect.left + 16, row_top + 8)
-            minus_rect = pygame.Rect(panel_rect.left + 220, row_top + 4, 32, 32)
-            plus_rect = pygame.Rect(panel_rect.left + 260, row_top + 4, 32, 32)
-            rows.append(
-                {
-                    "resource": resource,
-                    "label_pos": label_pos,
-                    "minus_rect": minus_rect,
-                    "plus_rect": plus_rect,
-                }
-            )
-
-        confirm_rect = pygame.Rect(panel_rect.left + 16, panel_rect.bottom - 56, 140, 36)
-        reset_rect = pygame.Rect(confirm_rect.right + 12, confirm_rect.top, 140, 36)
-
-        return {
-            "panel_rect": panel_rect,
-            "rows": rows,
-            "confirm_rect": confirm_rect,
-            "reset_rect": reset_rect,
-        }
-
-    def build_year_of_plenty_layout(prompt: YearOfPlentyPrompt) -> Dict[str, object]:
-        panel_width = 380
-        row_height = 42
-        padding = 16
-        rows_count = len(prompt.resource_order)
-        panel_height = padding * 3 + 30 + rows_count * row_height + 60
-
-        panel_rect = pygame.Rect(
-            SCREEN_WIDTH // 2 - panel_width // 2,
-            SCREEN_HEIGHT // 2 - panel_height // 2,
+        panel_height = 135  # Augmenté pour accommoder deux lignes de ressources
+        covered = pygame.Rect(
+            SCREEN_WIDTH - panel_width - 20,
+            80,
             panel_width,
-            panel_height,
+            len(panels) * (panel_height + 20) - 20,
         )
-
-        rows = []
-        for idx, resource in enumerate(prompt.resource_order):
-            row_top = panel_rect.top + padding + 30 + idx * row_height
-            label_pos = (panel_rect.left + 16, row_top + 8)
-            minus_rect = pygame.Rect(panel_rect.left + 250, row_top + 4, 32, 32)
-            plus_rect = pygame.Rect(panel_rect.left + 290, row_top + 4, 32, 32)
-            rows.append(
-                {
-                    "resource": resource,
-                    "label_pos": label_pos,
-                    "minus_rect": minus_rect,
-                    "plus_rect": plus_rect,
-                }
-            )
-
-        confirm_rect = pygame.Rect(panel_rect.left + 16, panel_rect.bottom - 56, 160, 40)
-        reset_rect = pygame.Rect(confirm_rect.right + 12, confirm_rect.top, 160, 40)
-
-        return {
-            "panel_rect": panel_rect,
-            "rows": rows,
-            "confirm_rect": confirm_rect,
-            "reset_rect": reset_rect,
-        }
-
-    def render_player_panels(panels: Iterable[PlayerPanel]) -> None:
-        panel_width = 360
-        panel_height = 135  # Augmenté pour accommoder deux lignes de ressources
-        base_x = SCREEN_WIDTH - panel_width - 20
-        base_y = 80
+        overlay = pygame.Surface(covered.size, pygame.SRCALPHA)
+        # Textes posés en un seul appel blits, après les fonds des panneaux
+        labels: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        # Coordonnées locales à la surface
+        base_x = 0
+        base_y = 0
 
         for idx, panel in enumerate(panels):
             top = base_y + idx * (panel_height + 20)
             bg_color = (70, 110, 140) if panel.is_current_player else (50, 80, 110)
             rect = pygame.Rect(base_x, top, panel_width, panel_height)
-            pygame.draw.rect(screen, bg_color, rect, border_radius=10)
-            pygame.draw.rect(screen, (20, 40, 60), rect, width=2, border_radius=10)
+            pygame.draw.rect(overlay, bg_color, rect, border_radius=10)
+            pygame.draw.rect(overlay, (20, 40, 60), rect, width=2, border_radius=10)
 
             name_prefix = "▶ " if panel.is_current_player else ""
-            name_text = font.render(f"{name_prefix}{panel.name}", True, (255, 255, 255))
-            screen.blit(name_text, (base_x + 16, top + 12))
+            name_text = render_text(font, f"{name_prefix}{panel.name}", (255, 255, 255))
+            labels.append((name_text, (base_x + 16, top + 12)))
 
             vp_text = f"VP: {panel.victory_points}"
             if panel.hidden_victory_points:
@@ -275,48 +512,42 @@ def main() -> int:
             if panel.pending_discard:
                 status_line += f" | Défausser: {panel.pending_discard}"
 
-            status_surf = small_font.render(status_line, True, (230, 230, 230))
-            screen.blit(status_surf, (base_x + 16, top + 46))
+            status_surf = render_text(small_font, status_line, (230, 230, 230))
+            labels.append((status_surf, (base_x + 16, top + 46)))
 
             # Afficher les ressources sur deux lignes pour meilleure lisibilité
-            resources = panel.resources
-            res_list = [(res, count) for res, count in resources.items() if count > 0]
-            if res_list:
-                # Première ligne : premières 3 ressources
-                res_line1 = ", ".join([f"{res}:{count}" for res, count in res_list[:3]])
-                res_surf1 = small_font.render(f"Res: {res_line1}", True, (210, 210, 210))
-                screen.blit(res_surf1, (base_x + 16, top + 70))
-
-                # Deuxième ligne : ressources restantes
-                if len(res_list) > 3:
-                    res_line2 = ", ".join([f"{res}:{count}" for res, count in res_list[3:]])
-                    res_surf2 = small_font.render(f"     {res_line2}", True, (210, 210, 210))
-                    screen.blit(res_surf2, (base_x + 16, top + 86))
-            else:
-                res_surf = small_font.render("Res: Aucune", True, (210, 210, 210))
-                screen.blit(res_surf, (base_x + 16, top + 70))
+            res_line1, res_line2 = resource_lines(panel.resources)
+            res_surf1 = render_text(small_font, res_line1, (210, 210, 210))
+            labels.append((res_surf1, (base_x + 16, top + 70)))
+            if res_line2 is not None:
+                res_surf2 = render_text(small_font, res_line2, (210, 210, 210))
+                labels.append((res_surf2, (base_x + 16, top + 86)))
 
             # Cartes de développement (décalées vers le bas)
             dev_line = (
                 f"Dev: {format_dev_summary(panel.dev_cards)} | Nouvelles: "
                 f"{format_dev_summary(panel.new_dev_cards)}"
             )
-            dev_surf = small_font.render(dev_line, True, (200, 200, 200))
-            screen.blit(dev_surf, (base_x + 16, top + 102))
+            dev_surf = render_text(small_font, dev_line, (200, 200, 200))
+            labels.append((dev_surf, (base_x + 16, top + 102)))
+        overlay.blits(labels, doreturn=False)
+        return overlay, covered
 
     def render_bank_trade_panel(prompt: BankTradePrompt, layout: Dict[str, object]) -> None:
         panel_rect: pygame.Rect = layout["panel_rect"]  # type: ignore[assignment]
+        # Textes collectés puis posés en un seul blits, par-dessus les boutons
+        labels: List[Tuple[pygame.Surface, object]] = []
         pygame.draw.rect(screen, (45, 75, 105), panel_rect, border_radius=12)
         pygame.draw.rect(screen, (20, 40, 60), panel_rect, width=3, border_radius=12)
 
         # Titre principal
-        title = font.render(f"Échange banque — {prompt.player_name}", True, (255, 255, 255))
-        screen.blit(title, (panel_rect.left + 16, panel_rect.top + 8))
+        title = render_text(font, f"Échange banque — {prompt.player_name}", (255, 255, 255))
+        labels.append((title, (panel_rect.left + 16, panel_rect.top + 8)))
 
         # Section "Donner"
         give_title_pos = layout["give_title_pos"]  # type: ignore[assignment]
-        give_title = font.render("Ressources à donner:", True, (255, 255, 255))
-        screen.blit(give_title, give_title_pos)
+        give_title = render_text(font, "Ressources à donner:", (255, 255, 255))
+        labels.append((give_title, give_title_pos))
 
         for row in layout["give_rows"]:  # type: ignore[assignment]
             resource = row["resource"]
@@ -327,25 +558,25 @@ def main() -> int:
             available = prompt.hand.get(resource, 0)
             selected = prompt.give_selection.get(resource, 0)
             rate = prompt.rates.get(resource, 4)
-            label = f"{resource.title()}: {selected}/{available} (Taux: {rate}:1)"
-            label_surf = small_font.render(label, True, (210, 210, 210))
-            screen.blit(label_surf, label_pos)
+            label = f"{_RESOURCE_LABELS[resource]}: {selected}/{available} (Taux: {rate}:1)"
+            label_surf = render_text(small_font, label, (210, 210, 210))
+            labels.append((label_surf, label_pos))
 
             # Boutons +/-
             pygame.draw.rect(screen, (70, 110, 140), minus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), minus_rect, width=2, border_radius=6)
-            minus_text = small_font.render("-", True, (255, 255, 255))
-            screen.blit(minus_text, minus_text.get_rect(center=minus_rect.center))
+            minus_text = render_text(small_font, "-", (255, 255, 255))
+            labels.append((minus_text, minus_text.get_rect(center=minus_rect.center)))
 
             pygame.draw.rect(screen, (70, 110, 140), plus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), plus_rect, width=2, border_radius=6)
-            plus_text = small_font.render("+", True, (255, 255, 255))
-            screen.blit(plus_text, plus_text.get_rect(center=plus_rect.center))
+            plus_text = render_text(small_font, "+", (255, 255, 255))
+            labels.append((plus_text, plus_text.get_rect(center=plus_rect.center)))
 
         # Section "Recevoir"
         receive_title_pos = layout["receive_title_pos"]  # type: ignore[assignment]
-        receive_title = font.render("Ressource à recevoir:", True, (255, 255, 255))
-        screen.blit(receive_title, receive_title_pos)
+        receive_title = render_text(font, "Ressource à recevoir:", (255, 255, 255))
+        labels.append((receive_title, receive_title_pos))
 
         for button_info in layout["receive_buttons"]:  # type: ignore[assignment]
             resource = button_info["resource"]
@@ -358,9 +589,10 @@ def main() -> int:
             pygame.draw.rect(screen, (20, 40, 60), rect, width=2, border_radius=6)
 
             # Texte raccourci pour la ressource
-            res_short = resource[:4].upper()
-            button_text = small_font.render(res_short, True, (255, 255, 255))
-            screen.blit(button_text, button_text.get_rect(center=rect.center))
+            button_text = render_text(
+                small_font, _RESOURCE_SHORT_LABELS[resource], (255, 255, 255)
+            )
+            labels.append((button_text, button_text.get_rect(center=rect.center)))
 
         # Boutons Valider/Annuler
         confirm_rect: pygame.Rect = layout["confirm_rect"]  # type: ignore[assignment]
@@ -369,26 +601,28 @@ def main() -> int:
         confirm_color = (100, 180, 120) if prompt.can_confirm else (90, 90, 90)
         pygame.draw.rect(screen, confirm_color, confirm_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), confirm_rect, width=2, border_radius=8)
-        confirm_label = font.render("Valider", True, (0, 0, 0))
-        screen.blit(confirm_label, confirm_label.get_rect(center=confirm_rect.center))
+        confirm_label = render_text(font, "Valider", (0, 0, 0))
+        labels.append((confirm_label, confirm_label.get_rect(center=confirm_rect.center)))
 
         pygame.draw.rect(screen, (160, 120, 70), cancel_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), cancel_rect, width=2, border_radius=8)
-        cancel_label = font.render("Annuler", True, (0, 0, 0))
-        screen.blit(cancel_label, cancel_label.get_rect(center=cancel_rect.center))
+        cancel_label = render_text(font, "Annuler", (0, 0, 0))
+        labels.append((cancel_label, cancel_label.get_rect(center=cancel_rect.center)))
+        screen.blits(labels, doreturn=False)
 
     def render_discard_panel(prompt: DiscardPrompt, layout: Dict[str, object]) -> None:
         panel_rect: pygame.Rect = layout["panel_rect"]  # type: ignore[assignment]
+        labels: List[Tuple[pygame.Surface, object]] = []
         pygame.draw.rect(screen, (45, 75, 105), panel_rect, border_radius=12)
         pygame.draw.rect(screen, (20, 40, 60), panel_rect, width=2, border_radius=12)
 
-        title = font.render(f"Défausse — {prompt.player_name}", True, (255, 255, 255))
-        screen.blit(title, (panel_rect.left + 16, panel_rect.top + 8))
+        title = render_text(font, f"Défausse — {prompt.player_name}", (255, 255, 255))
+        labels.append((title, (panel_rect.left + 16, panel_rect.top + 8)))
 
-        remaining_text = small_font.render(
-            f"Cartes à défausser: {prompt.remaining}", True, (230, 230, 230)
+        remaining_text = render_text(
+            small_font, f"Cartes à défausser: {prompt.remaining}", (230, 230, 230)
         )
-        screen.blit(remaining_text, (panel_rect.left + 16, panel_rect.top + 36))
+        labels.append((remaining_text, (panel_rect.left + 16, panel_rect.top + 36)))
 
         for row in layout["rows"]:  # type: ignore[assignment]
             resource = row["resource"]
@@ -398,19 +632,19 @@ def main() -> int:
 
             available = prompt.hand.get(resource, 0)
             selected = prompt.selection.get(resource, 0)
-            label = f"{resource.title()}: {selected}/{available}"
-            label_surf = small_font.render(label, True, (210, 210, 210))
-            screen.blit(label_surf, label_pos)
+            label = f"{_RESOURCE_LABELS[resource]}: {selected}/{available}"
+            label_surf = render_text(small_font, label, (210, 210, 210))
+            labels.append((label_surf, label_pos))
 
             pygame.draw.rect(screen, (70, 110, 140), minus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), minus_rect, width=2, border_radius=6)
-            minus_text = small_font.render("-", True, (255, 255, 255))
-            screen.blit(minus_text, minus_text.get_rect(center=minus_rect.center))
+            minus_text = render_text(small_font, "-", (255, 255, 255))
+            labels.append((minus_text, minus_text.get_rect(center=minus_rect.center)))
 
             pygame.draw.rect(screen, (70, 110, 140), plus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), plus_rect, width=2, border_radius=6)
-            plus_text = small_font.render("+", True, (255, 255, 255))
-            screen.blit(plus_text, plus_text.get_rect(center=plus_rect.center))
+            plus_text = render_text(small_font, "+", (255, 255, 255))
+            labels.append((plus_text, plus_text.get_rect(center=plus_rect.center)))
 
         confirm_rect: pygame.Rect = layout["confirm_rect"]  # type: ignore[assignment]
         reset_rect: pygame.Rect = layout["reset_rect"]  # type: ignore[assignment]
@@ -418,26 +652,30 @@ def main() -> int:
         confirm_color = (100, 180, 120) if prompt.can_confirm else (90, 90, 90)
         pygame.draw.rect(screen, confirm_color, confirm_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), confirm_rect, width=2, border_radius=8)
-        confirm_label = small_font.render("Valider", True, (0, 0, 0))
-        screen.blit(confirm_label, confirm_label.get_rect(center=confirm_rect.center))
+        confirm_label = render_text(small_font, "Valider", (0, 0, 0))
+        labels.append((confirm_label, confirm_label.get_rect(center=confirm_rect.center)))
 
         pygame.draw.rect(screen, (160, 120, 70), reset_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), reset_rect, width=2, border_radius=8)
-        reset_label = small_font.render("Réinitialiser", True, (0, 0, 0))
-        screen.blit(reset_label, reset_label.get_rect(center=reset_rect.center))
+        reset_label = render_text(small_font, "Réinitialiser", (0, 0, 0))
+        labels.append((reset_label, reset_label.get_rect(center=reset_rect.center)))
+        screen.blits(labels, doreturn=False)
 
     def render_year_of_plenty_panel(prompt: YearOfPlentyPrompt, layout: Dict[str, object]) -> None:
         panel_rect: pygame.Rect = layout["panel_rect"]  # type: ignore[assignment]
+        labels: List[Tuple[pygame.Surface, object]] = []
         pygame.draw.rect(screen, (45, 75, 105), panel_rect, border_radius=12)
         pygame.draw.rect(screen, (20, 40, 60), panel_rect, width=3, border_radius=12)
 
-        title = font.render(f"Année d'Abondance — {prompt.player_name}", True, (255, 255, 255))
-        screen.blit(title, (panel_rect.left + 16, panel_rect.top + 8))
+        title = render_text(font, f"Année d'Abondance — {prompt.player_name}", (255, 255, 255))
+        labels.append((title, (panel_rect.left + 16, panel_rect.top + 8)))
 
-        remaining_text = small_font.render(
-            f"Ressources à choisir: {prompt.remaining} / {prompt.required}", True, (230, 230, 230)
+        remaining_text = render_text(
+            small_font,
+            f"Ressources à choisir: {prompt.remaining} / {prompt.required}",
+            (230, 230, 230),
         )
-        screen.blit(remaining_text, (panel_rect.left + 16, panel_rect.top + 36))
+        labels.append((remaining_text, (panel_rect.left + 16, panel_rect.top + 36)))
 
         for row in layout["rows"]:  # type: ignore[assignment]
             resource = row["resource"]
@@ -446,19 +684,19 @@ def main() -> int:
             plus_rect: pygame.Rect = row["plus_rect"]
 
             selected = prompt.selection.get(resource, 0)
-            label = f"{resource.title()}: {selected}"
-            label_surf = small_font.render(label, True, (210, 210, 210))
-            screen.blit(label_surf, label_pos)
+            label = f"{_RESOURCE_LABELS[resource]}: {selected}"
+            label_surf = render_text(small_font, label, (210, 210, 210))
+            labels.append((label_surf, label_pos))
 
             pygame.draw.rect(screen, (70, 110, 140), minus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), minus_rect, width=2, border_radius=6)
-            minus_text = small_font.render("-", True, (255, 255, 255))
-            screen.blit(minus_text, minus_text.get_rect(center=minus_rect.center))
+            minus_text = render_text(small_font, "-", (255, 255, 255))
+            labels.append((minus_text, minus_text.get_rect(center=minus_rect.center)))
 
             pygame.draw.rect(screen, (70, 110, 140), plus_rect, border_radius=6)
             pygame.draw.rect(screen, (20, 40, 60), plus_rect, width=2, border_radius=6)
-            plus_text = small_font.render("+", True, (255, 255, 255))
-            screen.blit(plus_text, plus_text.get_rect(center=plus_rect.center))
+            plus_text = render_text(small_font, "+", (255, 255, 255))
+            labels.append((plus_text, plus_text.get_rect(center=plus_rect.center)))
 
         confirm_rect: pygame.Rect = layout["confirm_rect"]  # type: ignore[assignment]
         reset_rect: pygame.Rect = layout["reset_rect"]  # type: ignore[assignment]
@@ -466,41 +704,76 @@ def main() -> int:
         confirm_color = (100, 180, 120) if prompt.can_confirm else (90, 90, 90)
         pygame.draw.rect(screen, confirm_color, confirm_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), confirm_rect, width=2, border_radius=8)
-        confirm_label = font.render("Valider", True, (0, 0, 0))
-        screen.blit(confirm_label, confirm_label.get_rect(center=confirm_rect.center))
+        confirm_label = render_text(font, "Valider", (0, 0, 0))
+        labels.append((confirm_label, confirm_label.get_rect(center=confirm_rect.center)))
 
         pygame.draw.rect(screen, (160, 120, 70), reset_rect, border_radius=8)
         pygame.draw.rect(screen, (20, 40, 60), reset_rect, width=2, border_radius=8)
-        reset_label = font.render("Annuler", True, (0, 0, 0))
-        screen.blit(reset_label, reset_label.get_rect(center=reset_rect.center))
+        reset_label = render_text(font, "Annuler", (0, 0, 0))
+        labels.append((reset_label, reset_label.get_rect(center=reset_rect.center)))
+        screen.blits(labels, doreturn=False)
+
+    def compose_frame(state: UIState) -> None:
+        """Recompose toutes les couches, limitées à la zone de clip de l'écran."""
+        screen.fill(COLOR_BG)
+        renderer = app.renderer
+        renderer.render_board()
+        renderer.render_pieces(app.state)
+
+        if state.highlight_tiles:
+            renderer.render_highlighted_tiles(state.highlight_tiles)
+        if state.highlight_vertices:
+            renderer.render_highlighted_vertices(state.highlight_vertices)
+        if state.highlight_edges:
+            renderer.render_highlighted_edges(state.highlight_edges)
+
+        screen.blits(hud_blits, doreturn=False)
+
+        if panels_overlay is not None:
+            screen.blit(*panels_overlay)
+        if discard_layout and state.discard_prompt:
+            render_discard_panel(state.discard_prompt, discard_layout)
+        if bank_trade_layout and state.bank_trade_prompt:
+            render_bank_trade_panel(state.bank_trade_prompt, bank_trade_layout)
+        if year_of_plenty_layout and state.year_of_plenty_prompt:
+            render_year_of_plenty_panel(state.year_of_plenty_prompt, year_of_plenty_layout)
 
     running = True
     ui_state = app.get_ui_state()
+    needs_redraw = True
+    # Dirty rects : contenu affiché par région au dernier rendu, et zone couverte.
+    # Seules les régions dont le contenu a changé sont envoyées à l'écran.
+    shown_regions: Dict[str, object] = {}
+    shown_rects: Dict[str, List[pygame.Rect]] = {}
+    full_update = True
+
+    # Le HUD et les layouts des panneaux modaux ne dépendent que de ui_state :
+    # ils sont reconstruits avec lui, pas à chaque tour de boucle ni à chaque frame
+    hud_blits = build_hud_blits(ui_state)
+    panels_overlay = build_player_panels_overlay(ui_state.player_panels)
+    discard_layout, bank_trade_layout, year_of_plenty_layout = build_modal_layouts(ui_state)
+    modal_buttons = build_modal_buttons(
+        app, discard_layout, bank_trade_layout, year_of_plenty_layout
+    )
 
     while running:
         ui_state_changed = False
-        discard_layout: Optional[Dict[str, object]] = (
-            build_discard_layout(ui_state.discard_prompt)
-            if ui_state.mode == "discard" and ui_state.discard_prompt
-            else None
-        )
-        bank_trade_layout: Optional[Dict[str, object]] = (
-            build_bank_trade_layout(ui_state.bank_trade_prompt)
-            if ui_state.mode == "bank_trade" and ui_state.bank_trade_prompt
-            else None
-        )
-        year_of_plenty_layout: Optional[Dict[str, object]] = (
-            build_year_of_plenty_layout(ui_state.year_of_plenty_prompt)
-            if ui_state.mode == "year_of_plenty" and ui_state.year_of_plenty_prompt
-            else None
-        )
 
-        for event in pygame.event.get():
+        if needs_redraw:
+            events = pygame.event.get()
+        else:
+            # Rien en attente : le thread dort jusqu'au prochain évènement
+            events = [pygame.event.wait(), *pygame.event.get()]
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in _REDRAW_EVENTS:
+                needs_redraw = True
+                full_update = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    if app.mode in {"build_road", "build_settlement", "build_city", "move_robber"}:
+                    if app.mode in _ESCAPE_CANCEL_MODES:
                         app.trigger_action("cancel")
                         ui_state_changed = True
                     else:
@@ -516,126 +789,22 @@ def main() -> int:
                             ui_state_changed = True
                     continue
 
-                for label, key, action in KEY_BINDINGS:
-                    if event.key != key:
-                        continue
-
+                action = _KEY_TO_ACTION.get(event.key)
+                if action is not None:
                     button_state = ui_state.buttons.get(action)
                     if action == "cancel" or (button_state and button_state.enabled):
                         if app.trigger_action(action):
                             ui_state_changed = True
-                    break
 
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 pos = event.pos
 
-                # Gestion des clics sur le panneau Year of Plenty
-                if year_of_plenty_layout:
-                    handled = False
-                    for row in year_of_plenty_layout["rows"]:  # type: ignore[assignment]
-                        minus_rect: pygame.Rect = row["minus_rect"]
-                        plus_rect: pygame.Rect = row["plus_rect"]
-                        resource = row["resource"]
-                        if minus_rect.collidepoint(pos):
-                            if app.adjust_year_of_plenty_selection(resource, -1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                        if plus_rect.collidepoint(pos):
-                            if app.adjust_year_of_plenty_selection(resource, 1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                    if handled:
-                        continue
-
-                    confirm_rect: pygame.Rect = year_of_plenty_layout["confirm_rect"]  # type: ignore[assignment]
-                    reset_rect: pygame.Rect = year_of_plenty_layout["reset_rect"]  # type: ignore[assignment]
-                    if confirm_rect.collidepoint(pos):
-                        if app.confirm_year_of_plenty_selection():
-                            ui_state_changed = True
-                        continue
-                    if reset_rect.collidepoint(pos):
-                        if app.reset_year_of_plenty_selection():
-                            ui_state_changed = True
-                        continue
-
-                # Gestion des clics sur le panneau d'échange banque
-                if bank_trade_layout:
-                    handled = False
-
-                    # Boutons +/- pour donner des ressources
-                    for row in bank_trade_layout["give_rows"]:  # type: ignore[assignment]
-                        minus_rect: pygame.Rect = row["minus_rect"]
-                        plus_rect: pygame.Rect = row["plus_rect"]
-                        resource = row["resource"]
-                        if minus_rect.collidepoint(pos):
-                            if app.adjust_bank_trade_give(resource, -1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                        if plus_rect.collidepoint(pos):
-                            if app.adjust_bank_trade_give(resource, 1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                    if handled:
-                        continue
-
-                    # Boutons pour sélectionner la ressource à recevoir
-                    for button_info in bank_trade_layout["receive_buttons"]:  # type: ignore[assignment]
-                        rect: pygame.Rect = button_info["rect"]
-                        resource = button_info["resource"]
-                        if rect.collidepoint(pos):
-                            if app.select_bank_trade_receive(resource):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                    if handled:
-                        continue
-
-                    # Boutons Valider/Annuler
-                    confirm_rect: pygame.Rect = bank_trade_layout["confirm_rect"]  # type: ignore[assignment]
-                    cancel_rect: pygame.Rect = bank_trade_layout["cancel_rect"]  # type: ignore[assignment]
-
-                    if confirm_rect.collidepoint(pos):
-                        if app.confirm_bank_trade_selection():
-                            ui_state_changed = True
-                        continue
-                    if cancel_rect.collidepoint(pos):
-                        if app.trigger_action("cancel"):
-                            ui_state_changed = True
-                        continue
-
-                if discard_layout:
-                    handled = False
-                    for row in discard_layout["rows"]:  # type: ignore[assignment]
-                        minus_rect: pygame.Rect = row["minus_rect"]
-                        plus_rect: pygame.Rect = row["plus_rect"]
-                        resource = row["resource"]
-                        if minus_rect.collidepoint(pos):
-                            if app.adjust_discard_selection(resource, -1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                        if plus_rect.collidepoint(pos):
-                            if app.adjust_discard_selection(resource, 1):
-                                ui_state_changed = True
-                            handled = True
-                            break
-                    if handled:
-                        continue
-
-                    confirm_rect: pygame.Rect = discard_layout["confirm_rect"]  # type: ignore[assignment]
-                    reset_rect: pygame.Rect = discard_layout["reset_rect"]  # type: ignore[assignment]
-                    if confirm_rect.collidepoint(pos):
-                        if app.confirm_discard_selection():
-                            ui_state_changed = True
-                        continue
-                    if reset_rect.collidepoint(pos):
-                        if app.reset_discard_selection():
-                            ui_state_changed = True
-                        continue
+                # Panneaux modaux (Invention, échange banque, défausse)
+                command = modal_command_at(modal_buttons, pos)
+                if command is not None:
+                    if command():
+                        ui_state_changed = True
+                    continue
 
                 if ui_state.highlight_tiles:
                     tile_id = app.renderer.get_tile_at_position(pos)
@@ -656,72 +825,96 @@ def main() -> int:
                         continue
 
         if ui_state_changed:
+            needs_redraw = True
+            previous_panels = ui_state.player_panels
+            previous_hud_key = hud_content_key(ui_state)
             ui_state = app.get_ui_state()
-            discard_layout = (
-                build_discard_layout(ui_state.discard_prompt)
-                if ui_state.mode == "discard" and ui_state.discard_prompt
-                else None
-            )
-            bank_trade_layout = (
-                build_bank_trade_layout(ui_state.bank_trade_prompt)
-                if ui_state.mode == "bank_trade" and ui_state.bank_trade_prompt
-                else None
+            # Sélections des panneaux modaux : le HUD est souvent inchangé
+            if hud_content_key(ui_state) != previous_hud_key:
+                hud_blits = build_hud_blits(ui_state)
+            if ui_state.player_panels != previous_panels:
+                panels_overlay = build_player_panels_overlay(ui_state.player_panels)
+            discard_layout, bank_trade_layout, year_of_plenty_layout = build_modal_layouts(
+                ui_state
             )
-            year_of_plenty_layout = (
-                build_year_of_plenty_layout(ui_state.year_of_plenty_prompt)
-                if ui_state.mode == "year_of_plenty" and ui_state.year_of_plenty_prompt
-                else None
+            modal_buttons = build_modal_buttons(
+                app, discard_layout, bank_trade_layout, year_of_plenty_layout
             )
 
-        # Rendu principal
-        screen.fill(COLOR_BG)
-        renderer = app.renderer
-        renderer.render_board()
-        renderer.render_pieces(app.state)
-
-        if ui_state.highlight_tiles:
-            renderer.render_highlighted_tiles(ui_state.highlight_tiles)
-        if ui_state.highlight_vertices:
-            renderer.render_highlighted_vertices(ui_state.highlight_vertices)
-        if ui_state.highlight_edges:
-            renderer.render_highlighted_edges(ui_state.highlight_edges)
-
-        # Instructions
-        instructions = font.render(ui_state.instructions, True, (255, 255, 255))
-        screen.blit(instructions, (20, 20))
-
-        # Tableau des actions disponibles
-        y_offset = 60
-        for label, key, action in KEY_BINDINGS:
-            button_state = ui_state.buttons.get(action)
-            enabled = button_state.enabled if button_state else False
-            text = f"[{label}] {button_state.label if button_state else action}"
-            color = (200, 255, 200) if enabled else (120, 120, 120)
-            surf = small_font.render(text, True, color)
-            screen.blit(surf, (20, y_offset))
-            y_offset += 24
-
-        # Dernier lancer de dés
-        if ui_state.last_dice_roll is not None:
-            dice_text = f"Dernier lancer: {ui_state.last_dice_roll}"
+        # Rendu principal, uniquement si l'affichage a pu changer : tout
+        # changement passe par un évènement (action, exposition de la fenêtre)
+        if not needs_redraw:
+            continue
+        needs_redraw = False
+
+        regions = {
+            "board": (
+                app.renderer.board_content_key(app.state),
+                ui_state.highlight_tiles,
+                ui_state.highlight_vertices,
+                ui_state.highlight_edges,
+            ),
+            "hud": hud_content_key(ui_state),
+            "panels": ui_state.player_panels,
+            "prompt": (
+                ui_state.mode,
+                ui_state.discard_prompt,
+                ui_state.bank_trade_prompt,
+                ui_state.year_of_plenty_prompt,
+            ),
+        }
+        changed = {
+            name
+            for name, content in regions.items()
+            if name not in shown_regions or shown_regions[name] != content
+        }
+        if not changed and not full_update:
+            clock.tick(30)
+            continue
+        shown_regions = regions
+
+        # Zones couvertes par région. Le HUD en a deux : la colonne des
+        # actions et le dernier lancer, en haut à droite (leur union
+        # couvrirait presque tout l'écran)
+        hud_line_rects = [surf.get_rect(topleft=pos) for surf, pos in hud_blits]
+        prompt_rects: List[pygame.Rect] = []
+        for layout, prompt in (
+            (discard_layout, ui_state.discard_prompt),
+            (bank_trade_layout, ui_state.bank_trade_prompt),
+            (year_of_plenty_layout, ui_state.year_of_plenty_prompt),
+        ):
+            if layout and prompt:
+                prompt_rects.append(layout["panel_rect"])  # type: ignore[arg-type]
+        rects = {
+            "board": [app.renderer.board_rect],
+            "hud": [
+                hud_line_rects[0].unionall(hud_line_rects[1:-1]),
+                hud_line_rects[-1],
+            ],
+            "panels": [panels_overlay[1]] if panels_overlay is not None else [],
+            "prompt": prompt_rects,
+        }
+        if full_update:
+            compose_frame(ui_state)
+            pygame.display.flip()
+            full_update = False
         else:
-            dice_text = "Dernier lancer: —"
-
-        if not ui_state.dice_rolled_this_turn:
-            dice_text += " (à lancer)"
-
-        dice_surf = small_font.render(dice_text, True, (240, 240, 240))
-        screen.blit(dice_surf, (SCREEN_WIDTH - 360, 20))
-
-        render_player_panels(ui_state.player_panels)
-        if discard_layout and ui_state.discard_prompt:
-            render_discard_panel(ui_state.discard_prompt, discard_layout)
-        if bank_trade_layout and ui_state.bank_trade_prompt:
-            render_bank_trade_panel(ui_state.bank_trade_prompt, bank_trade_layout)
-        if year_of_plenty_layout and ui_state.year_of_plenty_prompt:
-            render_year_of_plenty_panel(ui_state.year_of_plenty_prompt, year_of_plenty_layout)
-
-        pygame.display.flip()
+            # Ancienne et nouvelle zone : ce qui disparaît doit aussi être
+            # recopié. Seules ces zones sont recomposées (clip), le reste de
+            # l'écran garde l'image déjà affichée.
+            dirty_rects = merge_overlapping(
+                [
+                    rect
+                    for name in changed
+                    for rect in (*shown_rects.get(name, ()), *rects[name])
+                ]
+            )
+            for rect in dirty_rects:
+                screen.set_clip(rect)
+                compose_frame(ui_state)
+            screen.set_clip(None)
+            pygame.display.update(dirty_rects)
+        shown_rects = rects
         clock.tick(30)
 
     pygame.quit()
@@ -19,7 +19,8 @@ class FirstLegalPolicy(AgentPolicy):
         super().__init__(name="FirstLegal")
 
     def select_action(self, state) -> Action:  # type: ignore[override]
-        legal: Sequence[Action] = tuple(state.legal_actions())
+        # legal_actions() renvoie déjà une liste neuve : pas de copie en tuple
+        legal: Sequence[Action] = state.legal_actions()
         if not legal:
             raise ValueError("Aucune action légale disponible pour FirstLegalPolicy")
         return legal[0]
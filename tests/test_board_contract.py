@@ -1,6 +1,7 @@
 import math
 from typing import Dict, Tuple
 
+import numpy as np
 import pytest
 
 
@@ -51,110 +52,73 @@ PIP_NUMBERS: Dict[int, int] = {
 
 # Pré-calculs géométriques (pointy-top) pour vérifier l'indexation
 SQRT3 = math.sqrt(3)
-VERTEX_ANGLES = [math.radians(30 + 60 * k) for k in range(6)]
-VERTEX_OFFSETS = [(math.cos(a), math.sin(a)) for a in VERTEX_ANGLES]
-
-# Données attendues (générées hors-ligne via la géométrie ci-dessus)
-EXPECTED_TILE_VERTICES: Dict[int, Tuple[int, ...]] = {
-    0: (33, 27, 21, 20, 26, 32),
-    1: (45, 39, 33, 32, 38, 44),
-    2: (38, 32, 26, 25, 31, 37),
-    3: (26, 20, 14, 13, 19, 25),
-    4: (21, 15, 9, 8, 14, 20),
-    5: (28, 22, 16, 15, 21, 27),
-    6: (40, 34, 28, 27, 33, 39),
-    7: (49, 44, 38, 37, 43, 48),
-    8: (43, 37, 31, 30, 36, 42),
-    9: (31, 25, 19, 18, 24, 30),
-    10: (19, 13, 7, 6, 12, 18),
-    11: (14, 8, 3, 2, 7, 13),
-    12: (9, 4, 1, 0, 3, 8),
-    13: (16, 10, 5, 4, 9, 15),
-    14: (23, 17, 11, 10, 16, 22),
-    15: (35, 29, 23, 22, 28, 34),
-    16: (47, 41, 35, 34, 40, 46),
-    17: (51, 46, 40, 39, 45, 50),
-    18: (53, 50, 45, 44, 49, 52),
-}
-
-EXPECTED_TILE_EDGES: Dict[int, Tuple[int, ...]] = {
-    0: (40, 31, 29, 30, 38, 46),
-    1: (57, 48, 46, 47, 55, 62),
-    2: (47, 38, 36, 37, 45, 53),
-    3: (30, 21, 19, 20, 28, 36),
-    4: (23, 14, 12, 13, 21, 29),
-    5: (33, 24, 22, 23, 31, 39),
-    6: (50, 41, 39, 40, 48, 56),
-    7: (63, 55, 53, 54, 61, 67),
-    8: (54, 45, 43, 44, 52, 60),
-    9: (37, 28, 26, 27, 35, 43),
-    10: (20, 11, 9, 10, 18, 26),
-    11: (13, 5, 3, 4, 11, 19),
-    12: (7, 2, 0, 1, 5, 12),
-    13: (16, 8, 6, 7, 14, 22),
-    14: (25, 17, 15, 16, 24, 32),
-    15: (42, 34, 32, 33, 41, 49),
-    16: (59, 51, 49, 50, 58, 65),
-    17: (66, 58, 56, 57, 64, 69),
-    18: (70, 64, 62, 63, 68, 71),
-}
-
-EXPECTED_VERTEX_COORDS: Dict[int, Tuple[float, float]] = {
-    0: (-4.330127, -0.5),
-    1: (-4.330127, 0.5),
-    2: (-3.464102, -2.0),
-    3: (-3.464102, -1.0),
-    4: (-3.464102, 1.0),
-    5: (-3.464102, 2.0),
-    6: (-2.598076, -3.5),
-    7: (-2.598076, -2.5),
-    8: (-2.598076, -0.5),
-    9: (-2.598076, 0.5),
-    10: (-2.598076, 2.5),
-    11: (-2.598076, 3.5),
-    12: (-1.732051, -4.0),
-    13: (-1.732051, -2.0),
-    14: (-1.732051, -1.0),
-    15: (-1.732051, 1.0),
-    16: (-1.732051, 2.0),
-    17: (-1.732051, 4.0),
-    18: (-0.866025, -3.5),
-    19: (-0.866025, -2.5),
-    20: (-0.866025, -0.5),
-    21: (-0.866025, 0.5),
-    22: (-0.866025, 2.5),
-    23: (-0.866025, 3.5),
-    24: (0.0, -4.0),
-    25: (0.0, -2.0),
-    26: (0.0, -1.0),
-    27: (0.0, 1.0),
-    28: (0.0, 2.0),
-    29: (0.0, 4.0),
-    30: (0.866025, -3.5),
-    31: (0.866025, -2.5),
-    32: (0.866025, -0.5),
-    33: (0.866025, 0.5),
-    34: (0.866025, 2.5),
-    35: (0.866025, 3.5),
-    36: (1.732051, -4.0),
-    37: (1.732051, -2.0),
-    38: (1.732051, -1.0),
-    39: (1.732051, 1.0),
-    40: (1.732051, 2.0),
-    41: (1.732051, 4.0),
-    42: (2.598076, -3.5),
-    43: (2.598076, -2.5),
-    44: (2.598076, -0.5),
-    45: (2.598076, 0.5),
-    46: (2.598076, 2.5),
-    47: (2.598076, 3.5),
-    48: (3.464102, -2.0),
-    49: (3.464102, -1.0),
-    50: (3.464102, 1.0),
-    51: (3.464102, 2.0),
-    52: (4.330127, -0.5),
-    53: (4.330127, 0.5),
-}
+VERTEX_ANGLES = np.radians(30 + 60 * np.arange(6))
+VERTEX_OFFSETS = np.stack((np.cos(VERTEX_ANGLES), np.sin(VERTEX_ANGLES)), axis=1)
+
+
+def _build_expected_vertex_coords() -> np.ndarray:
+    """Sommets (54, 2) des 19 tuiles, arrondis puis triés comme l'indexation du moteur."""
+    cubes = np.array([cube for _, _, cube in TILE_LAYOUT], dtype=np.float64)
+    q, r = cubes[:, 0], cubes[:, 2]
+    centers = np.stack((SQRT3 * (q + r / 2), 1.5 * r), axis=1)
+    corners = (centers[:, None, :] + VERTEX_OFFSETS[None, :, :]).reshape(-1, 2)
+    # np.unique trie lexicographiquement (x, puis y) et supprime les sommets partagés
+    return np.unique(np.round(corners, 6), axis=0)
+
+
+# Données attendues (générées hors-ligne via la géométrie ci-dessus).
+# Tables de largeur fixe en tableaux numpy (ligne = identifiant), les autres en dicts.
+EXPECTED_TILE_VERTICES = np.array(
+    [
+        [33, 27, 21, 20, 26, 32],  # 0
+        [45, 39, 33, 32, 38, 44],  # 1
+        [38, 32, 26, 25, 31, 37],  # 2
+        [26, 20, 14, 13, 19, 25],  # 3
+        [21, 15, 9, 8, 14, 20],  # 4
+        [28, 22, 16, 15, 21, 27],  # 5
+        [40, 34, 28, 27, 33, 39],  # 6
+        [49, 44, 38, 37, 43, 48],  # 7
+        [43, 37, 31, 30, 36, 42],  # 8
+        [31, 25, 19, 18, 24, 30],  # 9
+        [19, 13, 7, 6, 12, 18],  # 10
+        [14, 8, 3, 2, 7, 13],  # 11
+        [9, 4, 1, 0, 3, 8],  # 12
+        [16, 10, 5, 4, 9, 15],  # 13
+        [23, 17, 11, 10, 16, 22],  # 14
+        [35, 29, 23, 22, 28, 34],  # 15
+        [47, 41, 35, 34, 40, 46],  # 16
+        [51, 46, 40, 39, 45, 50],  # 17
+        [53, 50, 45, 44, 49, 52],  # 18
+    ],
+    dtype=np.int16,
+)
+
+EXPECTED_TILE_EDGES = np.array(
+    [
+        [40, 31, 29, 30, 38, 46],  # 0
+        [57, 48, 46, 47, 55, 62],  # 1
+        [47, 38, 36, 37, 45, 53],  # 2
+        [30, 21, 19, 20, 28, 36],  # 3
+        [23, 14, 12, 13, 21, 29],  # 4
+        [33, 24, 22, 23, 31, 39],  # 5
+        [50, 41, 39, 40, 48, 56],  # 6
+        [63, 55, 53, 54, 61, 67],  # 7
+        [54, 45, 43, 44, 52, 60],  # 8
+        [37, 28, 26, 27, 35, 43],  # 9
+        [20, 11, 9, 10, 18, 26],  # 10
+        [13, 5, 3, 4, 11, 19],  # 11
+        [7, 2, 0, 1, 5, 12],  # 12
+        [16, 8, 6, 7, 14, 22],  # 13
+        [25, 17, 15, 16, 24, 32],  # 14
+        [42, 34, 32, 33, 41, 49],  # 15
+        [59, 51, 49, 50, 58, 65],  # 16
+        [66, 58, 56, 57, 64, 69],  # 17
+        [70, 64, 62, 63, 68, 71],  # 18
+    ],
+    dtype=np.int16,
+)
+
+EXPECTED_VERTEX_COORDS = _build_expected_vertex_coords()
 
 EXPECTED_VERTEX_TILES: Dict[int, Tuple[int, ...]] = {
     0: (12,),
@@ -270,80 +234,83 @@ EXPECTED_VERTEX_EDGES: Dict[int, Tuple[int, ...]] = {
     53: (70, 71),
 }
 
-EXPECTED_EDGE_VERTICES: Dict[int, Tuple[int, int]] = {
-    0: (0, 1),
-    1: (0, 3),
-    2: (1, 4),
-    3: (2, 3),
-    4: (2, 7),
-    5: (3, 8),
-    6: (4, 5),
-    7: (4, 9),
-    8: (5, 10),
-    9: (6, 7),
-    10: (6, 12),
-    11: (7, 13),
-    12: (8, 9),
-    13: (8, 14),
-    14: (9, 15),
-    15: (10, 11),
-    16: (10, 16),
-    17: (11, 17),
-    18: (12, 18),
-    19: (13, 14),
-    20: (13, 19),
-    21: (14, 20),
-    22: (15, 16),
-    23: (15, 21),
-    24: (16, 22),
-    25: (17, 23),
-    26: (18, 19),
-    27: (18, 24),
-    28: (19, 25),
-    29: (20, 21),
-    30: (20, 26),
-    31: (21, 27),
-    32: (22, 23),
-    33: (22, 28),
-    34: (23, 29),
-    35: (24, 30),
-    36: (25, 26),
-    37: (25, 31),
-    38: (26, 32),
-    39: (27, 28),
-    40: (27, 33),
-    41: (28, 34),
-    42: (29, 35),
-    43: (30, 31),
-    44: (30, 36),
-    45: (31, 37),
-    46: (32, 33),
-    47: (32, 38),
-    48: (33, 39),
-    49: (34, 35),
-    50: (34, 40),
-    51: (35, 41),
-    52: (36, 42),
-    53: (37, 38),
-    54: (37, 43),
-    55: (38, 44),
-    56: (39, 40),
-    57: (39, 45),
-    58: (40, 46),
-    59: (41, 47),
-    60: (42, 43),
-    61: (43, 48),
-    62: (44, 45),
-    63: (44, 49),
-    64: (45, 50),
-    65: (46, 47),
-    66: (46, 51),
-    67: (48, 49),
-    68: (49, 52),
-    69: (50, 51),
-    70: (50, 53),
-    71: (52, 53),
-}
+EXPECTED_EDGE_VERTICES = np.array(
+    [
+        [0, 1],  # 0
+        [0, 3],  # 1
+        [1, 4],  # 2
+        [2, 3],  # 3
+        [2, 7],  # 4
+        [3, 8],  # 5
+        [4, 5],  # 6
+        [4, 9],  # 7
+        [5, 10],  # 8
+        [6, 7],  # 9
+        [6, 12],  # 10
+        [7, 13],  # 11
+        [8, 9],  # 12
+        [8, 14],  # 13
+        [9, 15],  # 14
+        [10, 11],  # 15
+        [10, 16],  # 16
+        [11, 17],  # 17
+        [12, 18],  # 18
+        [13, 14],  # 19
+        [13, 19],  # 20
+        [14, 20],  # 21
+        [15, 16],  # 22
+        [15, 21],  # 23
+        [16, 22],  # 24
+        [17, 23],  # 25
+        [18, 19],  # 26
+        [18, 24],  # 27
+        [19, 25],  # 28
+        [20, 21],  # 29
+        [20, 26],  # 30
+        [21, 27],  # 31
+        [22, 23],  # 32
+        [22, 28],  # 33
+        [23, 29],  # 34
+        [24, 30],  # 35
+        [25, 26],  # 36
+        [25, 31],  # 37
+        [26, 32],  # 38
+        [27, 28],  # 39
+        [27, 33],  # 40
+        [28, 34],  # 41
+        [29, 35],  # 42
+        [30, 31],  # 43
+        [30, 36],  # 44
+        [31, 37],  # 45
+        [32, 33],  # 46
+        [32, 38],  # 47
+        [33, 39],  # 48
+        [34, 35],  # 49
+        [34, 40],  # 50
+        [35, 41],  # 51
+        [36, 42],  # 52
+        [37, 38],  # 53
+        [37, 43],  # 54
+        [38, 44],  # 55
+        [39, 40],  # 56
+        [39, 45],  # 57
+        [40, 46],  # 58
+        [41, 47],  # 59
+        [42, 43],  # 60
+        [43, 48],  # 61
+        [44, 45],  # 62
+        [44, 49],  # 63
+        [45, 50],  # 64
+        [46, 47],  # 65
+        [46, 51],  # 66
+        [48, 49],  # 67
+        [49, 52],  # 68
+        [50, 51],  # 69
+        [50, 53],  # 70
+        [52, 53],  # 71
+    ],
+    dtype=np.int16,
+)
 
 EXPECTED_EDGE_TILES: Dict[int, Tuple[int, ...]] = {
     0: (12,),
@@ -420,16 +387,32 @@ EXPECTED_EDGE_TILES: Dict[int, Tuple[int, ...]] = {
     71: (18,),
 }
 
+# Voisins de chaque sommet, dans l'ordre de ses arêtes (contrat d'ordre, pas un ensemble)
+EXPECTED_VERTEX_NEIGHBORS: Dict[int, Tuple[int, ...]] = {
+    vid: tuple(
+        int(b) if a == vid else int(a)
+        for a, b in (EXPECTED_EDGE_VERTICES[edge_id] for edge_id in edge_ids)
+    )
+    for vid, edge_ids in EXPECTED_VERTEX_EDGES.items()
+}
+
+# (tile_id, ressource, cube, voleur, pip) : le voleur démarre sur le désert
+EXPECTED_TILE_METADATA = [
+    (tile_id, resource, cube, tile_id == 0, PIP_NUMBERS.get(tile_id))
+    for tile_id, resource, cube in TILE_LAYOUT
+]
+
+# (port_id, type, edge_id, sommets), indexé par port_id
 EXPECTED_PORTS = [
-    {"port_id": 0, "type": "ANY", "edge_id": 1, "vertices": (0, 3)},
-    {"port_id": 1, "type": "BRICK", "edge_id": 10, "vertices": (6, 12)},
-    {"port_id": 2, "type": "ANY", "edge_id": 44, "vertices": (30, 36)},
-    {"port_id": 3, "type": "ORE", "edge_id": 67, "vertices": (48, 49)},
-    {"port_id": 4, "type": "ANY", "edge_id": 70, "vertices": (50, 53)},
-    {"port_id": 5, "type": "WOOL", "edge_id": 65, "vertices": (46, 47)},
-    {"port_id": 6, "type": "ANY", "edge_id": 42, "vertices": (29, 35)},
-    {"port_id": 7, "type": "GRAIN", "edge_id": 17, "vertices": (11, 17)},
-    {"port_id": 8, "type": "LUMBER", "edge_id": 6, "vertices": (4, 5)},
+    (0, "ANY", 1, (0, 3)),
+    (1, "BRICK", 10, (6, 12)),
+    (2, "ANY", 44, (30, 36)),
+    (3, "ORE", 67, (48, 49)),
+    (4, "ANY", 70, (50, 53)),
+    (5, "WOOL", 65, (46, 47)),
+    (6, "ANY", 42, (29, 35)),
+    (7, "GRAIN", 17, (11, 17)),
+    (8, "LUMBER", 6, (4, 5)),
 ]
 
 
@@ -442,10 +425,21 @@ def _import_board():
         pytest.xfail("Module catan.engine.board manquant (moteur non implémenté)")
 
 
-def test_standard_board_counts():
-    Board = _import_board()
+@pytest.fixture(scope="module")
+def board_cls():
+    """Classe Board importée une seule fois (xfail mis en cache si absente)."""
+    return _import_board()
+
+
+@pytest.fixture(scope="module")
+def standard_board(board_cls):
+    """Plateau standard partagé par les tests du module (aucun ne le modifie)."""
+    return board_cls.standard()
+
+
+def test_standard_board_counts(standard_board):
     # Contract minimal: Board.standard() and count helpers
-    b = Board.standard()
+    b = standard_board
     assert hasattr(b, "tile_count") and callable(b.tile_count)
     assert hasattr(b, "vertex_count") and callable(b.vertex_count)
     assert hasattr(b, "edge_count") and callable(b.edge_count)
@@ -455,69 +449,122 @@ def test_standard_board_counts():
     assert b.edge_count() == 72
 
 
-def _assert_cube(coord, expected):
-    assert (coord.x, coord.y, coord.z) == expected
-
-
-def test_standard_board_tile_metadata():
-    Board = _import_board()
-    board = Board.standard()
+def test_standard_board_tile_metadata(standard_board):
+    board = standard_board
     tiles = board.tiles
 
     assert isinstance(tiles, dict)
     assert set(tiles.keys()) == {spec[0] for spec in TILE_LAYOUT}
 
-    for tile_id, resource, cube in TILE_LAYOUT:
-        tile = tiles[tile_id]
-        assert tile.tile_id == tile_id
-        assert tile.resource == resource
-        _assert_cube(tile.cube, cube)
-        assert tuple(tile.vertices) == EXPECTED_TILE_VERTICES[tile_id]
-        assert tuple(tile.edges) == EXPECTED_TILE_EDGES[tile_id]
-        if tile_id == 0:
-            assert tile.has_robber is True
-            assert tile.pip is None
-        else:
-            assert tile.has_robber is False
-            assert tile.pip == PIP_NUMBERS[tile_id]
-
-
-def test_vertex_indexing_matches_reference():
-    Board = _import_board()
-    board = Board.standard()
+    # Une seule comparaison par table plutôt qu'une assertion par tuile
+    ordered = [tiles[tile_id] for tile_id in range(len(TILE_LAYOUT))]
+    assert [
+        (
+            tile.tile_id,
+            tile.resource,
+            (tile.cube.x, tile.cube.y, tile.cube.z),
+            tile.has_robber,
+            tile.pip,
+        )
+        for tile in ordered
+    ] == EXPECTED_TILE_METADATA
+    assert all(type(tile.has_robber) is bool for tile in ordered)
+    np.testing.assert_array_equal([tile.vertices for tile in ordered], EXPECTED_TILE_VERTICES)
+    np.testing.assert_array_equal([tile.edges for tile in ordered], EXPECTED_TILE_EDGES)
+
+
+def test_vertex_indexing_matches_reference(standard_board):
+    board = standard_board
     vertices = board.vertices
 
     assert isinstance(vertices, dict)
     assert len(vertices) == 54
-    for vid, vertex in vertices.items():
-        expected_coord = EXPECTED_VERTEX_COORDS[vid]
-        x, y = vertex.position
-        assert x == pytest.approx(expected_coord[0])
-        assert y == pytest.approx(expected_coord[1])
-        assert tuple(vertex.adjacent_tiles) == EXPECTED_VERTEX_TILES[vid]
-        assert tuple(vertex.edges) == EXPECTED_VERTEX_EDGES[vid]
-
-
-def test_edges_cover_expected_pairs():
-    Board = _import_board()
-    board = Board.standard()
+    positions = [vertices[vid].position for vid in range(len(EXPECTED_VERTEX_COORDS))]
+    # Mêmes tolérances que pytest.approx
+    np.testing.assert_allclose(positions, EXPECTED_VERTEX_COORDS, rtol=1e-6, atol=1e-12)
+    # Quelques valeurs de référence écrites en dur, indépendantes de la formule
+    assert positions[0] == pytest.approx((-4.330127, -0.5))
+    assert positions[27] == pytest.approx((0.0, 1.0))
+    assert positions[53] == pytest.approx((4.330127, 0.5))
+    assert {
+        vid: tuple(vertex.adjacent_tiles) for vid, vertex in vertices.items()
+    } == EXPECTED_VERTEX_TILES
+    assert {vid: tuple(vertex.edges) for vid, vertex in vertices.items()} == EXPECTED_VERTEX_EDGES
+
+
+def test_edges_cover_expected_pairs(standard_board):
+    board = standard_board
     edges = board.edges
 
     assert isinstance(edges, dict)
     assert len(edges) == 72
-    for edge_id, edge in edges.items():
-        assert tuple(edge.vertices) == EXPECTED_EDGE_VERTICES[edge_id]
-        assert tuple(edge.tiles) == EXPECTED_EDGE_TILES[edge_id]
-
-
-def test_port_mapping_clockwise():
-    Board = _import_board()
-    board = Board.standard()
-    ports = sorted(board.ports, key=lambda p: p.port_id)
-    assert len(ports) == 9
-
-    for expected, port in zip(EXPECTED_PORTS, ports):
-        assert port.port_id == expected["port_id"]
-        assert port.kind == expected["type"]
-        assert port.edge_id == expected["edge_id"]
-        assert tuple(port.vertices) == expected["vertices"]
+    np.testing.assert_array_equal(
+        [edges[edge_id].vertices for edge_id in range(len(EXPECTED_EDGE_VERTICES))],
+        EXPECTED_EDGE_VERTICES,
+    )
+    assert {edge_id: tuple(edge.tiles) for edge_id, edge in edges.items()} == EXPECTED_EDGE_TILES
+
+
+def test_port_mapping_clockwise(standard_board):
+    board = standard_board
+    # board.ports est déjà trié par port_id : ports[i] est le port i
+    assert [
+        (port.port_id, port.kind, port.edge_id, tuple(port.vertices))
+        for port in board.ports
+    ] == EXPECTED_PORTS
+
+
+def test_edge_endpoints_array_matches_edges(standard_board):
+    board = standard_board
+    endpoints = board.edge_endpoints
+
+    assert endpoints.shape == (72, 2)
+    assert endpoints.dtype.name == "int16"
+    np.testing.assert_array_equal(endpoints, EXPECTED_EDGE_VERTICES)
+
+
+def test_vertex_neighbors_follow_vertex_edge_order(standard_board):
+    board = standard_board
+
+    assert {
+        vid: board.vertex_neighbors(vid) for vid in board.vertices
+    } == EXPECTED_VERTEX_NEIGHBORS
+    assert board.vertex_neighbors(0) == (1, 3)
+
+
+def test_edge_neighbors_share_an_endpoint(standard_board):
+    board = standard_board
+
+    expected = {
+        edge_id: tuple(
+            other_id
+            for vertex_id in endpoints
+            for other_id in EXPECTED_VERTEX_EDGES[vertex_id]
+            if other_id != edge_id
+        )
+        for edge_id, endpoints in enumerate(EXPECTED_EDGE_VERTICES.tolist())
+    }
+    assert {edge_id: board.edge_neighbors(edge_id) for edge_id in board.edges} == expected
+    assert board.edge_neighbors(0) == (1, 2)
+
+
+def test_random_board_shares_standard_geometry(board_cls, standard_board):
+    standard = standard_board
+    randomized = board_cls.random(seed=5)
+
+    assert randomized.vertices == standard.vertices
+    assert randomized.edges == standard.edges
+    assert randomized.vertices is not standard.vertices
+    assert randomized.edge_endpoints is standard.edge_endpoints
+    for tile_id, tile in randomized.tiles.items():
+        assert tile.vertices == standard.tiles[tile_id].vertices
+        assert tile.edges == standard.tiles[tile_id].edges
+
+
+def test_port_kind_by_vertex_indexes_port_vertices(standard_board):
+    board = standard_board
+
+    assert len(board.port_kind_by_vertex) == 2 * len(board.ports)
+    for port in board.ports:
+        for vertex_id in port.vertices:
+            assert board.port_kind_by_vertex[vertex_id] == port.kind
@@ -123,6 +123,18 @@ def test_cannot_play_card_same_turn_it_was_bought():
     assert not state_after_purchase.is_action_legal(PlayKnight())
 
 
+def test_progress_cards_bought_this_turn_are_not_enumerated():
+    """legal_actions ne propose pas une carte progrès achetée ce tour-ci."""
+
+    state = mature_card_state("ROAD_BUILDING")
+    player = state.players[0]
+    player.settlements = [10]
+    player.roads = [8]
+    player.new_dev_cards["ROAD_BUILDING"] = 1
+
+    assert not any(isinstance(action, PlayProgress) for action in state.legal_actions())
+
+
 def test_play_knight_sets_robber_phase_and_consumes_card():
     """Playing a knight triggers the robber move phase and consumes the card."""
 
@@ -164,6 +176,46 @@ def test_play_road_building_places_two_free_roads():
     assert new_player.dev_cards["ROAD_BUILDING"] == 0
 
 
+def test_road_building_second_road_may_extend_the_first():
+    """La seconde route peut se raccorder au réseau via la première, pas l'inverse."""
+
+    state = mature_card_state("ROAD_BUILDING")
+    player = state.players[0]
+    player.settlements = [10]
+    player.roads = [8]
+
+    # L'arête 17 ne touche le réseau qu'au travers de l'arête 15 (sommet 11)
+    assert state.is_action_legal(PlayProgress(card="ROAD_BUILDING", edges=[15, 17]))
+    assert not state.is_action_legal(PlayProgress(card="ROAD_BUILDING", edges=[17, 15]))
+    assert not state.is_action_legal(PlayProgress(card="ROAD_BUILDING", edges=[15, 60]))
+
+
+def test_road_building_legal_actions_match_exhaustive_check():
+    """L'énumération filtrée produit exactement les paires croissantes valides."""
+
+    from itertools import combinations
+
+    state = mature_card_state("ROAD_BUILDING")
+    player = state.players[0]
+    player.settlements = [10]
+    player.roads = [8]
+    state.players[1].roads = [15]
+
+    listed = [
+        tuple(action.edges)
+        for action in state.legal_actions()
+        if isinstance(action, PlayProgress) and action.card == "ROAD_BUILDING"
+    ]
+    expected = [
+        pair
+        for pair in combinations(sorted(state.board.edges), 2)
+        if state.is_action_legal(PlayProgress(card="ROAD_BUILDING", edges=list(pair)))
+    ]
+
+    assert expected
+    assert listed == expected
+
+
 def test_play_year_of_plenty_grants_resources_from_bank():
     """Year of Plenty grants resources and removes them from the bank."""
 
@@ -7,11 +7,18 @@ Spécifications (docs/specs.md):
 - Le voleur bloque la production de la tuile où il se trouve
 """
 
+import numpy as np
 import pytest
 from dataclasses import replace
 
 from catan.engine.board import Board
-from catan.engine.state import GameState, SetupPhase, TurnSubPhase
+from catan.engine.state import (
+    GameState,
+    SetupPhase,
+    TurnSubPhase,
+    rng_from_state,
+    rng_state_of,
+)
 from catan.engine.actions import (
     RollDice,
     PlaceSettlement,
@@ -20,6 +27,10 @@ from catan.engine.actions import (
     MoveRobber,
 )
 
+# Paire de dés utilisée pour forcer chaque total : même répartition équilibrée
+# que TurnController.handle_roll_dice (7 -> (3, 4), 12 -> (6, 6))
+ROLL_DECOMP = {total: (total // 2, total - total // 2) for total in range(2, 13)}
+
 
 class TestDiceRoll:
     """Tests pour le lancer de dés."""
@@ -48,6 +59,56 @@ class TestDiceRoll:
         new_state = state.apply_action(action)
         assert new_state.last_dice_roll == 7
 
+    def test_roll_dice_matches_generator_rebuilt_from_state(self):
+        """Le lancer suit le générateur reconstruit depuis rng_state, sans fuite entre états."""
+        state = self._setup_complete_game()
+        state = replace(state, rng_state=rng_state_of(np.random.Generator(np.random.PCG64(11))))
+        other = replace(state, rng_state=rng_state_of(np.random.Generator(np.random.PCG64(12))))
+
+        rng = rng_from_state(state.rng_state)
+        expected_total = int(rng.integers(1, 7)) + int(rng.integers(1, 7))
+
+        # Un lancer sur un autre état entre-temps ne doit pas influencer le résultat
+        other.apply_action(RollDice())
+        rolled = state.apply_action(RollDice())
+
+        assert rolled.last_dice_roll == expected_total
+        assert rolled.rng_state == rng_state_of(rng)
+
+    def test_roll_dice_is_deterministic_across_threads(self):
+        """Des lancers concurrents (exécuteur "thread") restent fidèles à rng_state."""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        base = self._setup_complete_game()
+        states = [
+            replace(base, rng_state=rng_state_of(np.random.Generator(np.random.PCG64(seed))))
+            for seed in range(8)
+        ]
+        expected = [
+            (rolled.last_dice_roll, rolled.rng_state)
+            for rolled in (state.apply_action(RollDice()) for state in states)
+        ]
+
+        def roll_repeatedly(index: int) -> set:
+            state = states[index]
+            results = set()
+            for _ in range(1500):
+                rolled = state.apply_action(RollDice())
+                results.add((rolled.last_dice_roll, rolled.rng_state))
+            return results
+
+        # Bascules de thread fréquentes pour exposer un générateur partagé
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=len(states)) as executor:
+                outcomes = list(executor.map(roll_repeatedly, range(len(states))))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert outcomes == [{result} for result in expected]
+
     def test_roll_dice_only_legal_at_start_of_turn(self):
         """Le lancer de dés n'est légal qu'au début du tour (phase PLAY)."""
         state = GameState.new_1v1_game()
@@ -143,7 +204,8 @@ class TestResourceDistribution:
 
         # État: voleur positionné sur la tuile cible, phase principale
         state.robber_tile_id = robber_tile_id  # type: ignore[attr-defined]
-        state = replace(state, dice_rolled_this_turn=False, last_dice_roll=None)
+        state.dice_rolled_this_turn = False  # type: ignore[attr-defined]
+        state.last_dice_roll = None  # type: ignore[attr-defined]
         state.turn_subphase = TurnSubPhase.MAIN  # type: ignore[attr-defined]
 
         # Suivre les ressources avant le lancer
@@ -153,9 +215,7 @@ class TestResourceDistribution:
         # Lancer les dés avec le numéro de la tuile bloquée
         total = target_tile.pip
         assert total is not None
-        die1 = min(total - 1, 6)
-        die2 = total - die1
-        new_state = state.apply_action(RollDice(forced_value=(die1, die2)))
+        new_state = state.apply_action(RollDice(forced_value=ROLL_DECOMP[total]))
 
         # Aucune ressource ne doit être distribuée pour cette tuile
         assert new_state.players[0].resources[target_tile.resource] == initial_resource
@@ -180,13 +240,23 @@ class TestResourceDistribution:
 
         # Tester tous les lancers possibles
         for total in range(2, 13):
-            die1 = min(total - 1, 6)
-            die2 = total - die1
-            action = RollDice(forced_value=(die1, die2))
+            action = RollDice(forced_value=ROLL_DECOMP[total])
             new_state = state.apply_action(action)
             # Aucune ressource ne devrait être ajoutée
             # (le désert n'a pas de ressource)
 
+    def test_tiles_for_pip_matches_board_numbers(self):
+        """L'index par numéro couvre exactement les tuiles productrices du plateau."""
+        board = Board.random(seed=11)
+        for total in range(2, 13):
+            expected = tuple(
+                tile_id
+                for tile_id, tile in board.tiles.items()
+                if tile.pip == total and tile.resource != "DESERT"
+            )
+            assert board.tiles_for_pip(total) == expected
+        assert board.tiles_for_pip(7) == ()
+
     def _setup_game_with_settlements(self) -> GameState:
         """Crée un jeu après setup avec colonies en place."""
         state = GameState.new_1v1_game()
@@ -112,6 +112,30 @@ def test_roll_dice_action(gui_app):
     assert ui_state.buttons["end_turn"].enabled
 
 
+def test_ui_state_reuses_caches_while_state_unchanged(gui_app, monkeypatch):
+    """Deux get_ui_state() sur le même état ne ré-énumèrent pas les actions."""
+
+    app = gui_app
+    _complete_setup(app)
+    assert app.trigger_action("roll_dice", forced_value=8)
+    first = app.get_ui_state()
+
+    from catan.engine.state import GameState
+
+    calls = []
+    original = GameState.legal_actions
+
+    def _counting(self):
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(GameState, "legal_actions", _counting)
+    second = app.get_ui_state()
+
+    assert calls == []
+    assert second.buttons == first.buttons
+
+
 def test_build_road_flow(gui_app):
     """Séquence sélection build road + clic arête construit une route."""
 
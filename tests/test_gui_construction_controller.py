@@ -75,9 +75,9 @@ def game_in_play(pygame_init):
     # Now should be in PLAY phase
     assert state.phase == SetupPhase.PLAY
 
-    # Roll dice to start the game
+    # Roll dice to start the game (valeur forcée : pas de 7, donc pas de voleur)
     from catan.engine.actions import RollDice
-    state = state.apply_action(RollDice())
+    state = state.apply_action(RollDice(forced_value=(3, 5)))
 
     # Give players plenty of resources for testing (after rolling dice)
     state.players[0].resources = {
@@ -445,3 +445,24 @@ def test_refresh_state_clears_cache(game_in_play):
 
     # Should be empty now (no resources)
     assert len(legal_roads_2) == 0
+
+
+def test_legal_positions_are_cached_until_refresh(game_in_play):
+    """Les positions légales sont extraites une fois par état, en copies modifiables."""
+    controller, service, state = game_in_play
+
+    roads = controller.get_legal_road_positions()
+    assert roads
+    roads.clear()
+    assert controller.get_legal_road_positions()
+    assert controller.can_buy_development()
+
+    cached = controller._legal_positions_cache
+    controller.get_legal_city_positions()
+    assert controller._legal_positions_cache is cached
+
+    state.players[0].resources = {"BRICK": 0, "LUMBER": 0, "WOOL": 0, "GRAIN": 0, "ORE": 0}
+    controller.refresh_state()
+    assert controller._legal_positions_cache is None
+    assert not controller.get_legal_settlement_positions()
+    assert not controller.can_buy_development()
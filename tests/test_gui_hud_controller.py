@@ -189,3 +189,21 @@ class TestHUDController:
         assert panel_after.resources["BRICK"] == 1
         assert panel_after.resources["GRAIN"] == 0
 
+    def test_panels_reused_until_refresh(self, pygame_screen):
+        """Les panneaux sont réutilisés entre appels et reconstruits après refresh_state."""
+
+        from catan.gui.hud_controller import HUDController
+
+        state = _play_ready_state()
+        service = _service_with_state(state)
+        controller = HUDController(service, pygame_screen)
+
+        panels_first = controller.get_player_panels()
+        panels_second = controller.get_player_panels()
+        assert all(a is b for a, b in zip(panels_first, panels_second))
+
+        state.players[0].resources["ORE"] = 3
+        controller.refresh_state()
+        panels_after = controller.get_player_panels()
+        panel_after = next(panel for panel in panels_after if panel.player_id == 0)
+        assert panel_after.resources["ORE"] == 3
@@ -12,7 +12,7 @@ import os
 
 from catan.engine.board import Board
 from catan.app.game_service import GameService
-from catan.gui.renderer import BoardRenderer, SCREEN_WIDTH, SCREEN_HEIGHT
+from catan.gui.renderer import BoardRenderer, ROAD_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT
 from catan.gui.setup_controller import SetupController
 
 
@@ -107,6 +107,18 @@ class TestClickDetection:
         # Just ensure it doesn't crash
         assert result is None or isinstance(result, int)
 
+    def test_vertex_lookup_matches_distance_scan(self, setup_components):
+        """La table pixel -> sommet doit donner le même résultat que le parcours."""
+        renderer = setup_components["renderer"]
+
+        for x, y in renderer._vertex_screen_coords.values():
+            for dx in range(-17, 18, 3):
+                for dy in range(-17, 18, 3):
+                    pos = (x + dx, y + dy)
+                    # Coordonnées flottantes : chemin par la grille de hachage
+                    scanned = renderer.get_vertex_at_position((float(pos[0]), float(pos[1])))
+                    assert renderer.get_vertex_at_position(pos) == scanned
+
     def test_get_edge_at_position(self, setup_components):
         """Should detect edge at screen position."""
         renderer = setup_components["renderer"]
@@ -133,6 +145,63 @@ class TestClickDetection:
         found_edge = renderer.get_edge_at_position(mid_pos)
         assert found_edge == edge_id
 
+    def test_get_edge_at_position_prefers_closest_edge(self, setup_components):
+        """Près d'un sommet, le clic sélectionne l'arête la plus proche."""
+        renderer = setup_components["renderer"]
+
+        for edge_id in sorted(renderer.board.edges, reverse=True):
+            (ax, ay), (bx, by) = renderer._edge_screen_coords[edge_id]
+            # Point sur l'arête, à 8 px de son premier sommet
+            length = ((bx - ax) ** 2 + (by - ay) ** 2) ** 0.5
+            pos = (ax + (bx - ax) * 8 / length, ay + (by - ay) * 8 / length)
+            assert renderer.get_edge_at_position(pos) == edge_id
+
+    def test_edge_screen_coords_precomputed(self, setup_components):
+        """Chaque arête a ses extrémités écran précalculées."""
+        renderer = setup_components["renderer"]
+
+        assert set(renderer._edge_screen_coords) == set(renderer.board.edges)
+        for edge_id, edge in renderer.board.edges.items():
+            v1_id, v2_id = edge.vertices
+            assert renderer._edge_screen_coords[edge_id] == (
+                renderer._vertex_screen_coords[v1_id],
+                renderer._vertex_screen_coords[v2_id],
+            )
+
+    def test_highlight_sprites_are_reused(self, setup_components):
+        """Les sprites de surbrillance sont construits une fois puis réutilisés."""
+        renderer = setup_components["renderer"]
+        tile_ids = set(list(renderer.board.tiles)[:2])
+
+        renderer.render_highlighted_vertices({0, 1})
+        renderer.render_highlighted_tiles(tile_ids)
+        vertex_sprite = renderer._vertex_highlight_sprite
+        tile_sprites = dict(renderer._tile_highlight_sprites)
+
+        renderer.render_highlighted_vertices({2})
+        renderer.render_highlighted_tiles(tile_ids)
+
+        assert vertex_sprite is not None
+        assert renderer._vertex_highlight_sprite is vertex_sprite
+        assert set(tile_sprites) == tile_ids
+        assert all(renderer._tile_highlight_sprites[t] is tile_sprites[t] for t in tile_ids)
+
+    def test_edge_highlight_matches_direct_line(self, setup_components):
+        """Le sprite d'arête reproduit exactement le trait dessiné directement."""
+        renderer = setup_components["renderer"]
+        screen = renderer.screen
+        edge_ids = set(renderer._edge_screen_coords)
+
+        screen.fill((30, 60, 90))
+        for v1_pos, v2_pos in renderer._edge_screen_coords.values():
+            pygame.draw.line(screen, (100, 255, 100), v1_pos, v2_pos, width=ROAD_WIDTH + 4)
+        expected = pygame.image.tobytes(screen, "RGB")
+
+        screen.fill((30, 60, 90))
+        renderer.render_highlighted_edges(edge_ids)
+        assert set(renderer._edge_highlight_sprites) == edge_ids
+        assert pygame.image.tobytes(screen, "RGB") == expected
+
 
 class TestCompleteSetupFlow:
     """Test complete setup flow with simulated clicks."""
@@ -85,6 +85,77 @@ def test_render_pieces_no_crash(headless_pygame, test_board, test_game_state):
     renderer.render_pieces(test_game_state)
 
 
+def test_render_pieces_reuses_layer_until_pieces_change(
+    headless_pygame, test_board, test_game_state
+):
+    """La couche des pièces n'est reconstruite qu'après une construction."""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = BoardRenderer(screen, test_board)
+
+    renderer.render_pieces(test_game_state)
+    layer = renderer._pieces_surface
+    renderer.render_pieces(test_game_state)
+    assert renderer._pieces_surface is layer
+
+    test_game_state.players[0].roads.append(0)
+    renderer.render_pieces(test_game_state)
+    assert renderer._pieces_surface is not layer
+
+
+def test_board_content_key_tracks_pieces_only(headless_pygame, test_board, test_game_state):
+    """La signature du plateau ne change qu'avec ce qui y est dessiné."""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = BoardRenderer(screen, test_board)
+
+    key = renderer.board_content_key(test_game_state)
+    test_game_state.players[0].resources["BRICK"] += 1
+    assert renderer.board_content_key(test_game_state) == key
+
+    test_game_state.players[0].roads.append(0)
+    assert renderer.board_content_key(test_game_state) != key
+
+
+def test_board_layer_rebuilt_when_only_ports_change(headless_pygame, test_board):
+    """Un plateau aux mêmes tuiles mais aux ports différents redessine la couche statique."""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = BoardRenderer(screen, test_board)
+    state = GameState.new_1v1_game(seed=42)
+
+    renderer.render_board()
+    layer = renderer._board_surface
+    key = renderer.board_content_key(state)
+
+    kinds = [port.kind for port in test_board.ports]
+    swapped_ports = Board._ports_for_kinds(kinds[1:] + kinds[:1])
+    assert [port.kind for port in swapped_ports] != kinds
+    swapped = Board(
+        tiles=test_board.tiles,
+        vertices=test_board.vertices,
+        edges=test_board.edges,
+        ports=swapped_ports,
+    )
+
+    renderer.update_board(swapped)
+    assert renderer.board_content_key(state) != key
+    renderer.render_board()
+    assert renderer._board_surface is not layer
+
+
+def test_board_rect_covers_board_drawings(headless_pygame, test_board):
+    """Le rectangle du plateau englobe tout ce que le renderer y dessine."""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = BoardRenderer(screen, test_board)
+    screen.fill((0, 0, 0))
+    renderer.render_board()
+    renderer.render_highlighted_vertices(set(renderer._vertex_screen_coords))
+    renderer.render_highlighted_edges(set(renderer._edge_screen_coords))
+
+    # Effacer le rectangle du plateau doit effacer tout le dessin
+    screen.fill((0, 0, 0), renderer.board_rect)
+    black = pygame.mask.from_threshold(screen, (0, 0, 0), (1, 1, 1, 255))
+    assert black.count() == SCREEN_WIDTH * SCREEN_HEIGHT
+
+
 def test_render_full_frame_no_crash(headless_pygame, test_board, test_game_state):
     """Vérifie qu'un frame complet peut être rendu."""
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -116,6 +187,18 @@ def test_hex_vertices_computed(headless_pygame, test_board):
         assert len(renderer._hex_coords[tile_id]) == 6
 
 
+def test_screen_geometry_shared_between_boards(headless_pygame, test_board):
+    """Deux plateaux de même géométrie partagent les coordonnées écran précalculées."""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    first = BoardRenderer(screen, test_board)
+    second = BoardRenderer(screen, Board.random(seed=7))
+
+    assert second._vertex_screen_coords is first._vertex_screen_coords
+    assert second._vertex_lookup is first._vertex_lookup
+    center = first._hex_centers[3]
+    assert second.get_tile_at_position(center) == first.get_tile_at_position(center) == 3
+
+
 def test_board_renderer_has_right_offset(headless_pygame, test_board):
     """Le plateau doit laisser une marge suffisante à gauche pour le HUD."""
 
@@ -115,6 +115,23 @@ class TestTurnController:
         assert controller.state.last_dice_roll == result
         assert controller.state.dice_rolled_this_turn
 
+    def test_forced_total_rolls_a_valid_dice_pair(self, game_service, screen, monkeypatch):
+        """Un total forcé est converti en paire de dés valide (12 -> (6, 6))."""
+        from catan.gui.turn_controller import TurnController
+
+        dispatched = []
+        original_dispatch = game_service.dispatch
+
+        def record(action):
+            dispatched.append(action)
+            return original_dispatch(action)
+
+        monkeypatch.setattr(game_service, "dispatch", record)
+        controller = TurnController(game_service, screen)
+
+        assert controller.handle_roll_dice(forced_value=12) == 12
+        assert dispatched == [RollDice(forced_value=(6, 6))]
+
     def test_roll_seven_triggers_discard_phase(self, game_service, screen):
         """Test that rolling 7 triggers discard phase if player has >9 cards."""
         from catan.gui.turn_controller import TurnController
@@ -0,0 +1,225 @@
+"""Tests des utilitaires de la boucle play_gui (panneaux modaux, régions).
+
+La boucle pygame elle-même n'est pas exécutée : on vérifie les tables de
+clics des panneaux modaux, la fusion des zones à rafraîchir et les clés
+qui déclenchent la reconstruction du HUD et des layouts.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+
+import pytest
+
+# Forcer le mode headless pour pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from catan.app.game_service import GameService
+from catan.engine.state import RESOURCE_TYPES
+from catan.gui.app import BankTradePrompt, DiscardPrompt, YearOfPlentyPrompt
+
+import play_gui
+
+
+class _RecordingApp:
+    """Double de CatanH2HApp : enregistre chaque commande appelée."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name, *args))
+            return True
+
+        return record
+
+
+def _click(app: _RecordingApp, buttons, rect: pygame.Rect):
+    """Clique au centre d'un bouton et retourne l'appel enregistré."""
+
+    command = play_gui.modal_command_at(buttons, rect.center)
+    assert command is not None
+    assert command() is True
+    return app.calls.pop()
+
+
+def _discard_prompt(resource_order=RESOURCE_TYPES) -> DiscardPrompt:
+    return DiscardPrompt(
+        player_id=0,
+        player_name="Bleu",
+        required=4,
+        remaining=4,
+        selection={resource: 0 for resource in resource_order},
+        hand={resource: 2 for resource in resource_order},
+        can_confirm=False,
+        resource_order=tuple(resource_order),
+    )
+
+
+def _bank_trade_prompt() -> BankTradePrompt:
+    return BankTradePrompt(
+        player_name="Bleu",
+        give_selection={resource: 0 for resource in RESOURCE_TYPES},
+        receive_selection=None,
+        hand={resource: 4 for resource in RESOURCE_TYPES},
+        rates={resource: 4 for resource in RESOURCE_TYPES},
+        can_confirm=False,
+        resource_order=RESOURCE_TYPES,
+    )
+
+
+def _year_of_plenty_prompt() -> YearOfPlentyPrompt:
+    return YearOfPlentyPrompt(
+        player_name="Bleu",
+        selection={resource: 0 for resource in RESOURCE_TYPES},
+        required=2,
+        remaining=2,
+        can_confirm=False,
+        resource_order=RESOURCE_TYPES,
+    )
+
+
+def test_merge_overlapping_merges_chained_rects():
+    """Les rectangles qui se chevauchent, même en chaîne, deviennent leur union."""
+
+    first = pygame.Rect(0, 0, 10, 10)
+    second = pygame.Rect(25, 0, 10, 10)
+    bridge = pygame.Rect(5, 0, 25, 5)
+
+    merged = play_gui.merge_overlapping([first, second, bridge])
+
+    assert merged == [pygame.Rect(0, 0, 35, 10)]
+    # Les rectangles d'origine ne sont pas modifiés
+    assert first == pygame.Rect(0, 0, 10, 10)
+    assert second == pygame.Rect(25, 0, 10, 10)
+
+
+def test_merge_overlapping_keeps_disjoint_rects():
+    """Des rectangles disjoints (même adjacents) restent séparés."""
+
+    rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(10, 0, 10, 10), pygame.Rect(50, 50, 5, 5)]
+
+    assert play_gui.merge_overlapping(rects) == rects
+
+
+def test_discard_panel_buttons_map_to_commands():
+    """Chaque bouton du panneau de défausse appelle la bonne commande."""
+
+    app = _RecordingApp()
+    layout = play_gui.build_discard_layout(_discard_prompt())
+    buttons = play_gui.build_modal_buttons(app, layout, None, None)
+
+    for row in layout["rows"]:
+        resource = row["resource"]
+        assert _click(app, buttons, row["minus_rect"]) == (
+            "adjust_discard_selection",
+            resource,
+            -1,
+        )
+        assert _click(app, buttons, row["plus_rect"]) == ("adjust_discard_selection", resource, 1)
+    assert _click(app, buttons, layout["confirm_rect"]) == ("confirm_discard_selection",)
+    assert _click(app, buttons, layout["reset_rect"]) == ("reset_discard_selection",)
+    assert play_gui.modal_command_at(buttons, (0, 0)) is None
+
+
+def test_bank_trade_panel_buttons_map_to_commands():
+    """Chaque bouton du panneau d'échange banque appelle la bonne commande."""
+
+    app = _RecordingApp()
+    layout = play_gui.build_bank_trade_layout(_bank_trade_prompt())
+    buttons = play_gui.build_modal_buttons(app, None, layout, None)
+
+    for row in layout["give_rows"]:
+        resource = row["resource"]
+        assert _click(app, buttons, row["minus_rect"]) == ("adjust_bank_trade_give", resource, -1)
+        assert _click(app, buttons, row["plus_rect"]) == ("adjust_bank_trade_give", resource, 1)
+    for button_info in layout["receive_buttons"]:
+        assert _click(app, buttons, button_info["rect"]) == (
+            "select_bank_trade_receive",
+            button_info["resource"],
+        )
+    assert _click(app, buttons, layout["confirm_rect"]) == ("confirm_bank_trade_selection",)
+    assert _click(app, buttons, layout["cancel_rect"]) == ("trigger_action", "cancel")
+
+
+def test_year_of_plenty_panel_buttons_map_to_commands():
+    """Chaque bouton du panneau Invention appelle la bonne commande."""
+
+    app = _RecordingApp()
+    layout = play_gui.build_year_of_plenty_layout(_year_of_plenty_prompt())
+    buttons = play_gui.build_modal_buttons(app, None, None, layout)
+
+    for row in layout["rows"]:
+        resource = row["resource"]
+        assert _click(app, buttons, row["minus_rect"]) == (
+            "adjust_year_of_plenty_selection",
+            resource,
+            -1,
+        )
+        assert _click(app, buttons, row["plus_rect"]) == (
+            "adjust_year_of_plenty_selection",
+            resource,
+            1,
+        )
+    assert _click(app, buttons, layout["confirm_rect"]) == ("confirm_year_of_plenty_selection",)
+    assert _click(app, buttons, layout["reset_rect"]) == ("reset_year_of_plenty_selection",)
+
+
+@pytest.fixture
+def ui_state():
+    """État d'UI réel d'une partie qui démarre (mode setup)."""
+
+    from catan.gui.app import CatanH2HApp
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    try:
+        app = CatanH2HApp(game_service=GameService(), screen=screen)
+        app.start_new_game(player_names=["Bleu", "Orange"], seed=42)
+        yield app.get_ui_state()
+    finally:
+        pygame.quit()
+
+
+def test_modal_layouts_follow_ui_state(ui_state):
+    """Les layouts modaux sont reconstruits selon le mode et le prompt de ui_state."""
+
+    assert play_gui.build_modal_layouts(ui_state) == (None, None, None)
+
+    discard_state = replace(ui_state, mode="discard", discard_prompt=_discard_prompt())
+    discard, bank_trade, year_of_plenty = play_gui.build_modal_layouts(discard_state)
+    assert discard is not None and bank_trade is None and year_of_plenty is None
+    assert [row["resource"] for row in discard["rows"]] == list(RESOURCE_TYPES)
+
+    # Une main différente (autres ressources) donne un autre panneau
+    shorter_state = replace(
+        discard_state, discard_prompt=_discard_prompt(resource_order=("BRICK", "ORE"))
+    )
+    shorter = play_gui.build_modal_layouts(shorter_state)[0]
+    assert [row["resource"] for row in shorter["rows"]] == ["BRICK", "ORE"]
+
+    # Un prompt sans le mode correspondant n'affiche pas de panneau
+    stale_state = replace(ui_state, bank_trade_prompt=_bank_trade_prompt())
+    assert play_gui.build_modal_layouts(stale_state) == (None, None, None)
+
+    trade_state = replace(stale_state, mode="bank_trade")
+    assert play_gui.build_modal_layouts(trade_state)[1] is not None
+
+
+def test_hud_content_key_tracks_hud_fields_only(ui_state):
+    """Le HUD n'est reconstruit que si un champ qu'il affiche change."""
+
+    key = play_gui.hud_content_key(ui_state)
+
+    assert play_gui.hud_content_key(replace(ui_state, instructions="Autre")) != key
+    assert play_gui.hud_content_key(replace(ui_state, last_dice_roll=8)) != key
+    assert (
+        play_gui.hud_content_key(replace(ui_state, dice_rolled_this_turn=True)) != key
+    )
+    # Sélection d'un panneau modal : le HUD reste identique
+    selecting = replace(ui_state, mode="discard", discard_prompt=_discard_prompt())
+    assert play_gui.hud_content_key(selecting) == key
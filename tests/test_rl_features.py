@@ -230,3 +230,16 @@ class TestObservationBuilder:
             assert obs_current.metadata[7] == pytest.approx(vp0 / 15.0)
             assert obs_other.metadata[6] == pytest.approx(vp0 / 15.0)
             assert obs_other.metadata[7] == pytest.approx(vp1 / 15.0)
+
+    def test_board_tensor_shared_per_board_and_read_only(self):
+        """Le tenseur plateau est calculé une fois par Board et protégé en écriture."""
+        state = _complete_setup(GameState.new_1v1_game(seed=789))
+        encoder = ActionEncoder(board=state.board)
+
+        first = build_observation(state, action_encoder=encoder)
+        second = build_observation(state, action_encoder=encoder)
+
+        assert second.board is first.board
+        assert not first.board.flags.writeable
+        # Les autres composantes restent propres à chaque observation
+        assert second.hands is not first.hands
@@ -65,6 +65,27 @@ class TestRandomLegalPolicy:
 class TestHeuristicPolicy:
     """Couverture des choix stratégiques de la politique heuristique."""
 
+    def test_setup_settlement_maximises_adjacent_pips(self):
+        state = GameState.new_1v1_game(seed=31, random_board=True)
+        board = state.board
+        policy = HeuristicPolicy()
+
+        chosen = policy.select_action(state)
+
+        def pip_sum(vertex_id: int) -> float:
+            return sum(
+                (board.tiles[tile_id].pip or 0.0)
+                for tile_id in board.vertices[vertex_id].adjacent_tiles
+            )
+
+        assert isinstance(chosen, PlaceSettlement)
+        best = max(
+            pip_sum(action.vertex_id)
+            for action in state.legal_actions()
+            if isinstance(action, PlaceSettlement)
+        )
+        assert pip_sum(chosen.vertex_id) == best
+
     def test_rolls_dice_at_start_of_turn(self):
         state = _complete_setup(GameState.new_1v1_game(seed=2025))
         policy = HeuristicPolicy()
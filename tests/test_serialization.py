@@ -73,7 +73,7 @@ class TestStateSerialization:
         ]
         assert snapshot["schema_version"] == "0.1.0"
         assert snapshot["variant"] == {"vp_to_win": 15, "discard_threshold": 9}
-        assert snapshot["rng_state"]["type"] == "py_random"
+        assert snapshot["rng_state"]["type"] == "pcg64"
 
     def test_rng_sequence_is_preserved_after_restore(self):
         """Après désérialisation, le RNG produit les mêmes lancers."""
@@ -97,3 +97,14 @@ class TestStateSerialization:
             snapshot_after_roll["rng_state"]["state"]
             == restored_snapshot_after_roll["rng_state"]["state"]
         )
+
+    def test_legacy_py_random_snapshot_is_reseeded(self):
+        """Un ancien snapshot `py_random` reste chargeable et déterministe."""
+        state = _complete_setup(GameState.new_1v1_game(seed=7))
+        snapshot = state_to_snapshot(state)
+        snapshot["rng_state"] = {"type": "py_random", "state": [3, [1, 2, 3, 624], None]}
+
+        first = snapshot_to_state(snapshot).apply_action(RollDice())
+        second = snapshot_to_state(snapshot).apply_action(RollDice())
+        assert first.last_dice_roll == second.last_dice_roll
+        assert 2 <= first.last_dice_roll <= 12
@@ -161,6 +161,39 @@ class TestSetupInvariants:
         # Similar test
         pass
 
+    def test_apply_action_leaves_previous_state_untouched(self):
+        """Les joueurs du nouvel état sont des copies indépendantes."""
+        state = GameState.new_1v1_game()
+        new_state = state.apply_action(PlaceSettlement(vertex_id=10, free=True))
+
+        assert new_state.players[0].settlements == [10]
+        assert state.players[0].settlements == []
+        assert new_state.players[0] is not state.players[0]
+
+        clone = new_state.players[0].clone()
+        assert clone == new_state.players[0]
+        clone.resources["BRICK"] += 1
+        clone.dev_cards["KNIGHT"] += 1
+        clone.roads.append(3)
+        assert new_state.players[0].resources["BRICK"] == 0
+        assert new_state.players[0].dev_cards["KNIGHT"] == 0
+        assert new_state.players[0].roads == []
+
+    def test_player_clone_copies_every_field(self):
+        """Chaque champ est repris, et aucun conteneur n'est partagé avec l'original."""
+        from dataclasses import fields
+
+        player = Player(player_id=1, name="Bob", victory_points=3, hidden_victory_points=1)
+        player.settlements.append(10)
+        player.resources["ORE"] = 2
+        clone = player.clone()
+
+        assert clone == player
+        for player_field in fields(Player):
+            value = getattr(player, player_field.name)
+            if isinstance(value, (list, dict, set)):
+                assert getattr(clone, player_field.name) is not value, player_field.name
+
     def test_settlements_respect_distance_rule_between_players(self):
         """Les colonies de joueurs différents doivent respecter la distance."""
         # Placeholder
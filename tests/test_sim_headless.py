@@ -108,6 +108,32 @@ def test_action_catalog_extends_when_new_actions_seen(headless_env):
     assert len(headless_env.action_catalog) >= initial_catalog_size
 
 
+def test_action_catalog_order_independent_of_mask_requests():
+    """Le catalogue (ordre et index) ne dépend pas du moment où le masque est demandé."""
+    import random
+
+    from catan.sim.runner import HeadlessEnv
+
+    env_eager = HeadlessEnv(seed=31)
+    env_lazy = HeadlessEnv(seed=31)
+    env_eager.reset()
+    env_lazy.reset()
+
+    rng = random.Random(31)
+    for _ in range(120):
+        legal = env_eager.legal_actions()
+        if not legal:
+            break
+        env_eager.legal_actions_mask()
+        action = legal[rng.randrange(len(legal))]
+        env_eager.step(action)
+        if env_lazy.step(action).done:
+            break
+
+    assert env_lazy.action_catalog == env_eager.action_catalog
+    assert env_lazy.legal_actions_mask() == env_eager.legal_actions_mask()
+
+
 def _play_first_legal_actions(env, count: int) -> None:
     """Applique `count` actions en choisissant toujours la première action légale."""
 
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from catan.engine.actions import MoveRobber, PlaceRoad, PlayKnight
+from catan.engine.actions import MoveRobber, PlaceRoad, PlaceSettlement, PlayKnight
 from catan.engine.state import (
     DEV_CARD_TYPES,
     GameState,
@@ -156,6 +156,19 @@ def test_longest_road_tie_keeps_current_owner():
     assert state.players[1].victory_points == 3
 
 
+def test_own_settlement_on_road_keeps_longest_road():
+    state = _setup_longest_road_for_player1()
+    state.current_player_id = 1
+    state.players[1].resources.update(BRICK=1, LUMBER=1, WOOL=1, GRAIN=1)
+
+    # Colonie au milieu de son propre réseau : la route n'est pas coupée
+    state = state.apply_action(PlaceSettlement(vertex_id=43))
+
+    assert state.longest_road_owner == 1
+    assert state.longest_road_length == 7
+    assert state.players[1].victory_points == 4
+
+
 def test_largest_army_awarded_at_three_knights():
     state = make_play_state()
     player = state.players[0]